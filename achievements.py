@@ -9,46 +9,39 @@ ACHIEVEMENTS = {
     'comeback': {'name': 'comeback', 'description': 'recover from balance below $100', 'unlocked': False}
 }
 
+def _unlock(key, unlocked):
+    if not ACHIEVEMENTS[key]['unlocked']:
+        ACHIEVEMENTS[key]['unlocked'] = True
+        unlocked.append(key)
+
 def check_achievements(player, stats, _last_bet_won=None):
     """Unlock achievements that match the player's current session stats."""
     unlocked = []
+    history = player.get_bet_history()
     
-    if stats['wins'] >= 1 and not ACHIEVEMENTS['first_win']['unlocked']:
-        ACHIEVEMENTS['first_win']['unlocked'] = True
-        unlocked.append('first_win')
+    if stats['wins'] >= 1:
+        _unlock('first_win', unlocked)
     
-    if stats['wins'] >= 10 and not ACHIEVEMENTS['ten_wins']['unlocked']:
-        ACHIEVEMENTS['ten_wins']['unlocked'] = True
-        unlocked.append('ten_wins')
+    if stats['wins'] >= 10:
+        _unlock('ten_wins', unlocked)
     
-    if stats['total_bets'] >= 50 and not ACHIEVEMENTS['fifty_bets']['unlocked']:
-        ACHIEVEMENTS['fifty_bets']['unlocked'] = True
-        unlocked.append('fifty_bets')
+    if stats['total_bets'] >= 50:
+        _unlock('fifty_bets', unlocked)
     
-    if stats['profit'] >= 5000 and not ACHIEVEMENTS['big_winner']['unlocked']:
-        ACHIEVEMENTS['big_winner']['unlocked'] = True
-        unlocked.append('big_winner')
+    if stats['profit'] >= 5000:
+        _unlock('big_winner', unlocked)
     
-    if player.get_balance() < 100 and stats['profit'] > 0 and not ACHIEVEMENTS['comeback']['unlocked']:
-        ACHIEVEMENTS['comeback']['unlocked'] = True
-        unlocked.append('comeback')
+    if player.get_balance() < 100 and stats['profit'] > 0:
+        _unlock('comeback', unlocked)
     
-    if stats['total_bets'] >= 20 and stats['win_rate'] >= 60 and not ACHIEVEMENTS['perfect_game']['unlocked']:
-        ACHIEVEMENTS['perfect_game']['unlocked'] = True
-        unlocked.append('perfect_game')
+    if stats['total_bets'] >= 20 and stats['win_rate'] >= 60:
+        _unlock('perfect_game', unlocked)
     
-    history = player.get_bet_history()
-    if len(history) >= 5:
-        last_5 = history[-5:]
-        if all(h['won'] for h in last_5) and not ACHIEVEMENTS['lucky_streak']['unlocked']:
-            ACHIEVEMENTS['lucky_streak']['unlocked'] = True
-            unlocked.append('lucky_streak')
+    if history.trailing_wins >= 5:
+        _unlock('lucky_streak', unlocked)
     
-    for h in history:
-        if h['bet'].amount >= 500 and not ACHIEVEMENTS['high_roller']['unlocked']:
-            ACHIEVEMENTS['high_roller']['unlocked'] = True
-            unlocked.append('high_roller')
-            break
+    if history.max_amount >= 500:
+        _unlock('high_roller', unlocked)
     
     return unlocked
 
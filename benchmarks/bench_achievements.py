@@ -0,0 +1,85 @@
+"""Replay recorded histories through legacy and incremental achievement checks.
+
+Every replay asserts that both implementations unlock the same achievements
+after every bet, then the per-check cost is compared at a long history.
+Run from the project root with ``python -m benchmarks.bench_achievements``.
+"""
+import random
+import time
+
+from achievements import ACHIEVEMENTS, check_achievements, reset_achievements
+from roulette import Bet, Player, calculate_payout
+
+def _legacy_check_achievements(player, stats, unlocked_state):
+    """The original full-history implementation, on a separate unlock state."""
+    unlocked = []
+    checks = [
+        ('first_win', stats['wins'] >= 1),
+        ('ten_wins', stats['wins'] >= 10),
+        ('fifty_bets', stats['total_bets'] >= 50),
+        ('big_winner', stats['profit'] >= 5000),
+        ('comeback', player.get_balance() < 100 and stats['profit'] > 0),
+        ('perfect_game', stats['total_bets'] >= 20 and stats['win_rate'] >= 60),
+    ]
+    for key, condition in checks:
+        if condition and not unlocked_state[key]:
+            unlocked_state[key] = True
+            unlocked.append(key)
+    history = player.get_bet_history()
+    if len(history) >= 5:
+        if all(h['won'] for h in history[-5:]) and not unlocked_state['lucky_streak']:
+            unlocked_state['lucky_streak'] = True
+            unlocked.append('lucky_streak')
+    for h in history:
+        if h['bet'].amount >= 500 and not unlocked_state['high_roller']:
+            unlocked_state['high_roller'] = True
+            unlocked.append('high_roller')
+            break
+    return unlocked
+
+def _play(player, rng):
+    bet_type, value = rng.choice([("number", rng.randrange(37)), ("color", "red"), ("odd", None), ("low", None)])
+    bet = Bet(bet_type, value, rng.choice([10, 10, 50, 100, 500, 2000]))
+    player.subtract_balance(bet.amount)
+    winning_number = rng.randrange(37)
+    payout = calculate_payout(bet, winning_number)
+    player.add_balance(payout)
+    player.add_bet_to_history(bet, winning_number, payout > 0, payout)
+
+def replay(seed, spins, initial_balance):
+    """Assert both implementations agree after every bet of one session."""
+    rng = random.Random(seed)
+    reset_achievements()
+    legacy_state = {key: False for key in ACHIEVEMENTS}
+    player = Player(initial_balance)
+    for _ in range(spins):
+        _play(player, rng)
+        stats = player.get_statistics()
+        assert check_achievements(player, stats) == _legacy_check_achievements(player, stats, legacy_state)
+
+def _time_check(check, player, repeat=200):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        check(player, player.get_statistics())
+    return (time.perf_counter() - start) / repeat
+
+def main():
+    """Verify equivalence on recorded sessions and print per-check cost."""
+    for seed in range(50):
+        replay(seed, 300, random.Random(seed).choice([50, 1000, 100000]))
+    print("legacy and incremental unlocks match on 50 replayed sessions")
+
+    rng = random.Random(0)
+    for size in (10, 1_000, 100_000):
+        player = Player(10 ** 9)
+        for _ in range(size):
+            _play(player, rng)
+        reset_achievements()
+        legacy_state = {key: False for key in ACHIEVEMENTS}
+        legacy = _time_check(lambda p, s: _legacy_check_achievements(p, s, legacy_state), player, repeat=20)
+        incremental = _time_check(check_achievements, player)
+        print(f"history {size:>7}: legacy {legacy * 1e6:10.1f} us | incremental {incremental * 1e6:6.2f} us")
+    reset_achievements()
+
+if __name__ == "__main__":
+    main()
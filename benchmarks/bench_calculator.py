@@ -0,0 +1,56 @@
+"""Check the calculator's risk of ruin and time cold and cached queries.
+
+Every bet type's closed-form ruin table is compared with a step-by-step
+absorbing walk, then a full stake range is queried cold and again from
+the LRU caches. Run from the project root with
+``python -m benchmarks.bench_calculator``.
+"""
+import time
+
+import calculator
+
+def walk_ruin(numbers, multiplier, spins, units):
+    """Return the chance of ruin within ``spins`` by stepping the walk."""
+    win = numbers / 37
+    balances = {units: 1.0}
+    ruined = 0.0
+    for _ in range(spins):
+        following = {}
+        for balance, p in balances.items():
+            up = balance + multiplier - 1
+            following[up] = following.get(up, 0.0) + p * win
+            if balance == 1:
+                ruined += p * (1 - win)
+            else:
+                following[balance - 1] = following.get(balance - 1, 0.0) + p * (1 - win)
+        balances = following
+    return ruined
+
+def main(bankroll=1000, spins=1000):
+    """Assert the ruin tables match the walk and print query timings."""
+    for bet_type in calculator.BET_TYPES:
+        odds = calculator.bet_odds(bet_type)
+        for units, walk_spins in ((1, 10), (5, 60), (20, 150)):
+            exact = calculator.risk_of_ruin(bet_type, 10, 10 * units, walk_spins)
+            walked = walk_ruin(odds['numbers'], odds['multiplier'], walk_spins, units)
+            assert abs(exact - walked) < 1e-9, (bet_type, units, walk_spins, exact, walked)
+
+    stakes = range(10, bankroll + 1, 10)
+    calculator.clear_cache()
+    start = time.perf_counter()
+    for bet_type in calculator.BET_TYPES:
+        calculator.stake_table(bet_type, stakes, bankroll, spins)
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    for bet_type in calculator.BET_TYPES:
+        calculator.stake_table(bet_type, stakes, bankroll, spins)
+    warm = time.perf_counter() - start
+
+    queries = len(calculator.BET_TYPES) * len(stakes)
+    print(f"{queries} stake queries, ${bankroll} bankroll, {spins} spins")
+    print(f"cold: {cold * 1e3:8.1f} ms ({cold / queries * 1e6:.1f} us per stake)")
+    print(f"warm: {warm * 1e3:8.1f} ms ({warm / queries * 1e6:.1f} us per stake)")
+    print(f"ruin tables cached: {calculator._ruin_table.cache_info().currsize}")
+
+if __name__ == "__main__":
+    main()
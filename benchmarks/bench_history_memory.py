@@ -0,0 +1,52 @@
+"""Measure bytes per recorded bet for list-of-dicts and columnar history.
+
+Run from the project root with ``python -m benchmarks.bench_history_memory``.
+"""
+import random
+import tracemalloc
+
+from history import BetHistory
+from roulette import Bet, calculate_payout
+
+def _resolved_bets(count, seed=0):
+    rng = random.Random(seed)
+    choices = [("number", n) for n in range(37)] + [("color", "red"), ("color", "black"), ("odd", None), ("high", None)]
+    for _ in range(count):
+        bet_type, value = rng.choice(choices)
+        bet = Bet(bet_type, value, rng.choice([10, 50, 100, 500]))
+        winning_number = rng.randrange(37)
+        payout = calculate_payout(bet, winning_number)
+        yield bet, winning_number, payout > 0, payout
+
+def _measure(build, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    history = build(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return history, (after - before) / count
+
+def _build_dict_history(count):
+    history = []
+    for bet, winning_number, won, payout in _resolved_bets(count):
+        history.append({'bet': bet, 'winning_number': winning_number, 'won': won, 'payout': payout})
+    return history
+
+def _build_columnar_history(count):
+    history = BetHistory()
+    for bet, winning_number, won, payout in _resolved_bets(count):
+        history.append(bet, winning_number, won, payout)
+    return history
+
+def main(count=200_000):
+    """Print bytes per bet for both history layouts."""
+    dicts, dict_bytes = _measure(_build_dict_history, count)
+    columns, column_bytes = _measure(_build_columnar_history, count)
+    for old, new in zip(dicts[-100:], columns[-100:]):
+        assert (old['bet'].bet_type, old['bet'].value, old['bet'].amount) == (new['bet'].bet_type, new['bet'].value, new['bet'].amount)
+        assert (old['winning_number'], old['won'], old['payout']) == (new['winning_number'], new['won'], new['payout'])
+    print(f"list of dicts: {dict_bytes:.1f} bytes per bet")
+    print(f"columnar:      {column_bytes:.1f} bytes per bet ({columns.nbytes() / count:.1f} in columns)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Check the cold-start import cost of each CLI mode against a budget.
+
+Every mode runs ``roulette.py`` under ``python -X importtime`` in a
+scratch directory, after the project is byte-compiled so no run pays for
+compiling sources. Modules the bare interpreter imports anyway are left
+out, so a mode's cost is the import time of the code it pulls in itself
+(median of ``--repeat`` runs). A mode fails when it imports a module it
+should never need, or when its cost exceeds a budget set well above the
+measured cost so that scheduling noise alone never fails the check; the
+forbidden modules are the real guard. Run from the project root with
+``python -m benchmarks.bench_imports``.
+"""
+import argparse
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROULETTE = os.path.join(PROJECT_ROOT, "roulette.py")
+
+MODES = {
+    'interactive': {
+        'args': [],
+        'stdin': "0\nno\n",
+        'budget_ms': 50.0,
+        'forbidden': ('numpy', 'scipy', 'sqlite3', 'sessions', 'tournament', 'server', 'asyncio'),
+    },
+    'simulate': {
+        'args': ["simulate", "--sessions", "1", "--spins", "10", "--output", os.devnull],
+        'budget_ms': 50.0,
+        'forbidden': ('numpy', 'scipy', 'sqlite3', 'storage', 'achievements', 'calculator', 'betslip',
+                      'fractions'),
+    },
+    'leaderboard': {
+        'args': ["leaderboard"],
+        'budget_ms': 55.0,
+        'forbidden': ('numpy', 'scipy', 'sessions', 'achievements', 'calculator', 'betslip', 'rng'),
+    },
+    'export': {
+        'args': ["export", "statistics.txt"],
+        'budget_ms': 50.0,
+        'forbidden': ('numpy', 'scipy', 'sqlite3', 'sessions', 'achievements', 'calculator', 'betslip', 'rng'),
+    },
+}
+
+def parse_importtime(stderr):
+    """Return ``{module: cumulative_us}`` for the top-level imports of a run."""
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  "):
+            continue
+        imports[name.strip()] = int(cumulative)
+    return imports
+
+def all_modules(stderr):
+    """Return the names of every module imported during a run."""
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in stderr.splitlines()
+        if line.startswith("import time:") and "cumulative" not in line
+    }
+
+def _importtime(args, cwd, stdin=None):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        input=stdin, capture_output=True, text=True, cwd=cwd
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} failed: {result.stderr.splitlines()[-1]}")
+    return result.stderr
+
+def measure(mode, repeat, baseline, cwd):
+    """Return ``(median_us, top_imports, modules)`` for one mode.
+
+    ``top_imports`` comes from the run closest to the median; ``modules``
+    is every module any run imported.
+    """
+    spec = MODES[mode]
+    runs = []
+    modules = set()
+    for _ in range(repeat):
+        stderr = _importtime([ROULETTE, *spec['args']], cwd, spec.get('stdin'))
+        imports = {name: us for name, us in parse_importtime(stderr).items() if name not in baseline}
+        runs.append((sum(imports.values()), imports))
+        modules |= all_modules(stderr)
+    median = statistics.median(total for total, _ in runs)
+    _, imports = min(runs, key=lambda run: abs(run[0] - median))
+    return median, imports, modules
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="per-mode CLI import time budgets")
+    parser.add_argument("--repeat", type=int, default=7, help="runs per mode; the median counts")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget, e.g. for slow machines")
+    parser.add_argument("modes", nargs="*", help=f"modes to check (default: {', '.join(MODES)})")
+    args = parser.parse_args(argv)
+    for mode in args.modes:
+        if mode not in MODES:
+            parser.error(f"unknown mode: {mode}")
+
+    compileall.compile_dir(PROJECT_ROOT, quiet=1)
+    failures = 0
+    with tempfile.TemporaryDirectory() as scratch:
+        baseline = all_modules(_importtime(["-c", "pass"], scratch))
+        for mode in args.modes or MODES:
+            total, imports, modules = measure(mode, args.repeat, baseline, scratch)
+            budget = MODES[mode]['budget_ms'] * args.scale
+            forbidden = sorted(modules.intersection(MODES[mode]['forbidden']))
+            status = "ok"
+            if total / 1e3 > budget or forbidden:
+                status = "FAIL"
+                failures += 1
+            heaviest = sorted(imports.items(), key=lambda item: -item[1])[:4]
+            print(f"{mode:<12} {total / 1e3:7.2f} ms / {budget:5.1f} ms budget  {len(modules - baseline):3d} modules  {status}")
+            print("             " + ", ".join(f"{name} {us / 1e3:.2f} ms" for name, us in heaviest))
+            if forbidden:
+                print(f"             imports {', '.join(forbidden)}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Compare table-driven payout resolution with the old branchy functions.
+
+Also checks every bet on the layout (splits through baskets) against its
+coverage mask and times the mask bit test that decides wins.
+
+Run from the project root with ``python -m benchmarks.bench_payouts``.
+"""
+import timeit
+
+from config import PAYOUT_MULTIPLIERS, RED_NUMBERS
+from payouts import BET_KEYS, BET_MASKS, WHEEL_SIZE
+from roulette import Bet, calculate_payout, check_bet_win
+
+BETS = [
+    Bet("number", 17, 10),
+    Bet("color", "red", 10),
+    Bet("color", "black", 10),
+    Bet("odd", None, 10),
+    Bet("even", None, 10),
+    Bet("high", None, 10),
+    Bet("low", None, 10),
+]
+
+LAYOUT_BETS = [Bet(bet_type, value, 10) for bet_type, value in BET_KEYS]
+
+def _legacy_calculate_payout(bet, winning_number):
+    """Resolve a bet the way ``calculate_payout`` did before the table."""
+    if bet.bet_type == "number":
+        won = winning_number == bet.value
+    elif bet.bet_type == "color":
+        if winning_number == 0:
+            won = False
+        else:
+            color = "red" if winning_number in RED_NUMBERS else "black"
+            won = color == bet.value.lower()
+    elif bet.bet_type in ["odd", "even"]:
+        if winning_number == 0:
+            won = False
+        elif bet.bet_type == "odd":
+            won = winning_number % 2 == 1
+        else:
+            won = winning_number % 2 == 0
+    elif bet.bet_type in ["high", "low"]:
+        if winning_number == 0:
+            won = False
+        elif bet.bet_type == "low":
+            won = 1 <= winning_number <= 18
+        else:
+            won = 19 <= winning_number <= 36
+    else:
+        won = False
+    if not won:
+        return 0
+    return bet.amount * PAYOUT_MULTIPLIERS.get(bet.bet_type, 2)
+
+def _resolve_all(resolver):
+    for bet in BETS:
+        for number in range(37):
+            resolver(bet, number)
+
+def _resolve_all_layout(resolver):
+    for bet in LAYOUT_BETS:
+        for number in range(37):
+            resolver(bet, number)
+
+def main(repeat=5, number=200):
+    """Print the per-resolution cost of both implementations."""
+    for bet in BETS:
+        for winning_number in range(37):
+            assert calculate_payout(bet, winning_number) == _legacy_calculate_payout(bet, winning_number)
+
+    resolutions = len(BETS) * 37 * number
+    legacy = min(timeit.repeat(lambda: _resolve_all(_legacy_calculate_payout), repeat=repeat, number=number))
+    table = min(timeit.repeat(lambda: _resolve_all(calculate_payout), repeat=repeat, number=number))
+    print(f"legacy branches: {legacy / resolutions * 1e9:.1f} ns per bet")
+    print(f"payout table:    {table / resolutions * 1e9:.1f} ns per bet")
+    print(f"speedup:         {legacy / table:.2f}x")
+
+    for bet in LAYOUT_BETS:
+        covered = [n for n in range(WHEEL_SIZE) if check_bet_win(bet, n)]
+        assert sum(1 << n for n in covered) == BET_MASKS[bet.code]
+        assert all(calculate_payout(bet, n) * len(covered) == bet.amount * (WHEEL_SIZE - 1)
+                   for n in covered)
+    tests = len(LAYOUT_BETS) * 37 * (number // 10)
+    masks = min(timeit.repeat(lambda: _resolve_all_layout(check_bet_win), repeat=repeat, number=number // 10))
+    print(f"mask bit test:   {masks / tests * 1e9:.1f} ns per bet ({len(LAYOUT_BETS)} layout bets)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Measure how long resuming a saved game takes as the save grows.
+
+Each case saves a session of ``size`` bets in a scratch directory, checks
+that the restored history matches the original, and times
+``load_game_state`` plus reading the last five bets (what the history menu
+shows). Run from the project root with ``python -m benchmarks.bench_resume``.
+"""
+import os
+import tempfile
+import time
+
+import storage
+from benchmarks.suite import _player_with_history
+from roulette import Player
+
+def _same_entry(a, b):
+    return (a['bet'].bet_type, a['bet'].value, a['bet'].amount, a['winning_number'], a['won'], a['payout']) == \
+        (b['bet'].bet_type, b['bet'].value, b['bet'].amount, b['winning_number'], b['won'], b['payout'])
+
+def resume_time(size, repeat=5):
+    """Save ``size`` bets, verify the round trip and return seconds per resume."""
+    player = _player_with_history(size)
+    storage.save_game_state(player)
+    restored = Player()
+    storage.load_game_state(restored)
+    assert len(restored.bet_history) == size
+    assert restored.get_statistics() == player.get_statistics()
+    assert restored.get_risk_statistics() == player.get_risk_statistics()
+    assert all(_same_entry(a, b) for a, b in zip(restored.bet_history[-5:], player.bet_history[-5:]))
+    assert all(_same_entry(a, b) for a, b in zip(restored.bet_history[:5], player.bet_history[:5]))
+
+    best = float('inf')
+    for _ in range(repeat):
+        restored = Player()
+        start = time.perf_counter()
+        storage.load_game_state(restored)
+        restored.get_bet_history()[-5:]
+        best = min(best, time.perf_counter() - start)
+        restored.bet_history.close()
+    return best
+
+def main():
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            for size in (1_000, 100_000, 1_000_000):
+                seconds = resume_time(size)
+                save_bytes = os.path.getsize(storage.SAVE_FILE)
+                print(f"{size:>9} bets: resume {seconds * 1e3:8.2f} ms | snapshot {save_bytes:>6} bytes")
+        finally:
+            os.chdir(cwd)
+
+if __name__ == "__main__":
+    main()
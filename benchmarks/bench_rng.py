@@ -0,0 +1,23 @@
+"""Compare the per-spin cost of each wheel RNG backend.
+
+Run from the project root with ``python -m benchmarks.bench_rng``.
+"""
+import random
+import timeit
+
+from rng import BufferedWheel, SecureWheel, SeededWheel
+
+def main(number=200_000, repeat=5):
+    """Print nanoseconds per spin for every backend."""
+    backends = {
+        'random.randint (old)': lambda: random.randint(0, 36),
+        'seeded': SeededWheel(1).spin,
+        'buffered': BufferedWheel(1).spin,
+        'secure': SecureWheel().spin,
+    }
+    for name, spin in backends.items():
+        best = min(timeit.repeat(spin, number=number, repeat=repeat))
+        print(f"{name:<22} {best / number * 1e9:8.1f} ns per spin")
+
+if __name__ == "__main__":
+    main()
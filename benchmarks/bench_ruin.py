@@ -0,0 +1,158 @@
+"""Check the exact ruin analysis and time it.
+
+Run from the project root with ``python -m benchmarks.bench_ruin``; it
+exits non-zero on a mismatch. ``analyze_strategy`` must solve the same
+chain as ``_scalar_analyze``, the node-by-node build it replaced, and its
+ruin rates must agree with seeded Monte Carlo sessions.
+"""
+import math
+import sys
+import time
+
+import numpy as np
+from scipy.sparse import csr_matrix, identity
+from scipy.sparse.linalg import spsolve
+
+from config import MAXIMUM_BET, MINIMUM_BET
+from payouts import PAYOUT_TABLE, WHEEL_SIZE, bet_code
+from ruin import DENSE_ROW_ENTRIES, _result, analyze_strategy, strategy_graph
+from sessions import run_session
+from strategies import STRATEGIES
+
+CASES = [
+    (bankroll, base_amount, None, "color", "red")
+    for bankroll in (15, 100, 1000, 1005, 2001)
+    for base_amount in (10, 50)
+] + [
+    (1000, 10, 1500, "number", 17),
+    (999, 10, None, "dozen", (13, 24)),
+    (777, 25, 1000, "split", (1, 2)),
+    (3333, 20, None, "basket", None),
+    (1000, 10, 900, "color", "red"),
+]
+
+def _sparse(entries, shape):
+    rows = [key[0] for key in entries]
+    cols = [key[1] for key in entries]
+    return csr_matrix((list(entries.values()), (rows, cols)), shape=shape)
+
+def _scalar_analyze(strategy_name, bankroll, base_amount, target, bet_type, bet_value):
+    """Solve the chain the way ``analyze_strategy`` did before it was vectorized."""
+    if target is None:
+        target = 2 * bankroll
+    row = PAYOUT_TABLE[bet_code(bet_type, bet_value)]
+    multiplier = max(row)
+    win_probability = sum(1 for m in row if m) / WHEEL_SIZE
+    loss_probability = 1 - win_probability
+    _, amounts, win_next, loss_next = strategy_graph(strategy_name, base_amount)
+    anchors = {0} | set(win_next) | {s for s in range(len(amounts)) if loss_next[s] == s}
+    transient = {(bankroll, 0): 0}
+    absorbing = {}
+    q_entries = {}
+    r_entries = {}
+    run_spins = {}
+
+    def is_absorbed(balance, state):
+        return balance >= target or min(amounts[state], balance, MAXIMUM_BET) < MINIMUM_BET
+
+    def link(source, balance, state, probability):
+        if is_absorbed(balance, state):
+            key = (source, absorbing.setdefault(balance, len(absorbing)))
+            r_entries[key] = r_entries.get(key, 0.0) + probability
+            return
+        if (balance, state) not in transient:
+            transient[(balance, state)] = len(transient)
+            frontier.append((balance, state))
+        key = (source, transient[(balance, state)])
+        q_entries[key] = q_entries.get(key, 0.0) + probability
+
+    if is_absorbed(bankroll, 0):
+        return _result(bankroll, target, 0.0, {bankroll: 1.0}, 0)
+    frontier = [(bankroll, 0)]
+    while frontier:
+        balance, state = frontier.pop()
+        source = transient[(balance, state)]
+        probability = 1.0
+        run_spins[source] = 0.0
+        while True:
+            wager = min(amounts[state], balance, MAXIMUM_BET)
+            run_spins[source] += probability
+            link(source, balance + (multiplier - 1) * wager, win_next[state], probability * win_probability)
+            probability *= loss_probability
+            balance -= wager
+            state = loss_next[state]
+            if state in anchors or is_absorbed(balance, state):
+                link(source, balance, state, probability)
+                break
+
+    size = len(transient)
+    q = _sparse(q_entries, (size, size))
+    r = _sparse(r_entries, (size, len(absorbing)))
+    start = np.zeros(size)
+    start[0] = 1.0
+    permc_spec = "NATURAL" if q.nnz > DENSE_ROW_ENTRIES * size else "COLAMD"
+    visits = spsolve((identity(size, format='csc') - q).T.tocsc(), start, permc_spec=permc_spec)
+    absorbed = r.T @ visits
+    spins = np.array([run_spins[i] for i in range(size)])
+    distribution = {balance: float(absorbed[i]) for balance, i in sorted(absorbing.items())}
+    return _result(bankroll, target, float(visits @ spins), distribution, size)
+
+def check_scalar(name, case):
+    """Return a mismatch description, or ``None`` if both builds agree."""
+    expected = _scalar_analyze(name, *case)
+    result = analyze_strategy(name, *case)
+    if result['states'] != expected['states']:
+        return f"{result['states']} states, expected {expected['states']}"
+    if result['final_balance_distribution'].keys() != expected['final_balance_distribution'].keys():
+        return "different final balances"
+    for balance, p in expected['final_balance_distribution'].items():
+        if not math.isclose(result['final_balance_distribution'][balance], p, rel_tol=1e-7, abs_tol=1e-12):
+            return f"final balance {balance}: {result['final_balance_distribution'][balance]} != {p}"
+    if not math.isclose(result['expected_spins'], expected['expected_spins'], rel_tol=1e-8):
+        return f"expected spins {result['expected_spins']} != {expected['expected_spins']}"
+    return None
+
+def monte_carlo_ruin(strategy_name, bankroll, base_amount, target, sessions):
+    """Return the observed ruin rate of seeded headless sessions."""
+    ruined = 0
+    for i in range(sessions):
+        result = run_session(strategy_name, bankroll, spins=10 ** 9, seed=f"ruin:{i}",
+                             base_amount=base_amount, target=target)
+        ruined += result['ruined']
+    return ruined / sessions
+
+def main(sessions=2000):
+    """Compare exact ruin with the scalar build and Monte Carlo, then time it."""
+    failures = 0
+    for name in STRATEGIES:
+        for case in CASES:
+            mismatch = check_scalar(name, case)
+            if mismatch is not None:
+                print(f"FAIL {name} {case}: {mismatch}")
+                failures += 1
+    print(f"{len(STRATEGIES) * len(CASES)} cases checked against the scalar build")
+
+    for name in STRATEGIES:
+        for base_amount in (10, 50):
+            exact = analyze_strategy(name, 1000, base_amount=base_amount)
+            observed = monte_carlo_ruin(name, 1000, base_amount, exact['target'], sessions)
+            p = exact['ruin_probability']
+            tolerance = 4 * math.sqrt(max(p * (1 - p), 1e-4) / sessions)
+            status = "ok" if abs(observed - p) <= tolerance else "FAIL"
+            failures += status == "FAIL"
+            print(f"{name:<13} base {base_amount:>3}: exact ruin {p:.4f} | monte carlo {observed:.4f}  {status}")
+
+    for bankroll in (1000, 10000, 20000):
+        for name in STRATEGIES:
+            start = time.perf_counter()
+            result = analyze_strategy(name, bankroll)
+            elapsed = time.perf_counter() - start
+            start = time.perf_counter()
+            _scalar_analyze(name, bankroll, MINIMUM_BET, None, "color", "red")
+            scalar = time.perf_counter() - start
+            print(f"bankroll {bankroll:>6} {name:<13} {result['states']:>7} states {elapsed * 1000:8.1f} ms "
+                  f"(scalar build {scalar * 1000:8.1f} ms)")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
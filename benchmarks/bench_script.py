@@ -0,0 +1,45 @@
+"""Measure scripted-session throughput through the real menu logic.
+
+A long script of mixed single bets, multi-bets, repeats and menu views is
+replayed twice against the same spin list; both runs must end in the same
+state. Run from the project root with ``python -m benchmarks.bench_script``.
+"""
+import random
+
+from scripted import run_script
+
+def build_script(turns, seed=0):
+    """Return ``(commands, spins)`` for ``turns`` spins of mixed play."""
+    rng = random.Random(seed)
+    commands = []
+    placed_single = False
+    for _ in range(turns):
+        kind = rng.random()
+        if kind < 0.4:
+            commands += ["2", "10", rng.choice(["red", "black"]), "yes"]
+            placed_single = True
+        elif kind < 0.6:
+            commands += ["1", "10", str(rng.randrange(37)), "y"]
+            placed_single = True
+        elif kind < 0.8 and placed_single:
+            commands += ["r", "yes"]
+        else:
+            commands += ["5", "3", "10", "odd", "4", "20", "high", "done", "yes"]
+        if rng.random() < 0.05:
+            commands.append(rng.choice(["6", "7", "f"]))
+    commands += ["0", ""]
+    spins = [rng.randrange(37) for _ in range(turns)]
+    return commands, spins
+
+def main():
+    commands, spins = build_script(20000)
+    first = run_script(commands, spins, balance=10 ** 9)
+    second = run_script(commands, spins, balance=10 ** 9)
+    for key in ('inputs', 'spins', 'balance', 'wins', 'losses', 'max_win_streak'):
+        assert first[key] == second[key], key
+    assert first['finished'] and first['spins'] == len(spins)
+    print(f"{first['spins']} spins, {first['inputs']} inputs, {first['total_bets']} bets in {first['elapsed']:.2f} s")
+    print(f"{first['spins'] / first['elapsed']:,.0f} turns/sec | {first['inputs'] / first['elapsed']:,.0f} inputs/sec")
+
+if __name__ == "__main__":
+    main()
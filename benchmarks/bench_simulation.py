@@ -0,0 +1,79 @@
+"""Check the vectorized payouts against ``calculate_payout`` and time them.
+
+Run from the project root with ``python -m benchmarks.bench_simulation``.
+``resolve_bets`` and ``resolve_bet_slip`` must match ``calculate_payout``
+exactly for every bet on the layout, ``stress_test_limits`` must total
+the same payouts, and the stress test must sustain ``MIN_SPINS_PER_SECOND``.
+"""
+import sys
+import time
+
+import numpy as np
+
+from config import MAXIMUM_BET, MINIMUM_BET
+from payouts import BET_KEYS, WHEEL_SIZE
+from roulette import Bet, calculate_payout
+from simulation import resolve_bet_slip, resolve_bets, spin_batch, stress_test_limits
+
+MIN_SPINS_PER_SECOND = 10_000_000
+
+def check_resolve_bets(rng, count=2000):
+    """Compare ``resolve_bets`` with ``calculate_payout`` for every layout bet."""
+    spins = np.concatenate([np.arange(WHEEL_SIZE, dtype=np.uint8), spin_batch(count, rng)])
+    amounts = rng.integers(MINIMUM_BET, MAXIMUM_BET + 1, size=len(spins))
+    for bet_type, value in BET_KEYS:
+        flat = resolve_bets(bet_type, value, 10, spins).tolist()
+        staked = resolve_bets(bet_type, value, amounts, spins).tolist()
+        for i, number in enumerate(spins.tolist()):
+            assert flat[i] == calculate_payout(Bet(bet_type, value, 10), number), (bet_type, value, number)
+            expected = calculate_payout(Bet(bet_type, value, int(amounts[i])), number)
+            assert staked[i] == expected, (bet_type, value, number)
+
+def check_bet_slips(rng, slips=200):
+    """Compare ``resolve_bet_slip`` with the summed scalar payouts."""
+    spins = np.arange(WHEEL_SIZE, dtype=np.uint8)
+    for _ in range(slips):
+        picks = rng.choice(len(BET_KEYS), size=int(rng.integers(1, 8)), replace=False)
+        bets = [Bet(*BET_KEYS[i], int(rng.integers(MINIMUM_BET, MAXIMUM_BET + 1))) for i in picks]
+        totals = resolve_bet_slip(bets, spins).tolist()
+        for number in range(WHEEL_SIZE):
+            assert totals[number] == sum(calculate_payout(bet, number) for bet in bets), (bets, number)
+
+def check_stress_test(seed=3, spins=50_000):
+    """Recount a stress test's wins and payouts from the same wheel results."""
+    numbers = spin_batch(spins, np.random.default_rng(seed)).tolist()
+    for bet_type, value in BET_KEYS:
+        results = stress_test_limits(bet_type, value, spins, seed, chunk_size=spins)
+        for result in results:
+            bet = Bet(bet_type, value, result['amount'])
+            payouts = [calculate_payout(bet, number) for number in numbers]
+            assert result['paid'] == sum(payouts), (bet_type, value, result['amount'])
+            assert result['wins'] == sum(1 for payout in payouts if payout), (bet_type, value)
+            assert result['max_payout'] == max(payouts), (bet_type, value)
+
+def time_stress_test(spins=20_000_000):
+    """Print the stress test throughput per bet type; return the slowest."""
+    slowest = None
+    for bet_type, value in [("number", 17), ("color", "red"), ("split", (1, 2)), ("dozen", (1, 12))]:
+        start = time.perf_counter()
+        stress_test_limits(bet_type, value, spins, seed=0)
+        rate = spins / (time.perf_counter() - start)
+        print(f"stress test {bet_type:<7} {spins:,} spins: {rate / 1e6:6.1f} M spins/s")
+        slowest = rate if slowest is None else min(slowest, rate)
+    return slowest
+
+def main():
+    rng = np.random.default_rng(0)
+    check_resolve_bets(rng)
+    check_bet_slips(rng)
+    check_stress_test()
+    print(f"resolve_bets, resolve_bet_slip and stress_test_limits match calculate_payout "
+          f"for all {len(BET_KEYS)} layout bets")
+    slowest = time_stress_test()
+    if slowest < MIN_SPINS_PER_SECOND:
+        print(f"FAIL: {slowest / 1e6:.1f} M spins/s is below {MIN_SPINS_PER_SECOND / 1e6:.0f} M spins/s")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""Check the array strategies against the scalar classes and time them.
+
+Run from the project root with ``python -m benchmarks.bench_strategies``.
+Every array strategy is stepped alongside one scalar strategy per session
+and must hold exactly the same state after every masked update, and
+``simulate_sessions`` must end every session exactly where a scalar
+``run_session`` loop over the same wheel results does.
+"""
+import time
+
+import numpy as np
+
+from config import MAXIMUM_BET, MINIMUM_BET
+from payouts import PAYOUT_TABLE, bet_code
+from simulation import STRATEGY_ARRAYS, create_strategy_array, simulate_sessions, spin_batch
+from strategies import create_strategy
+
+CASES = [
+    ('flat', {}),
+    ('martingale', {}),
+    ('fibonacci', {}),
+    ('fibonacci', {'length': 5}),
+    ('conservative', {}),
+    ('conservative', {'loss_threshold': 1}),
+    ('dalembert', {})
+]
+
+def assert_same_state(array, scalars, context):
+    """Assert every array attribute equals the scalar attribute of each session."""
+    for key, value in vars(scalars[0]).items():
+        if key == 'name':
+            assert array.name == value, context
+        elif key == 'fib_sequence':
+            assert array.fib_sequence.tolist() == value, context
+        elif key == 'loss_threshold':
+            assert array.loss_threshold == value, context
+        else:
+            expected = [getattr(scalar, key) for scalar in scalars]
+            assert getattr(array, key).tolist() == expected, (context, key)
+    expected = [scalar.get_bet_amount() for scalar in scalars]
+    assert array.get_bet_amounts().tolist() == expected, (context, 'bet amount')
+
+def check_updates(name, options, count=500, steps=300, seed=0):
+    """Drive random masked wins and losses through both implementations."""
+    rng = np.random.default_rng(seed)
+    bases = rng.choice([MINIMUM_BET, 15, 25, 100], size=count)
+    array = create_strategy_array(name, count, bases, **options)
+    scalars = [create_strategy(name, int(base), **options) for base in bases]
+    for step in range(steps):
+        active = rng.random(count) < 0.8
+        won = active & (rng.integers(0, 37, size=count) < 18)
+        lost = active & ~won
+        array.on_win(won)
+        array.on_loss(lost)
+        for i in np.flatnonzero(won):
+            scalars[i].on_win()
+        for i in np.flatnonzero(lost):
+            scalars[i].on_loss()
+        assert_same_state(array, scalars, (name, options, step))
+
+def scalar_session(name, options, bankroll, base_amount, columns, index, payouts, target, stop_loss):
+    """Play session ``index`` with the scalar strategy, as ``run_session`` does."""
+    strategy = create_strategy(name, base_amount, **options)
+    balance = bankroll
+    peak_balance = bankroll
+    max_drawdown = 0
+    spins_survived = 0
+    wagered = 0
+    for column in columns:
+        if target is not None and balance >= target:
+            break
+        if stop_loss is not None and balance <= stop_loss:
+            break
+        amount = min(strategy.get_bet_amount(), balance, MAXIMUM_BET)
+        if amount < MINIMUM_BET:
+            break
+        payout = amount * payouts[column[index]]
+        balance += payout - amount
+        wagered += amount
+        spins_survived += 1
+        if payout:
+            strategy.on_win()
+            if balance > peak_balance:
+                peak_balance = balance
+        else:
+            strategy.on_loss()
+            if peak_balance - balance > max_drawdown:
+                max_drawdown = peak_balance - balance
+    result = {
+        'final_balance': balance,
+        'peak_balance': peak_balance,
+        'max_drawdown': max_drawdown,
+        'spins_survived': spins_survived,
+        'wagered': wagered
+    }
+    return result, strategy
+
+def check_sessions(name, options, sessions=300, spins=400, seed=0, bankroll=1000, base_amount=MINIMUM_BET,
+                   bet_type="color", bet_value="red", target=None, stop_loss=None):
+    """Compare ``simulate_sessions`` with scalar sessions on the same wheel results."""
+    result = simulate_sessions(name, sessions, bankroll, spins, np.random.default_rng(seed), base_amount,
+                               bet_type, bet_value, target, stop_loss, options)
+    rng = np.random.default_rng(seed)
+    columns = [spin_batch(sessions, rng) for _ in range(int(result['spins_survived'].max()))]
+    payouts = PAYOUT_TABLE[bet_code(bet_type, bet_value)]
+    scalars = []
+    for i in range(sessions):
+        expected, strategy = scalar_session(name, options, bankroll, base_amount, columns, i,
+                                            payouts, target, stop_loss)
+        for key, value in expected.items():
+            assert int(result[key][i]) == value, (name, options, i, key)
+        scalars.append(strategy)
+    assert_same_state(result['strategy'], scalars, (name, options, 'session'))
+    assert result['ruined'].tolist() == [balance < MINIMUM_BET for balance in result['final_balance'].tolist()]
+
+def time_sessions(sessions, spins):
+    """Print the throughput of array sessions against scalar sessions."""
+    for name in STRATEGY_ARRAYS:
+        start = time.perf_counter()
+        result = simulate_sessions(name, sessions, spins=spins, rng=np.random.default_rng(1))
+        elapsed = time.perf_counter() - start
+        played = int(result['spins_survived'].sum())
+
+        scalar_sessions = max(1, sessions // 1000)
+        rng = np.random.default_rng(1)
+        columns = [spin_batch(scalar_sessions, rng) for _ in range(spins)]
+        payouts = PAYOUT_TABLE[bet_code("color", "red")]
+        start = time.perf_counter()
+        scalar_played = sum(
+            scalar_session(name, {}, 1000, MINIMUM_BET, columns, i, payouts, None, None)[0]['spins_survived']
+            for i in range(scalar_sessions)
+        )
+        scalar_rate = scalar_played / (time.perf_counter() - start)
+        print(f"{name:<13} {sessions} sessions x {spins} spins: {elapsed:6.2f} s, "
+              f"{played / elapsed / 1e6:6.1f} M bets/s (scalar {scalar_rate / 1e6:.2f} M bets/s)")
+
+def main(sessions=1_000_000, spins=100):
+    for name, options in CASES:
+        check_updates(name, options)
+        check_sessions(name, options)
+        check_sessions(name, options, seed=1, bankroll=200, base_amount=20, target=400)
+        check_sessions(name, options, seed=2, bankroll=100000, base_amount=1000, stop_loss=60000)
+        check_sessions(name, options, seed=3, bet_type="number", bet_value=17, bankroll=500)
+        print(f"{name:<13} {str(options):<24} matches the scalar strategy")
+    time_sessions(sessions, spins)
+
+if __name__ == "__main__":
+    main()
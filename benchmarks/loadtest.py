@@ -0,0 +1,117 @@
+"""Load-test the asyncio game server with many concurrent players.
+
+By default an in-process server is started on a scratch Unix socket; pass
+``--host``/``--port`` or ``--unix`` to target a running
+``python roulette.py serve``. Every client joins a table and bets each
+round; the report gives table rounds per second and bet latency
+percentiles. Run from the project root with ``python -m benchmarks.loadtest``.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from server import GameServer, start_server
+
+BETS = [
+    {'type': "color", 'value': "red", 'amount': 10},
+    {'type': "number", 'value': 17, 'amount': 10},
+    {'type': "odd", 'value': None, 'amount': 10},
+    {'type': "high", 'value': None, 'amount': 10},
+]
+
+async def _request(reader, writer, request):
+    writer.write(json.dumps(request).encode() + b"\n")
+    await writer.drain()
+    response = json.loads(await reader.readline())
+    if not response.get('ok'):
+        raise RuntimeError(response.get('error'))
+    return response
+
+async def run_client(connect, table, name, rounds, latencies, seed):
+    """Join ``table`` and bet ``rounds`` times, recording each latency.
+
+    A client that can no longer cover its bets leaves and rejoins with a
+    fresh balance.
+    """
+    rng = random.Random(seed)
+    reader, writer = await connect()
+    join = {'op': "join", 'table': table, 'name': name}
+    balance = (await _request(reader, writer, join))['balance']
+    for _ in range(rounds):
+        bets = rng.sample(BETS, rng.randint(1, len(BETS)))
+        if sum(bet['amount'] for bet in bets) > balance:
+            await _request(reader, writer, {'op': "leave"})
+            balance = (await _request(reader, writer, join))['balance']
+        start = time.perf_counter()
+        balance = (await _request(reader, writer, {'op': "bet", 'bets': bets}))['balance']
+        latencies.append(time.perf_counter() - start)
+    await _request(reader, writer, {'op': "leave"})
+    writer.close()
+
+def percentile(sorted_values, p):
+    """Return the ``p``-th percentile of already sorted values."""
+    index = min(len(sorted_values) - 1, int(p / 100 * len(sorted_values)))
+    return sorted_values[index]
+
+async def run_load(connect, tables, players, rounds):
+    """Drive ``players`` clients per table and return ``(elapsed, latencies)``."""
+    latencies = []
+    clients = [
+        run_client(connect, f"table{t}", f"player{p}", rounds, latencies, t * players + p)
+        for t in range(tables)
+        for p in range(players)
+    ]
+    start = time.perf_counter()
+    await asyncio.gather(*clients)
+    return time.perf_counter() - start, latencies
+
+async def _main(args):
+    listener = None
+    scratch = None
+    unix_path = args.unix
+    if args.host is None and unix_path is None:
+        scratch = tempfile.TemporaryDirectory()
+        unix_path = os.path.join(scratch.name, "roulette.sock")
+        listener = await start_server(GameServer(seed=0, wheel_kind="buffered"), unix_path=unix_path)
+
+    if unix_path:
+        def connect():
+            return asyncio.open_unix_connection(unix_path, limit=1 << 16)
+    else:
+        def connect():
+            return asyncio.open_connection(args.host, args.port, limit=1 << 16)
+
+    try:
+        elapsed, latencies = await run_load(connect, args.tables, args.players, args.rounds)
+    finally:
+        if listener is not None:
+            listener.close()
+            await listener.wait_closed()
+            scratch.cleanup()
+
+    latencies.sort()
+    table_rounds = args.tables * args.rounds
+    print(f"{args.tables} tables x {args.players} players x {args.rounds} rounds in {elapsed:.2f} s")
+    print(f"rounds/sec: {table_rounds / elapsed:,.0f} | bets/sec: {len(latencies) / elapsed:,.0f}")
+    print("latency: " + " | ".join(
+        f"p{p} {percentile(latencies, p) * 1e3:.2f} ms" for p in (50, 90, 99)
+    ) + f" | max {latencies[-1] * 1e3:.2f} ms")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="roulette server load test")
+    parser.add_argument("--tables", type=int, default=20)
+    parser.add_argument("--players", type=int, default=10, help="players per table")
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--host", default=None, help="target a running server instead of an in-process one")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", default=None, help="target a running server on this Unix socket")
+    asyncio.run(_main(parser.parse_args(argv)))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
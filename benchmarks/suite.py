@@ -0,0 +1,149 @@
+"""Benchmark the core hot paths and fail on regressions against a baseline.
+
+Run from the project root::
+
+    python -m benchmarks.suite                    # compare with baseline.json
+    python -m benchmarks.suite --json out.json    # also write raw results
+    python -m benchmarks.suite --update-baseline  # record a new baseline
+
+Results are nanoseconds per operation (best of several repeats). A case
+fails when it is slower than its baseline by more than ``--tolerance``.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+import storage
+from achievements import check_achievements, reset_achievements
+from roulette import Bet, Player, calculate_payout, spin_wheel
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_TOLERANCE = 1.0
+
+PAYOUT_BETS = {
+    'number': Bet("number", 17, 10),
+    'color': Bet("color", "red", 10),
+    'odd': Bet("odd", None, 10),
+    'even': Bet("even", None, 10),
+    'high': Bet("high", None, 10),
+    'low': Bet("low", None, 10),
+}
+
+def _player_with_history(size, seed=0):
+    rng = random.Random(seed)
+    player = Player(10 ** 9)
+    bets = list(PAYOUT_BETS.values())
+    for _ in range(size):
+        bet = rng.choice(bets)
+        winning_number = rng.randrange(37)
+        payout = calculate_payout(bet, winning_number)
+        player.subtract_balance(bet.amount)
+        player.add_balance(payout)
+        player.add_bet_to_history(bet, winning_number, payout > 0, payout)
+    return player
+
+def _time(func, number, repeat=7):
+    """Return the best per-call time of ``func`` in nanoseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+def _bench_add_bet_to_history():
+    player = Player(10 ** 9)
+    bet = PAYOUT_BETS['color']
+    return _time(lambda: player.add_bet_to_history(bet, 7, True, 20), number=20000)
+
+def _bench_check_achievements(size):
+    player = _player_with_history(size)
+    stats = player.get_statistics()
+    reset_achievements()
+    check_achievements(player, stats)
+    result = _time(lambda: check_achievements(player, stats), number=2000)
+    reset_achievements()
+    return result
+
+def _bench_save_load():
+    player = _player_with_history(1000)
+    restored = Player()
+
+    def round_trip():
+        player.journal = None
+        storage.save_game_state(player)
+        storage.load_game_state(restored)
+
+    return _time(round_trip, number=20)
+
+def _bench_save_to_leaderboard():
+    storage.save_to_leaderboard("warmup", 1000, 0, 1, 0.0)
+    return _time(lambda: storage.save_to_leaderboard("bench", 1000, 0, 1, 50.0), number=50)
+
+def run_benchmarks():
+    """Run every case in a scratch directory and return ``{name: ns_per_op}``."""
+    results = {}
+    results['spin_wheel'] = _time(spin_wheel, number=100000)
+    for bet_type, bet in PAYOUT_BETS.items():
+        results[f'calculate_payout[{bet_type}]'] = _time(lambda bet=bet: calculate_payout(bet, 17), number=100000)
+    results['add_bet_to_history'] = _bench_add_bet_to_history()
+    player = _player_with_history(1000)
+    results['get_statistics'] = _time(player.get_statistics, number=100000)
+    for size in (10, 1000, 100000):
+        results[f'check_achievements[{size}]'] = _bench_check_achievements(size)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            results['save_load_round_trip[1000]'] = _bench_save_load()
+            results['save_to_leaderboard'] = _bench_save_to_leaderboard()
+        finally:
+            os.chdir(cwd)
+    return results
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Return ``(name, baseline_ns, result_ns)`` for every regressed case."""
+    regressions = []
+    for name, value in results.items():
+        reference = baseline.get(name)
+        if reference is not None and value > reference * (1 + tolerance):
+            regressions.append((name, reference, value))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="core hot path benchmarks")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown as a fraction of the baseline")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks()
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+
+    for name, value in results.items():
+        reference = baseline.get(name)
+        ratio = f"{value / reference:6.2f}x" if reference else "    new"
+        print(f"{name:<32} {value:14.1f} ns  {ratio}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for name, reference, value in regressions:
+        print(f"regression: {name} {value:.1f} ns > {reference:.1f} ns baseline")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
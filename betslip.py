@@ -0,0 +1,54 @@
+"""Bet slips compiled into per-number payout vectors."""
+from fractions import Fraction
+
+from payouts import BET_MASKS, PAYOUT_TABLE, WHEEL_SIZE
+
+class BetSlip:
+    """Several bets resolved together against one spin.
+
+    On creation every wheel number is mapped to the per-bet payouts, the
+    slip's gross payout and its net result, so resolving a spin is a
+    single index and the exact odds of the slip are known before it is
+    confirmed. ``coverage`` ORs the bets' masks: the numbers on which at
+    least one bet wins.
+    """
+
+    def __init__(self, bets):
+        self.bets = list(bets)
+        self.total_amount = sum(bet.amount for bet in self.bets)
+        columns = [[bet.amount * multiplier for multiplier in PAYOUT_TABLE[bet.code]] for bet in self.bets]
+        self.bet_payouts = tuple(zip(*columns)) if columns else ((),) * WHEEL_SIZE
+        self.gross = tuple(map(sum, self.bet_payouts))
+        self.net = tuple(gross - self.total_amount for gross in self.gross)
+        self.coverage = 0
+        for bet in self.bets:
+            self.coverage |= BET_MASKS[bet.code]
+
+    def __len__(self):
+        return len(self.bets)
+
+    def __iter__(self):
+        return iter(self.bets)
+
+    def resolve(self, winning_number):
+        """Return ``(total_payout, per_bet_payouts)`` for a wheel result."""
+        return self.gross[winning_number], self.bet_payouts[winning_number]
+
+    def hit_probability(self):
+        """Return the exact probability that at least one bet wins."""
+        return Fraction(self.coverage.bit_count(), WHEEL_SIZE)
+
+    def expected_value(self):
+        """Return the exact expected net result per spin."""
+        return Fraction(sum(self.net), WHEEL_SIZE)
+
+    def variance(self):
+        """Return the exact variance of the net result per spin."""
+        mean = self.expected_value()
+        return Fraction(sum(net * net for net in self.net), WHEEL_SIZE) - mean * mean
+
+    def worst_case(self):
+        return min(self.net)
+
+    def best_case(self):
+        return max(self.net)
@@ -1,48 +1,228 @@
-from config import PAYOUT_MULTIPLIERS
+"""Exact odds, expected value and risk of ruin for every bet type.
+
+A bet type's odds depend only on how many numbers it covers and its
+payout multiplier, so they are computed once per type as exact fractions
+per $1 staked and scaled by the stake. Risk of ruin assumes flat betting:
+the same stake every spin until the bankroll can no longer cover it.
+That depends on the stake only through ``bankroll // stake``, so one
+table per bet type and spin count answers a whole range of stakes. Both
+are kept in bounded LRU caches, so repeated queries are lookups.
+"""
+import math
+from fractions import Fraction
+from functools import lru_cache
+from itertools import accumulate
+from operator import add, mul
+
+from config import INITIAL_BALANCE, PAYOUT_MULTIPLIERS
+from payouts import BET_KEYS, BET_MASKS, WHEEL_SIZE, bet_code
+
+BET_TYPES = ('number', 'split', 'street', 'corner', 'basket', 'sixline', 'dozen', 'column',
+             'color', 'odd', 'even', 'high', 'low')
+DEFAULT_SPINS = 100
+MAX_RUIN_SPINS = 10000
+ODDS_CACHE_SIZE = 32
+RUIN_CACHE_SIZE = 128
 
 def calculate_potential_payout(bet_type, bet_amount, bet_value=None):
     """Return the gross payout for a bet type and amount."""
     multiplier = PAYOUT_MULTIPLIERS.get(bet_type, 2)
     return bet_amount * multiplier
 
-def display_calculator():
-    """Run the interactive payout calculator menu."""
+@lru_cache(maxsize=ODDS_CACHE_SIZE)
+def bet_odds(bet_type):
+    """Return the exact odds of a bet type per $1 staked.
+
+    ``expected_value`` and ``variance`` are the mean and variance of the
+    net result of one spin; ``house_edge`` is the expected loss as a
+    fraction of the stake.
+    """
+    for key_type, value in BET_KEYS:
+        if key_type == bet_type:
+            break
+    else:
+        raise ValueError(f"unknown bet type: {bet_type}")
+    numbers = BET_MASKS[bet_code(key_type, value)].bit_count()
+    multiplier = PAYOUT_MULTIPLIERS[bet_type]
+    win_probability = Fraction(numbers, WHEEL_SIZE)
+    expected_value = win_probability * multiplier - 1
+    variance = win_probability * multiplier ** 2 - (expected_value + 1) ** 2
+    return {
+        'numbers': numbers,
+        'multiplier': multiplier,
+        'win_probability': win_probability,
+        'expected_value': expected_value,
+        'variance': variance,
+        'house_edge': -expected_value
+    }
+
+@lru_cache(maxsize=RUIN_CACHE_SIZE)
+def _ruin_table(numbers, multiplier, spins, units):
+    """Return the chance of ruin within ``spins`` from 0 to ``units`` stakes.
+
+    In stake units a session is a walk that steps down by one on a loss
+    and up by ``multiplier - 1`` on a win, ruined on first reaching
+    ``-units``. Because it only ever steps down by one, the hitting time
+    theorem gives ``P(ruin at spin t) = units / t * P(walk at -units
+    after t spins)``, and a walk at ``-u`` after ``t`` spins has exactly
+    ``(t - u) / multiplier`` wins. For a fixed win count each term follows
+    from the one before by the ratio ``(u + 1) / u * loss * t / (t + 1 -
+    wins)``, so after one log-gamma evaluation a whole run of terms is a
+    running product over precomputed lists, added into the table slice.
+    """
+    log_win = math.log(numbers / WHEEL_SIZE)
+    log_loss = math.log(1 - numbers / WHEEL_SIZE)
+    counts = [float(n) for n in range(spins + 1)]
+    loss_over = [0.0] + [(1 - numbers / WHEEL_SIZE) / n for n in range(1, spins + 1)]
+    ruin = [1.0] + [0.0] * units
+    for wins in range((spins - 1) // multiplier + 1):
+        offset = multiplier * wins
+        last = min(units, spins - offset)
+        t = offset + 1
+        first = math.exp(math.lgamma(t + 1) - math.lgamma(wins + 1) - math.lgamma(t - wins + 1)
+                         + wins * log_win + (t - wins) * log_loss) / t
+        steps = map(mul, counts[t:offset + last], loss_over[t + 1 - wins:offset + last + 1 - wins])
+        paths = accumulate(steps, mul, initial=first)
+        ruin[1:last + 1] = map(add, ruin[1:last + 1], map(mul, paths, counts[1:last + 1]))
+    return tuple(min(1.0, p) for p in ruin)
+
+def _table_units(units, spins):
+    """Round a unit count up to a power of two so nearby bankrolls share a table."""
+    return min(1 << max(0, units - 1).bit_length(), spins)
+
+def _ruin_lookup(bet_type, spins, units):
+    """Return a cached ruin table covering bankrolls of up to ``units`` stakes.
+
+    Losing ``u`` stakes takes at least ``u`` spins, so the table never
+    needs more than ``spins`` entries; bankrolls past its end cannot be
+    lost within ``spins``. When even the smallest bankroll asked about is
+    out of reach the table is skipped and ``()`` returned.
+    """
+    if not 0 < spins <= MAX_RUIN_SPINS:
+        raise ValueError(f"spins must be between 1 and {MAX_RUIN_SPINS}")
+    if units > spins:
+        return ()
+    odds = bet_odds(bet_type)
+    return _ruin_table(odds['numbers'], odds['multiplier'], spins, _table_units(units, spins))
+
+def stake_table(bet_type, stakes, bankroll=INITIAL_BALANCE, spins=DEFAULT_SPINS):
+    """Return the exact odds of flat betting each of ``stakes`` from ``bankroll``.
+
+    Each row holds the stake, its payout and profit on a win, the win
+    probability, the expected value, variance and standard deviation of
+    one spin, the house edge and the risk of ruin within ``spins``.
+    """
+    stakes = list(stakes)
+    if any(stake <= 0 for stake in stakes):
+        raise ValueError("stakes must be positive")
+    if bankroll < 0:
+        raise ValueError("bankroll cannot be negative")
+    odds = bet_odds(bet_type)
+    ruin = ()
+    if stakes:
+        # Only stakes whose bankroll can be lost within ``spins`` need a table.
+        reachable = [bankroll // stake for stake in stakes if bankroll // stake <= spins]
+        ruin = _ruin_lookup(bet_type, spins, max(reachable) if reachable else spins + 1)
+    multiplier = odds['multiplier']
+    win_probability = float(odds['win_probability'])
+    expected_value = float(odds['expected_value'])
+    variance = float(odds['variance'])
+    std_dev = math.sqrt(variance)
+    house_edge = float(odds['house_edge'])
+    return [
+        {
+            'stake': stake,
+            'payout': stake * multiplier,
+            'profit': stake * (multiplier - 1),
+            'win_probability': win_probability,
+            'expected_value': expected_value * stake,
+            'variance': variance * stake * stake,
+            'std_dev': std_dev * stake,
+            'house_edge': house_edge,
+            'risk_of_ruin': ruin[bankroll // stake] if bankroll // stake < len(ruin) else 0.0
+        }
+        for stake in stakes
+    ]
+
+def calculate_odds(bet_type, stake, bankroll=INITIAL_BALANCE, spins=DEFAULT_SPINS):
+    """Return the ``stake_table`` row of a single stake."""
+    return stake_table(bet_type, [stake], bankroll, spins)[0]
+
+def risk_of_ruin(bet_type, stake, bankroll=INITIAL_BALANCE, spins=DEFAULT_SPINS):
+    """Return the chance that flat betting ``stake`` loses ``bankroll`` within ``spins``."""
+    return calculate_odds(bet_type, stake, bankroll, spins)['risk_of_ruin']
+
+def clear_cache():
+    """Drop every memoized odds and risk of ruin table."""
+    bet_odds.cache_clear()
+    _ruin_table.cache_clear()
+
+def _ask_int(ask, prompt, default):
+    text = ask(prompt).strip()
+    return int(text) if text else default
+
+def _display_odds(row, bankroll, spins):
+    print(f"potential payout: ${row['payout']}")
+    print(f"potential profit: ${row['profit']}")
+    print(f"win chance: {row['win_probability'] * 100:.2f}%")
+    print(f"expected result: {row['expected_value']:+.2f} per spin (std dev {row['std_dev']:.2f})")
+    print(f"house edge: {row['house_edge'] * 100:.2f}% of every bet")
+    print(f"risk of ruin with ${bankroll} over {spins} spins: {row['risk_of_ruin'] * 100:.2f}%")
+
+def display_calculator(ask=input):
+    """Run the interactive odds calculator menu."""
     from utils import display_separator
     
     while True:
         display_separator()
         print("betting calculator")
         display_separator()
-        print("calculate potential payout for different bet types")
+        print("calculate the odds, expected result and risk of ruin of a bet")
         print("\nbet types:")
         print("1. number (0-36) - payout: 36x")
         print("2. color (red/black) - payout: 2x")
         print("3. odd/even - payout: 2x")
         print("4. high/low - payout: 2x")
+        print("g. split, street, corner, six line, dozen, column or basket")
+        print("c. compare every bet type")
         print("5. back to main menu")
         
-        choice = input("\nselect bet type (1-5): ").strip()
+        choice = ask("\nselect bet type (1-5, g, c): ").strip().lower()
         
         if choice == "5":
             break
         
-        if choice not in ["1", "2", "3", "4"]:
+        if choice not in ["1", "2", "3", "4", "g", "c"]:
             print("invalid choice")
             continue
         
         try:
-            amount = int(input("enter bet amount: ").strip())
+            amount = int(ask("enter bet amount: ").strip())
             if amount <= 0:
                 print("bet amount must be positive")
                 continue
+            bankroll = _ask_int(ask, f"enter bankroll (default ${INITIAL_BALANCE}): ", INITIAL_BALANCE)
+            spins = _ask_int(ask, f"enter spins to play (default {DEFAULT_SPINS}): ", DEFAULT_SPINS)
+            if bankroll < 0:
+                print("bankroll cannot be negative")
+                continue
+            if not 0 < spins <= MAX_RUIN_SPINS:
+                print(f"spins must be between 1 and {MAX_RUIN_SPINS}")
+                continue
         except ValueError:
-            print("invalid bet amount")
+            print("invalid amount")
+            continue
+        
+        if choice == "c":
+            compare_bet_types(amount, bankroll, spins)
+            ask("press enter to continue...")
             continue
         
+        bet_value = None
         if choice == "1":
             bet_type = "number"
             try:
-                number = int(input("enter number (0-36): ").strip())
+                number = int(ask("enter number (0-36): ").strip())
                 if number < 0 or number > 36:
                     print("number must be between 0 and 36")
                     continue
@@ -52,26 +232,28 @@ def display_calculator():
                 continue
         elif choice == "2":
             bet_type = "color"
-            color = input("enter color (red/black): ").strip().lower()
+            color = ask("enter color (red/black): ").strip().lower()
             if color not in ["red", "black"]:
                 print("color must be red or black")
                 continue
             bet_value = color
         elif choice == "3":
-            bet_type = input("enter odd or even: ").strip().lower()
+            bet_type = ask("enter odd or even: ").strip().lower()
             if bet_type not in ["odd", "even"]:
                 print("must be odd or even")
                 continue
-            bet_value = None
         elif choice == "4":
-            bet_type = input("enter high or low: ").strip().lower()
+            bet_type = ask("enter high or low: ").strip().lower()
             if bet_type not in ["high", "low"]:
                 print("must be high or low")
                 continue
-            bet_value = None
+        else:
+            bet_type = ask("enter split, street, corner, sixline, dozen, column or basket: ").strip().lower()
+            if bet_type not in BET_TYPES[1:8]:
+                print("unknown bet type")
+                continue
         
-        payout = calculate_potential_payout(bet_type, amount, bet_value)
-        profit = payout - amount
+        row = calculate_odds(bet_type, amount, bankroll, spins)
         
         display_separator()
         print("calculation results:")
@@ -81,35 +263,27 @@ def display_calculator():
         if bet_value is not None:
             bet_desc += f" ({bet_value})"
         print(f"bet type: {bet_desc}")
-        print(f"potential payout: ${payout}")
-        print(f"potential profit: ${profit}")
-        print(f"roi: {(profit/amount)*100:.1f}%")
+        _display_odds(row, bankroll, spins)
         display_separator()
         
-        input("press enter to continue...")
+        ask("press enter to continue...")
 
-def compare_bet_types(amount):
-    """Print payout and ROI comparisons for each supported bet category."""
+def compare_bet_types(amount, bankroll=INITIAL_BALANCE, spins=DEFAULT_SPINS):
+    """Print the odds of every bet type at one stake side by side."""
     from utils import display_separator
     
     display_separator()
-    print("bet type comparison (bet amount: ${})".format(amount))
+    print(f"bet type comparison (bet amount: ${amount}, bankroll: ${bankroll}, {spins} spins)")
     display_separator()
     
-    bet_types = [
-        ("number", "36x", 36),
-        ("color", "2x", 2),
-        ("odd/even", "2x", 2),
-        ("high/low", "2x", 2)
-    ]
-    
-    print(f"{'bet type':<15} {'multiplier':<12} {'payout':<12} {'profit':<12} {'roi':<10}")
+    print(f"{'bet type':<10} {'payout':<9} {'win chance':<11} {'expected':<10} {'std dev':<9} ruin")
     print("-" * 60)
     
-    for bet_type, mult_str, multiplier in bet_types:
-        payout = amount * multiplier
-        profit = payout - amount
-        roi = (profit / amount) * 100
-        print(f"{bet_type:<15} {mult_str:<12} ${payout:<11} ${profit:<11} {roi:.1f}%")
+    for bet_type in BET_TYPES:
+        row = calculate_odds(bet_type, amount, bankroll, spins)
+        win_chance = f"{row['win_probability'] * 100:.2f}%"
+        print(f"{bet_type:<10} ${row['payout']:<8} {win_chance:<11} "
+              f"{row['expected_value']:<+10.2f} {row['std_dev']:<9.2f} {row['risk_of_ruin'] * 100:.2f}%")
     
+    print(f"\nhouse edge: {float(bet_odds('number')['house_edge']) * 100:.2f}% on every bet type")
     display_separator()
@@ -3,6 +3,7 @@ MAXIMUM_BET = 10000
 INITIAL_BALANCE = 1000
 LOW_BALANCE_WARNING = 100
 CRITICAL_BALANCE_WARNING = 50
+HOT_COLD_WINDOW = 50
 
 RED_NUMBERS = [1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36]
 BLACK_NUMBERS = [2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35]
@@ -21,7 +22,13 @@ PAYOUT_MULTIPLIERS = {
     'even': 2,
     'high': 2,
     'low': 2,
-    'dozen': 3
+    'split': 18,
+    'street': 12,
+    'corner': 9,
+    'sixline': 6,
+    'dozen': 3,
+    'column': 3,
+    'basket': 9
 }
 
 
@@ -0,0 +1,183 @@
+"""Columnar storage for resolved bet history."""
+import mmap
+import struct
+from array import array
+from collections.abc import Sequence
+
+from payouts import BET_KEYS, bet_code
+
+# One saved bet: key code, amount, winning number, won flag, payout.
+HISTORY_RECORD = struct.Struct('<HqBBq')
+
+class RecordedBet:
+    """Minimal bet record rebuilt from stored history."""
+
+    __slots__ = ('bet_type', 'value', 'amount', 'code')
+
+    def __init__(self, bet_type, value, amount):
+        self.bet_type = bet_type
+        self.value = value
+        self.amount = amount
+        self.code = bet_code(bet_type, value)
+
+def _hashable(value):
+    """Return a hashable form of a bet value (JSON turns tuples into lists)."""
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+class BetHistory(Sequence):
+    """Store resolved bets in typed columns instead of per-bet dicts.
+
+    Each bet costs 20 bytes: a 2-byte interned (bet_type, value) key, an
+    8-byte amount, a 1-byte winning number, a 1-byte won flag and an 8-byte
+    payout. Indexing, slicing and iteration yield the same
+    ``{'bet', 'winning_number', 'won', 'payout'}`` dicts as the old list.
+    """
+
+    def __init__(self):
+        self._keys = list(BET_KEYS)
+        self._key_index = {key: i for i, key in enumerate(self._keys)}
+        self.key_codes = array('H')
+        self.amounts = array('q')
+        self.winning_numbers = array('B')
+        self.won_flags = array('B')
+        self.payouts = array('q')
+        self.max_amount = 0
+        self.trailing_wins = 0
+        self.saved_count = 0
+
+    def _intern(self, bet_type, value):
+        key = (bet_type, _hashable(value))
+        index = self._key_index.get(key)
+        if index is None:
+            index = len(self._keys)
+            self._keys.append(key)
+            self._key_index[key] = index
+        return index
+
+    def append(self, bet, winning_number, won, payout):
+        """Record one resolved bet."""
+        self.key_codes.append(self._intern(bet.bet_type, bet.value))
+        self.amounts.append(bet.amount)
+        self.winning_numbers.append(winning_number)
+        self.won_flags.append(won)
+        self.payouts.append(payout)
+        if bet.amount > self.max_amount:
+            self.max_amount = bet.amount
+        self.trailing_wins = self.trailing_wins + 1 if won else 0
+
+    def keys(self):
+        """Return the interned ``(bet_type, value)`` table in code order."""
+        return list(self._keys)
+
+    def bet_key(self, code):
+        """Return the ``(bet_type, value)`` pair interned under ``code``."""
+        return self._keys[code]
+
+    def row(self, index):
+        """Return ``(code, amount, winning_number, won, payout)`` at ``index``."""
+        return (self.key_codes[index], self.amounts[index], self.winning_numbers[index],
+                self.won_flags[index], self.payouts[index])
+
+    def columns(self, start, end):
+        """Return the five column slices covering ``start:end``."""
+        return (self.key_codes[start:end], self.amounts[start:end], self.winning_numbers[start:end],
+                self.won_flags[start:end], self.payouts[start:end])
+
+    def bet_at(self, index):
+        """Return the ``RecordedBet`` stored at ``index``."""
+        code, amount = self.row(index)[:2]
+        bet_type, value = self._keys[code]
+        return RecordedBet(bet_type, value, amount)
+
+    def _entry(self, index):
+        code, amount, winning_number, won, payout = self.row(index)
+        bet_type, value = self._keys[code]
+        return {
+            'bet': RecordedBet(bet_type, value, amount),
+            'winning_number': winning_number,
+            'won': bool(won),
+            'payout': payout
+        }
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("bet history index out of range")
+        return self._entry(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._entry(i)
+
+    def nbytes(self):
+        """Return the bytes held by the history columns."""
+        columns = (self.key_codes, self.amounts, self.winning_numbers, self.won_flags, self.payouts)
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def close(self):
+        """Release any file the history reads from; in-memory history holds none."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class PagedBetHistory(BetHistory):
+    """Bet history whose saved prefix stays on disk until it is read.
+
+    The first ``saved_count`` bets are served from a memory-mapped file of
+    ``HISTORY_RECORD`` rows; bets added after loading go to the in-memory
+    columns. Opening costs the same regardless of how many bets were saved.
+    ``close()``, or leaving a ``with`` block, releases the mapping.
+    """
+
+    def __init__(self, filename, count, keys, max_amount=0, trailing_wins=0):
+        super().__init__()
+        self._keys = [(bet_type, _hashable(value)) for bet_type, value in keys]
+        self._key_index = {key: i for i, key in enumerate(self._keys)}
+        self.saved_count = count
+        self.paged_count = count
+        self.max_amount = max_amount
+        self.trailing_wins = trailing_wins
+        self._map = None
+        if count:
+            with open(filename, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(self._map) < count * HISTORY_RECORD.size:
+                self.close()
+                raise ValueError("bet history file is shorter than the save")
+
+    def close(self):
+        """Unmap the saved history file; the saved rows are unreadable afterwards."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __len__(self):
+        return self.paged_count + len(self.amounts)
+
+    def row(self, index):
+        if index < self.paged_count:
+            return HISTORY_RECORD.unpack_from(self._map, index * HISTORY_RECORD.size)
+        return super().row(index - self.paged_count)
+
+    def columns(self, start, end):
+        paged_end = min(end, self.paged_count)
+        if start >= paged_end:
+            return super().columns(start - self.paged_count, end - self.paged_count)
+        size = HISTORY_RECORD.size
+        rows = HISTORY_RECORD.iter_unpack(self._map[start * size:paged_end * size])
+        paged = [list(column) for column in zip(*rows)]
+        if end > paged_end:
+            tail = super().columns(0, end - self.paged_count)
+            paged = [column + list(rest) for column, rest in zip(paged, tail)]
+        return tuple(paged)
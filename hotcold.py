@@ -0,0 +1,61 @@
+"""Incremental hot/cold wheel number tracking."""
+from collections import deque
+
+from config import HOT_COLD_WINDOW
+from payouts import WHEEL_SIZE
+
+class NumberTracker:
+    """Count wheel results all-time and over a sliding window of recent spins.
+
+    Recording a spin is O(1); queries rank the 37 per-number counters and
+    never look at bet history. Each spin is counted once, however many
+    bets were resolved against it.
+    """
+
+    def __init__(self, window=HOT_COLD_WINDOW):
+        self.window = window
+        self.total = 0
+        self.counts = [0] * WHEEL_SIZE
+        self.recent = deque()
+        self.recent_counts = [0] * WHEEL_SIZE
+
+    def record(self, number):
+        """Count one spin result."""
+        self.total += 1
+        self.counts[number] += 1
+        self.recent.append(number)
+        self.recent_counts[number] += 1
+        if len(self.recent) > self.window:
+            self.recent_counts[self.recent.popleft()] -= 1
+
+    def _counts(self, recent):
+        return self.recent_counts if recent else self.counts
+
+    def hot(self, k=5, recent=False):
+        """Return up to ``k`` (number, count) pairs, most frequent first."""
+        counts = self._counts(recent)
+        seen = [(n, c) for n, c in enumerate(counts) if c > 0]
+        return sorted(seen, key=lambda x: (-x[1], x[0]))[:k]
+
+    def cold(self, k=5, recent=False):
+        """Return up to ``k`` (number, count) pairs that appeared least often."""
+        counts = self._counts(recent)
+        seen = [(n, c) for n, c in enumerate(counts) if c > 0]
+        return sorted(seen, key=lambda x: (x[1], x[0]))[:k]
+
+    def never_seen(self, recent=False):
+        """Return the wheel numbers that have not appeared."""
+        return [n for n, c in enumerate(self._counts(recent)) if c == 0]
+
+    def to_dict(self):
+        return {'window': self.window, 'counts': self.counts, 'recent': list(self.recent)}
+
+    @classmethod
+    def from_dict(cls, data):
+        tracker = cls(data.get('window', HOT_COLD_WINDOW))
+        tracker.counts = list(data.get('counts', tracker.counts))
+        tracker.total = sum(tracker.counts)
+        for number in data.get('recent', []):
+            tracker.recent.append(number)
+            tracker.recent_counts[number] += 1
+        return tracker
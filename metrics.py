@@ -0,0 +1,94 @@
+"""Opt-in instrumentation for the game loop and headless modes.
+
+Instrumented code reads the module-level ``recorder`` and does nothing
+more than that ``is None`` check while metrics are off. ``enable()``
+installs a ``Metrics`` recorder that accumulates per-phase timings and
+counters, exportable as Prometheus text or a JSON snapshot.
+"""
+import os
+
+PHASES = ('input', 'spin', 'resolve', 'history', 'achievements', 'journal', 'save', 'session')
+COUNTERS = ('spins', 'sessions', 'saves', 'save_bytes', 'journal_records', 'journal_bytes')
+
+recorder = None
+
+class Metrics:
+    """Accumulate phase timings and event counters."""
+
+    def __init__(self):
+        self.phase_calls = dict.fromkeys(PHASES, 0)
+        self.phase_seconds = dict.fromkeys(PHASES, 0.0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.bets = {}
+
+    def observe(self, phase, seconds):
+        """Add one timed call of ``phase``."""
+        self.phase_calls[phase] = self.phase_calls.get(phase, 0) + 1
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def count_bets(self, bet_type, amount, payout, bets=1):
+        """Add ``bets`` resolved bets of one type with their wager and payout totals."""
+        totals = self.bets.get(bet_type)
+        if totals is None:
+            totals = self.bets[bet_type] = {'bets': 0, 'wagered': 0, 'paid': 0}
+        totals['bets'] += bets
+        totals['wagered'] += amount
+        totals['paid'] += payout
+
+    def to_dict(self):
+        """Return a JSON-ready snapshot of every metric."""
+        return {
+            'phases': {
+                phase: {'calls': calls, 'seconds': self.phase_seconds[phase]}
+                for phase, calls in self.phase_calls.items()
+            },
+            'counters': dict(self.counters),
+            'bets': {bet_type: dict(totals) for bet_type, totals in self.bets.items()},
+            'wagered': sum(totals['wagered'] for totals in self.bets.values()),
+            'paid': sum(totals['paid'] for totals in self.bets.values())
+        }
+
+    def to_prometheus(self):
+        """Return the metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP roulette_phase_seconds_total time spent in each game loop phase",
+            "# TYPE roulette_phase_seconds_total counter"
+        ]
+        lines += [f'roulette_phase_seconds_total{{phase="{p}"}} {s:.9f}' for p, s in self.phase_seconds.items()]
+        lines += ["# TYPE roulette_phase_calls_total counter"]
+        lines += [f'roulette_phase_calls_total{{phase="{p}"}} {c}' for p, c in self.phase_calls.items()]
+        for name, value in self.counters.items():
+            lines += [f"# TYPE roulette_{name}_total counter", f"roulette_{name}_total {value}"]
+        for field in ('bets', 'wagered', 'paid'):
+            lines.append(f"# TYPE roulette_{field}_total counter")
+            lines += [
+                f'roulette_{field}_total{{bet_type="{bet_type}"}} {totals[field]}'
+                for bet_type, totals in sorted(self.bets.items())
+            ]
+        return "\n".join(lines) + "\n"
+
+def enable():
+    """Install and return a fresh recorder."""
+    global recorder
+    recorder = Metrics()
+    return recorder
+
+def disable():
+    global recorder
+    recorder = None
+
+def write_metrics(filename, metrics=None):
+    """Atomically write metrics as JSON (``.json``) or Prometheus text."""
+    metrics = metrics or recorder
+    if filename.endswith(".json"):
+        import json
+        text = json.dumps(metrics.to_dict(), indent=2) + "\n"
+    else:
+        text = metrics.to_prometheus()
+    temp_file = filename + ".tmp"
+    with open(temp_file, 'w') as f:
+        f.write(text)
+    os.replace(temp_file, filename)
@@ -0,0 +1,252 @@
+"""Adaptive parameter sweep over strategy configurations.
+
+A configuration is a strategy with a base amount, bankroll, optional
+stop-loss and take-profit amounts and the strategy's own parameters
+(``loss_threshold`` for conservative, ``length`` for fibonacci). Every
+configuration plays the same seeded sessions, so they are compared on
+common random numbers. Sessions are played in rounds; after each round a
+configuration whose confidence interval lies entirely below the best
+lower bound is dropped. Finished sessions are cached on disk by
+configuration, seed and session index, so a rerun or a refinement with
+more sessions or more grid values only plays what is new.
+"""
+import json
+import math
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+from config import INITIAL_BALANCE, MINIMUM_BET
+from sessions import run_session, session_seed
+from strategies import STRATEGIES
+
+OBJECTIVES = ('survival', 'median_profit', 'target_hit')
+STRATEGY_PARAMETERS = {
+    'conservative': 'loss_threshold',
+    'fibonacci': 'length',
+}
+CACHE_FILE = "optimizer_cache.jsonl"
+DEFAULT_BATCH = 200
+DEFAULT_MAX_SESSIONS = 2000
+DEFAULT_CONFIDENCE = 0.95
+
+def build_configs(strategies=None, base_amounts=(MINIMUM_BET,), bankrolls=(INITIAL_BALANCE,),
+                  stop_losses=(None,), take_profits=(None,), loss_thresholds=(3,), fib_lengths=(12,)):
+    """Return every configuration of the grid as a dict.
+
+    Strategy parameters are only varied for the strategy that takes them.
+    """
+    if strategies is None:
+        strategies = list(STRATEGIES)
+    values = {'loss_threshold': loss_thresholds, 'length': fib_lengths}
+    configs = []
+    for strategy_name in strategies:
+        parameter = STRATEGY_PARAMETERS.get(strategy_name)
+        options = [{}] if parameter is None else [{parameter: value} for value in values[parameter]]
+        for base_amount, bankroll, stop_loss, take_profit, strategy_options in product(
+            base_amounts, bankrolls, stop_losses, take_profits, options
+        ):
+            configs.append({
+                'strategy': strategy_name,
+                'base_amount': base_amount,
+                'bankroll': bankroll,
+                'stop_loss': stop_loss,
+                'take_profit': take_profit,
+                'options': strategy_options
+            })
+    return configs
+
+def config_key(config, spins, seed):
+    """Return the cache key of a configuration's sessions."""
+    return json.dumps([config, spins, seed], sort_keys=True, separators=(',', ':'))
+
+def _play(task):
+    """Play sessions ``start:stop`` of one configuration.
+
+    Each outcome is ``[profit, ruined, reached_target]``.
+    """
+    config, spins, seed, start, stop = task
+    bankroll = config['bankroll']
+    target = None if config['take_profit'] is None else bankroll + config['take_profit']
+    stop_loss = None if config['stop_loss'] is None else bankroll - config['stop_loss']
+    outcomes = []
+    for index in range(start, stop):
+        result = run_session(
+            config['strategy'],
+            bankroll=bankroll,
+            spins=spins,
+            seed=session_seed(seed, index),
+            base_amount=config['base_amount'],
+            target=target,
+            stop_loss=stop_loss,
+            strategy_options=config['options']
+        )
+        outcomes.append([result['final_balance'] - bankroll, result['ruined'], result['reached_target']])
+    return outcomes
+
+class EvaluationCache:
+    """Session outcomes per configuration, appended to a JSON lines file."""
+
+    def __init__(self, filename=CACHE_FILE):
+        self.filename = filename
+        self.outcomes = {}
+        if filename is not None and os.path.exists(filename):
+            with open(filename, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    cached = self.outcomes.setdefault(entry['key'], [])
+                    if entry['start'] == len(cached):
+                        cached.extend(entry['outcomes'])
+
+    def get(self, key):
+        return self.outcomes.get(key, [])
+
+    def add(self, key, start, outcomes):
+        """Record outcomes of sessions from index ``start`` on."""
+        cached = self.outcomes.setdefault(key, [])
+        if start != len(cached):
+            return
+        cached.extend(outcomes)
+        if self.filename is not None:
+            with open(self.filename, 'a') as f:
+                f.write(json.dumps({'key': key, 'start': start, 'outcomes': outcomes},
+                                   separators=(',', ':')) + "\n")
+
+def _z_score(confidence):
+    return statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+
+def _wilson(successes, n, z):
+    """Return the Wilson score interval of a proportion."""
+    p = successes / n
+    center = (p + z * z / (2 * n)) / (1 + z * z / n)
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+    return max(0.0, center - half), min(1.0, center + half)
+
+def evaluate(outcomes, objective, z):
+    """Return ``(estimate, ci_low, ci_high)`` of an objective over outcomes.
+
+    Proportions use the Wilson interval; the median uses the order
+    statistics around it that cover the median at the same confidence.
+    """
+    n = len(outcomes)
+    if objective == "median_profit":
+        profits = sorted(profit for profit, _, _ in outcomes)
+        spread = z * math.sqrt(n) / 2
+        low = max(0, math.floor(n / 2 - spread))
+        high = min(n - 1, math.ceil(n / 2 + spread) - 1)
+        return statistics.median(profits), profits[low], profits[high]
+    if objective == "survival":
+        successes = sum(1 for _, ruined, _ in outcomes if not ruined)
+    else:
+        successes = sum(1 for _, _, reached in outcomes if reached)
+    return (successes / n, *_wilson(successes, n, z))
+
+def _summarize(config, outcomes, objective, z, eliminated):
+    estimate, ci_low, ci_high = evaluate(outcomes, objective, z)
+    n = len(outcomes)
+    return {
+        **config,
+        'sessions': n,
+        'objective': objective,
+        'estimate': estimate,
+        'ci_low': ci_low,
+        'ci_high': ci_high,
+        'survival': sum(1 for _, ruined, _ in outcomes if not ruined) / n,
+        'median_profit': statistics.median(profit for profit, _, _ in outcomes),
+        'target_hit': sum(1 for _, _, reached in outcomes if reached) / n,
+        'eliminated': eliminated
+    }
+
+def optimize(configs, objective="survival", spins=1000, seed=0, batch=DEFAULT_BATCH,
+             max_sessions=DEFAULT_MAX_SESSIONS, confidence=DEFAULT_CONFIDENCE,
+             cache_file=CACHE_FILE, workers=None):
+    """Race ``configs`` on ``objective`` and return rows ranked best first.
+
+    Every round plays up to ``batch`` more sessions per remaining
+    configuration, then drops those whose interval's upper bound is below
+    the best lower bound; ``eliminated`` holds the session count at which
+    a row was dropped. Rows that lasted longer rank first, then by
+    estimate. ``cache_file=None`` keeps outcomes in memory only;
+    ``workers`` defaults to every core and ``workers=1`` plays everything
+    in-process.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"unknown objective: {objective}")
+    if batch < 1 or max_sessions < 1:
+        raise ValueError("batch and max sessions must be positive")
+    z = _z_score(confidence)
+    cache = EvaluationCache(cache_file)
+    keys = [config_key(config, spins, seed) for config in configs]
+    alive = list(range(len(configs)))
+    eliminated = {}
+    sessions = 0
+    if workers is None:
+        workers = os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while alive and sessions < max_sessions:
+            sessions = min(sessions + batch, max_sessions)
+            tasks = []
+            for i in alive:
+                played = len(cache.get(keys[i]))
+                if played < sessions:
+                    tasks.append((i, played, (configs[i], spins, seed, played, sessions)))
+            play = executor.map if executor is not None else map
+            for (i, start, _), outcomes in zip(tasks, play(_play, [task for _, _, task in tasks])):
+                cache.add(keys[i], start, outcomes)
+
+            scores = {i: evaluate(cache.get(keys[i])[:sessions], objective, z) for i in alive}
+            best_low = max(low for _, low, _ in scores.values())
+            for i in alive:
+                if scores[i][2] < best_low:
+                    eliminated[i] = sessions
+            alive = [i for i in alive if i not in eliminated]
+            if len(alive) == 1:
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    rows = []
+    for i, config in enumerate(configs):
+        played = eliminated.get(i, sessions)
+        rows.append(_summarize(config, cache.get(keys[i])[:played], objective, z, i in eliminated))
+    rows.sort(key=lambda row: (-row['sessions'], -row['estimate'], -row['ci_low']))
+    return rows
+
+def _format_config(row):
+    parts = [row['strategy'], f"base {row['base_amount']}", f"bank {row['bankroll']}"]
+    if row['stop_loss'] is not None:
+        parts.append(f"sl {row['stop_loss']}")
+    if row['take_profit'] is not None:
+        parts.append(f"tp {row['take_profit']}")
+    parts += [f"{name} {value}" for name, value in row['options'].items()]
+    return " ".join(parts)
+
+def display_optimization(rows, limit=10):
+    """Print the top ``limit`` configurations with their intervals."""
+    from utils import display_separator
+
+    if not rows:
+        print("no configurations to rank")
+        return
+    objective = rows[0]['objective']
+    percent = objective != "median_profit"
+
+    def fmt(value):
+        return f"{value * 100:.1f}%" if percent else f"{value:+.0f}"
+
+    display_separator()
+    print(f"strategy optimizer ({objective}):")
+    display_separator()
+    print(f"{'#':<4}{'configuration':<58}{'estimate':>10}{'interval':>20}{'sessions':>10}")
+    for i, row in enumerate(rows[:limit], 1):
+        interval = f"{fmt(row['ci_low'])} - {fmt(row['ci_high'])}"
+        print(f"{i:<4}{_format_config(row):<58}{fmt(row['estimate']):>10}{interval:>20}{row['sessions']:>10}")
+    dropped = sum(1 for row in rows if row['eliminated'])
+    print(f"{len(rows)} configurations, {dropped} dropped early")
+    display_separator()
@@ -0,0 +1,106 @@
+"""Coverage masks and precomputed payout tables for every supported bet.
+
+Each bet key covers a set of wheel numbers, kept as a 37-bit mask with
+bit ``n`` set when the bet wins on ``n``. Whether a bet wins is one bit
+test, the masks of a slip can be OR-ed to see what it covers, and the
+payout table is derived from the masks so resolving a payout stays a
+single lookup. New bet types only need a multiplier and their keys.
+"""
+from config import BLACK_NUMBERS, PAYOUT_MULTIPLIERS, RED_NUMBERS
+
+WHEEL_SIZE = 37
+
+NUMBER_COLORS = tuple(
+    "green" if n == 0 else "red" if n in RED_NUMBERS else "black"
+    for n in range(WHEEL_SIZE)
+)
+
+# Bets whose value is ignored; every other bet type needs one.
+VALUELESS_BETS = frozenset(("odd", "even", "high", "low", "basket"))
+
+def number_mask(numbers):
+    """Return the coverage mask of an iterable of wheel numbers."""
+    mask = 0
+    for number in numbers:
+        mask |= 1 << number
+    return mask
+
+def mask_numbers(mask):
+    """Return the wheel numbers set in a coverage mask."""
+    return [n for n in range(WHEEL_SIZE) if mask >> n & 1]
+
+def _layout_bets():
+    """Return ``(bet_type, value, numbers)`` for every bet on the table layout.
+
+    The layout has twelve rows of three (1-2-3 up to 34-35-36). Splits and
+    corners are valued by the numbers they cover, streets, six lines and
+    dozens by their first and last number, columns by 1 to 3.
+    """
+    bets = [("number", n, [n]) for n in range(WHEEL_SIZE)]
+    bets += [("color", "red", RED_NUMBERS), ("color", "black", BLACK_NUMBERS)]
+    bets += [
+        ("odd", None, range(1, WHEEL_SIZE, 2)),
+        ("even", None, range(2, WHEEL_SIZE, 2)),
+        ("high", None, range(19, WHEEL_SIZE)),
+        ("low", None, range(1, 19)),
+    ]
+    bets += [("split", (0, n), (0, n)) for n in (1, 2, 3)]
+    bets += [("split", (n, n + 1), (n, n + 1)) for n in range(1, WHEEL_SIZE - 1) if n % 3 != 0]
+    bets += [("split", (n, n + 3), (n, n + 3)) for n in range(1, WHEEL_SIZE - 3)]
+    bets += [("street", (n, n + 2), range(n, n + 3)) for n in range(1, WHEEL_SIZE, 3)]
+    bets += [
+        ("corner", (n, n + 1, n + 3, n + 4), (n, n + 1, n + 3, n + 4))
+        for n in range(1, WHEEL_SIZE - 4) if n % 3 != 0
+    ]
+    bets += [("sixline", (n, n + 5), range(n, n + 6)) for n in range(1, WHEEL_SIZE - 3, 3)]
+    bets += [("dozen", (n, n + 11), range(n, n + 12)) for n in (1, 13, 25)]
+    bets += [("column", c, range(c, WHEEL_SIZE, 3)) for c in (1, 2, 3)]
+    bets += [("basket", None, (0, 1, 2, 3))]
+    return bets
+
+_LAYOUT_BETS = _layout_bets()
+
+BET_KEYS = tuple((bet_type, value) for bet_type, value, _ in _LAYOUT_BETS)
+
+# Indexed by bet code; the extra last entry is the losing unresolved bet.
+BET_MASKS = tuple(number_mask(numbers) for _, _, numbers in _LAYOUT_BETS) + (0,)
+BET_MULTIPLIERS = tuple(PAYOUT_MULTIPLIERS[bet_type] for bet_type, _ in BET_KEYS) + (0,)
+
+def _build_payout_table():
+    """Build one row of payout multipliers per bet code from its mask."""
+    return tuple(
+        tuple(multiplier if mask >> n & 1 else 0 for n in range(WHEEL_SIZE))
+        for mask, multiplier in zip(BET_MASKS, BET_MULTIPLIERS)
+    )
+
+PAYOUT_TABLE = _build_payout_table()
+BET_CODES = {key: code for code, key in enumerate(BET_KEYS)}
+UNRESOLVED_CODE = len(BET_KEYS)
+
+def bet_code(bet_type, value=None):
+    """Return the bet code (mask and payout table row) for a bet type and value.
+
+    Colors are matched case-insensitively and multi-number values in any
+    order, as lists or tuples; unknown bets map to ``UNRESOLVED_CODE``.
+    """
+    if bet_type == "color":
+        value = value.lower() if isinstance(value, str) else value
+    elif bet_type in VALUELESS_BETS:
+        value = None
+    elif isinstance(value, (list, tuple)):
+        try:
+            value = tuple(sorted(value))
+        except TypeError:
+            return UNRESOLVED_CODE
+    try:
+        return BET_CODES.get((bet_type, value), UNRESOLVED_CODE)
+    except TypeError:
+        return UNRESOLVED_CODE
+
+def bet_mask(bet_type, value=None):
+    """Return the coverage mask of a bet."""
+    return BET_MASKS[bet_code(bet_type, value)]
+
+def payout_multipliers(bet_type, value=None):
+    """Return the payout multipliers of a bet indexed by wheel number."""
+    return PAYOUT_TABLE[bet_code(bet_type, value)]
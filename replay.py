@@ -0,0 +1,228 @@
+"""Deterministic session replay from a wheel seed and a bet log.
+
+A bet log is JSONL: a header ``{"seed": ..., "balance": ...}`` followed by
+one ``{"spin": "single"|"multi", "bets": [[type, value, amount], ...]}``
+line per wheel spin and a ``{"strategy": name, "base": amount}`` line
+whenever the player changes strategy. Spins are drawn as
+``int(random() * 37)`` from ``random.Random(seed)``, which is the stream
+``BufferedWheel(seed)`` hands out for any block size, so a checkpoint
+can store the exact RNG state at its spin.
+"""
+import json
+import os
+import random
+
+from betslip import BetSlip
+from config import INITIAL_BALANCE
+from history import RecordedBet
+from payouts import WHEEL_SIZE
+from roulette import Player, calculate_payout
+from storage import load_game_state, restore_snapshot, snapshot_data, write_history
+from strategies import STRATEGIES, create_strategy
+
+DEFAULT_CHECKPOINT_INTERVAL = 1000
+CHECKPOINT_FILE = "checkpoints.jsonl"
+CHECKPOINT_HISTORY = "history.bin"
+
+_STRATEGY_KEYS = {strategy_class: name for name, strategy_class in STRATEGIES.items()}
+
+class BetLog:
+    """Append the bet log of a live session as it is played."""
+
+    def __init__(self, filename, seed, balance=INITIAL_BALANCE):
+        self.seed = seed
+        self._file = open(filename, 'w', buffering=1)
+        self._write({'seed': seed, 'balance': balance})
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, separators=(',', ':')) + "\n")
+
+    def strategy(self, strategy):
+        """Log a strategy change; ``None`` turns the strategy off."""
+        if strategy is None:
+            self._write({'strategy': None})
+        else:
+            self._write({'strategy': _STRATEGY_KEYS[type(strategy)], 'base': strategy.base_amount})
+
+    def spin(self, kind, bets):
+        """Log the bets resolved by one spin of the ``single`` or ``multi`` path."""
+        self._write({'spin': kind, 'bets': [[bet.bet_type, bet.value, bet.amount] for bet in bets]})
+
+    def close(self):
+        self._file.close()
+
+def read_bet_log(filename):
+    """Return ``(header, events)`` from a bet log file."""
+    with open(filename, 'r') as f:
+        header = json.loads(f.readline())
+        events = [json.loads(line) for line in f if line.strip()]
+    return header, events
+
+def _strategy_state(strategy):
+    if strategy is None:
+        return None
+    state = {key: value for key, value in vars(strategy).items() if key not in ('name', 'fib_sequence')}
+    return {'name': _STRATEGY_KEYS[type(strategy)], 'state': state}
+
+def _load_strategy(saved):
+    if saved is None:
+        return None
+    strategy = create_strategy(saved['name'], saved['state']['base_amount'])
+    vars(strategy).update(saved['state'])
+    return strategy
+
+def apply_spin(player, strategy, kind, bets, winning_number):
+    """Resolve one logged spin exactly as ``play_game`` does."""
+    player.subtract_balance(sum(bet.amount for bet in bets))
+    player.record_spin(winning_number)
+    if kind == "multi":
+        total_payout, payouts = BetSlip(bets).resolve(winning_number)
+        player.add_balance(total_payout)
+        for bet, payout in zip(bets, payouts):
+            player.add_bet_to_history(bet, winning_number, payout > 0, payout)
+        return
+    bet = bets[0]
+    payout = calculate_payout(bet, winning_number)
+    if payout > 0:
+        player.add_balance(payout)
+        if strategy:
+            strategy.on_win()
+    elif strategy:
+        strategy.on_loss()
+    player.add_bet_to_history(bet, winning_number, payout > 0, payout)
+    player.last_bet = bet
+
+class SessionReplay:
+    """Rebuild a logged session at any spin from periodic checkpoints.
+
+    ``build()`` replays the whole log once, writing a checkpoint every
+    ``interval`` spins into ``directory``; the bet rows of all checkpoints
+    share one history file that each checkpoint maps up to its own length.
+    ``state_at(n)`` then restores the nearest checkpoint and replays at
+    most ``interval`` spins; close the returned player's ``bet_history``
+    when done with it.
+    """
+
+    def __init__(self, log_file, directory, interval=DEFAULT_CHECKPOINT_INTERVAL):
+        self.header, self.events = read_bet_log(log_file)
+        self.directory = directory
+        self.interval = interval
+        self.checkpoint_file = os.path.join(directory, CHECKPOINT_FILE)
+        self.history_file = os.path.join(directory, CHECKPOINT_HISTORY)
+        self.spins = sum(1 for event in self.events if 'spin' in event)
+        self.offsets = []
+
+    def _apply(self, event, player, strategy, rng):
+        """Apply one log event and return the active strategy."""
+        if 'strategy' in event:
+            if event['strategy'] is None:
+                return None
+            return create_strategy(event['strategy'], event['base'])
+        bets = [RecordedBet(bet_type, value, amount) for bet_type, value, amount in event['bets']]
+        apply_spin(player, strategy, event['spin'], bets, int(rng.random() * WHEEL_SIZE))
+        return strategy
+
+    def build(self):
+        """Replay the full log and write every checkpoint; return their count."""
+        os.makedirs(self.directory, exist_ok=True)
+        player = Player(self.header.get('balance', INITIAL_BALANCE))
+        strategy = None
+        rng = random.Random(self.header['seed'])
+        self.offsets = []
+        with open(self.checkpoint_file, 'wb') as f:
+            header = {'interval': self.interval, 'spins': self.spins, 'seed': self.header['seed']}
+            f.write(json.dumps(header).encode() + b"\n")
+            self._checkpoint(f, 0, 0, player, strategy, rng)
+            spin = 0
+            for index, event in enumerate(self.events):
+                strategy = self._apply(event, player, strategy, rng)
+                if 'spin' in event:
+                    spin += 1
+                    if spin % self.interval == 0:
+                        self._checkpoint(f, spin, index + 1, player, strategy, rng)
+        return len(self.offsets)
+
+    def _checkpoint(self, f, spin, event_index, player, strategy, rng):
+        write_history(player.bet_history, self.history_file)
+        version, state, gauss = rng.getstate()
+        checkpoint = {
+            'spin': spin,
+            'event': event_index,
+            'player': snapshot_data(player),
+            'strategy': _strategy_state(strategy),
+            'rng': [version, state, gauss]
+        }
+        self.offsets.append(f.tell())
+        f.write(json.dumps(checkpoint, separators=(',', ':')).encode() + b"\n")
+
+    def open(self):
+        """Index checkpoints written by an earlier ``build()``; return False if stale."""
+        if not os.path.exists(self.checkpoint_file):
+            return False
+        self.offsets = []
+        with open(self.checkpoint_file, 'rb') as f:
+            header = json.loads(f.readline())
+            if header.get('spins') != self.spins or header.get('seed') != self.header['seed']:
+                return False
+            self.interval = header['interval']
+            offset = f.tell()
+            for line in f:
+                self.offsets.append(offset)
+                offset += len(line)
+        return True
+
+    def state_at(self, spin):
+        """Return ``(player, strategy)`` right after ``spin`` spins were resolved."""
+        if not 0 <= spin <= self.spins:
+            raise ValueError(f"spin must be between 0 and {self.spins}")
+        if not self.offsets and not self.open():
+            self.build()
+        with open(self.checkpoint_file, 'rb') as f:
+            f.seek(self.offsets[min(spin // self.interval, len(self.offsets) - 1)])
+            checkpoint = json.loads(f.readline())
+
+        player = Player()
+        restore_snapshot(player, checkpoint['player'], self.history_file)
+        strategy = _load_strategy(checkpoint['strategy'])
+        rng = random.Random()
+        version, state, gauss = checkpoint['rng']
+        rng.setstate((version, tuple(state), gauss))
+        current = checkpoint['spin']
+        index = checkpoint['event']
+        while current < spin:
+            event = self.events[index]
+            strategy = self._apply(event, player, strategy, rng)
+            index += 1
+            if 'spin' in event:
+                current += 1
+        return player, strategy
+
+def verify_save(session, save_dir="."):
+    """Compare the rebuilt state with the game saved in ``save_dir``.
+
+    The saved game is loaded with ``load_game_state`` (snapshot plus
+    journal), the session is rebuilt at the same spin, and both are
+    serialized as ``save_game_state`` would write them. Returns the spin
+    and the list of mismatched snapshot fields (``bet_history`` for rows).
+    """
+    cwd = os.getcwd()
+    os.chdir(save_dir)
+    try:
+        saved = Player()
+        if not load_game_state(saved):
+            raise ValueError("no saved game to verify against")
+    finally:
+        os.chdir(cwd)
+    with saved.bet_history:
+        spin = saved.number_tracker.total
+        rebuilt, _ = session.state_at(spin)
+        with rebuilt.bet_history:
+            expected = json.loads(json.dumps(snapshot_data(saved)))
+            actual = json.loads(json.dumps(snapshot_data(rebuilt)))
+            mismatched = [key for key in expected if expected[key] != actual.get(key)]
+            count = len(saved.bet_history)
+            saved_rows = [list(column) for column in saved.bet_history.columns(0, count)]
+            rebuilt_rows = [list(column) for column in rebuilt.bet_history.columns(0, count)]
+            if len(rebuilt.bet_history) != count or saved_rows != rebuilt_rows:
+                mismatched.append('bet_history')
+    return spin, mismatched
@@ -0,0 +1,91 @@
+"""Pluggable random number sources for the roulette wheel."""
+import os
+import random
+
+from payouts import WHEEL_SIZE
+
+DEFAULT_BLOCK_SIZE = 4096
+
+class WheelRNG:
+    """Base wheel source; subclasses implement ``spin_block``."""
+
+    def spin(self):
+        """Return one wheel number from 0 to 36."""
+        return self.spin_block(1)[0]
+
+    def spin_block(self, count):
+        """Return a list of ``count`` wheel numbers."""
+        raise NotImplementedError
+
+class SeededWheel(WheelRNG):
+    """Draw each spin from a private, seedable Mersenne Twister."""
+
+    def __init__(self, seed=None):
+        self.seed = seed
+        self._random = random.Random(seed)
+
+    def spin(self):
+        return self._random.randrange(WHEEL_SIZE)
+
+    def spin_block(self, count):
+        return [self._random.randrange(WHEEL_SIZE) for _ in range(count)]
+
+class BufferedWheel(SeededWheel):
+    """Pre-generate spins in blocks and hand them out one at a time."""
+
+    def __init__(self, seed=None, block_size=DEFAULT_BLOCK_SIZE):
+        super().__init__(seed)
+        self.block_size = block_size
+        self._numbers = range(WHEEL_SIZE)
+        self._buffer = iter(())
+
+    def spin(self):
+        try:
+            return next(self._buffer)
+        except StopIteration:
+            self._buffer = iter(self.spin_block(self.block_size))
+            return next(self._buffer)
+
+    def spin_block(self, count):
+        return self._random.choices(self._numbers, k=count)
+
+class SecureWheel(WheelRNG):
+    """Draw spins from the operating system CSPRNG for real play.
+
+    Random bytes are fetched in blocks from ``os.urandom`` and mapped onto the
+    wheel by rejection sampling, so every number is exactly equally likely.
+    """
+
+    _LIMIT = 256 - 256 % WHEEL_SIZE
+
+    def __init__(self, block_size=DEFAULT_BLOCK_SIZE):
+        self.block_size = block_size
+        self._buffer = iter(())
+
+    def spin(self):
+        for byte in self._buffer:
+            if byte < self._LIMIT:
+                return byte % WHEEL_SIZE
+        self._buffer = iter(os.urandom(self.block_size))
+        return self.spin()
+
+    def spin_block(self, count):
+        return [self.spin() for _ in range(count)]
+
+WHEELS = {
+    'seeded': SeededWheel,
+    'buffered': BufferedWheel,
+    'secure': SecureWheel
+}
+
+def create_wheel(kind="secure", seed=None):
+    """Build a wheel source by name; ``secure`` ignores the seed."""
+    if kind not in WHEELS:
+        raise ValueError(f"unknown wheel rng: {kind}")
+    if kind == "secure":
+        return SecureWheel()
+    return WHEELS[kind](seed)
+
+def table_wheel(seed, table_id, kind="buffered"):
+    """Return an independent, reproducible wheel stream for one table."""
+    return create_wheel(kind, f"{seed}:{table_id}")
@@ -1,70 +1,60 @@
 #!/usr/bin/env python3
-import random
+"""Terminal roulette: the interactive game loop and the CLI entry point.
+
+Only the player, bet and payout core is imported at module level; every
+menu subsystem and headless mode imports its modules when first used, so
+a subcommand pays only for the code it runs.
+"""
+import math
+from time import perf_counter
+
+import metrics
 
-from achievements import check_achievements, display_achievements
-from calculator import display_calculator
 from config import (
-    BLACK_NUMBERS,
     CRITICAL_BALANCE_WARNING,
     INITIAL_BALANCE,
     LOW_BALANCE_WARNING,
     MAXIMUM_BET,
     MINIMUM_BET,
-    PAYOUT_MULTIPLIERS,
     QUICK_BET_AMOUNTS,
-    RED_NUMBERS,
-)
-from storage import (
-    delete_save_file,
-    display_leaderboard,
-    export_statistics,
-    load_game_state,
-    save_game_state,
-    save_to_leaderboard,
 )
-from strategies import get_strategy_from_user
-from utils import (
-    display_bet_summary,
-    display_separator,
-    format_bet_description,
-    format_currency,
-    format_percentage,
-    format_profit_loss,
+from history import BetHistory
+from hotcold import NumberTracker
+from payouts import (
+    BET_KEYS,
+    BET_MASKS,
+    NUMBER_COLORS,
+    PAYOUT_TABLE,
+    UNRESOLVED_CODE,
+    VALUELESS_BETS,
+    bet_code,
 )
 
-def spin_wheel():
-    """Return a random roulette wheel number."""
-    return random.randint(0, 36)
+# Bets folded into the risk figures per pass over the history columns.
+RISK_CHUNK_ROWS = 10000
 
-def get_number_color(number):
-    """Return the roulette color for a wheel number."""
-    if number == 0:
-        return "green"
-    if number in RED_NUMBERS:
-        return "red"
-    return "black"
-
-def check_color_bet(winning_number, bet_color):
-    """Return whether a color bet wins for the wheel result."""
-    if winning_number == 0:
-        return False
-    return get_number_color(winning_number) == bet_color.lower()
+_default_wheel = None
 
-def check_odd_even_bet(winning_number, bet_type):
-    """Return whether an odd/even bet wins for the wheel result."""
-    if winning_number == 0:
-        return False
-    if bet_type == "odd":
-        return winning_number % 2 == 1
-    return winning_number % 2 == 0
+def spin_wheel(wheel=None):
+    """Return a roulette wheel number from ``wheel`` or the secure default."""
+    global _default_wheel
+    if wheel is None:
+        if _default_wheel is None:
+            from rng import create_wheel
+            _default_wheel = create_wheel("secure")
+        wheel = _default_wheel
+    recorder = metrics.recorder
+    if recorder is None:
+        return wheel.spin()
+    start = perf_counter()
+    number = wheel.spin()
+    recorder.observe("spin", perf_counter() - start)
+    recorder.count("spins")
+    return number
 
-def check_high_low_bet(winning_number, bet_type):
-    """Return whether a high/low bet wins for the wheel result."""
-    if winning_number == 0:
-        return False
-    if bet_type == "low":
-        return 1 <= winning_number <= 18
-    return 19 <= winning_number <= 36
+def get_number_color(number):
+    """Return the roulette color for a wheel number."""
+    return NUMBER_COLORS[number]
 
 class Player:
     """Track player balance, bet history, and session statistics."""
@@ -74,7 +64,7 @@ class Player:
             initial_balance = INITIAL_BALANCE
         self.balance = initial_balance
         self.initial_balance = initial_balance
-        self.bet_history = []
+        self.bet_history = BetHistory()
         self.wins = 0
         self.losses = 0
         self.last_bet = None
@@ -85,6 +75,17 @@ class Player:
         self.number_frequency = {}
         self.best_payout = 0
         self.worst_loss = 0
+        self.number_tracker = NumberTracker()
+        self.journal = None
+        self.peak_balance = initial_balance
+        self.max_drawdown = 0
+        self._risk_history = None
+        self._risk_count = 0
+        self.total_wagered = 0
+        self.total_paid = 0
+        self.net_mean = 0.0
+        self.net_m2 = 0.0
+        self.profit_by_type = {}
     
     def get_balance(self):
         return self.balance
@@ -97,12 +98,10 @@ class Player:
     
     def add_bet_to_history(self, bet, winning_number, won, payout):
         """Record a resolved bet and update aggregate counters."""
-        self.bet_history.append({
-            'bet': bet,
-            'winning_number': winning_number,
-            'won': won,
-            'payout': payout
-        })
+        recorder = metrics.recorder
+        if recorder is not None:
+            start = perf_counter()
+        self.bet_history.append(bet, winning_number, won, payout)
         if won:
             self.wins += 1
             self.best_payout = max(self.best_payout, payout)
@@ -120,6 +119,53 @@ class Player:
         self.number_frequency[winning_number] = (
             self.number_frequency.get(winning_number, 0) + 1
         )
+        if self.balance > self.peak_balance:
+            self.peak_balance = self.balance
+        elif self.peak_balance - self.balance > self.max_drawdown:
+            self.max_drawdown = self.peak_balance - self.balance
+        if recorder is not None:
+            recorder.observe("history", perf_counter() - start)
+            recorder.count_bets(bet.bet_type, bet.amount, payout)
+        if self.journal is not None:
+            self.journal.record(self, bet, winning_number, won, payout)
+    
+    def _fold_risk(self):
+        """Fold bets recorded since the last call into the wager and Welford figures.
+
+        They are read from the history columns on demand rather than per
+        bet; replacing the history, e.g. by loading a game, starts over.
+        """
+        history = self.bet_history
+        if history is not self._risk_history:
+            self._risk_history = history
+            self._risk_count = 0
+            self.total_wagered = self.total_paid = 0
+            self.net_mean = self.net_m2 = 0.0
+            self.profit_by_type = {}
+        end = len(history)
+        count = self._risk_count
+        for chunk_start in range(count, end, RISK_CHUNK_ROWS):
+            codes, amounts, _, _, payouts = history.columns(chunk_start, min(chunk_start + RISK_CHUNK_ROWS, end))
+            profit_by_code = {}
+            for code, amount, payout in zip(codes, amounts, payouts):
+                count += 1
+                net = payout - amount
+                delta = net - self.net_mean
+                self.net_mean += delta / count
+                self.net_m2 += delta * (net - self.net_mean)
+                profit_by_code[code] = profit_by_code.get(code, 0) + net
+            self.total_wagered += sum(amounts)
+            self.total_paid += sum(payouts)
+            for code, net in profit_by_code.items():
+                bet_type = history.bet_key(code)[0]
+                self.profit_by_type[bet_type] = self.profit_by_type.get(bet_type, 0) + net
+        self._risk_count = end
+    
+    def record_spin(self, winning_number):
+        """Count one wheel result for hot/cold tracking."""
+        self.number_tracker.record(winning_number)
+        if self.journal is not None:
+            self.journal.record_spin(self, winning_number)
     
     def get_bet_history(self):
         return self.bet_history
@@ -139,6 +185,27 @@ class Player:
             'max_win_streak': self.max_win_streak,
             'max_loss_streak': self.max_loss_streak
         }
+    
+    def get_risk_statistics(self):
+        """Return wager, return-to-player, variance and drawdown figures.
+
+        Kept apart from ``get_statistics``, which achievements read every
+        spin, so the per-spin path does not pay for them.
+        """
+        self._fold_risk()
+        total_bets = self._risk_count
+        net_variance = self.net_m2 / (total_bets - 1) if total_bets > 1 else 0.0
+        return {
+            'total_wagered': self.total_wagered,
+            'rtp': (self.total_paid / self.total_wagered * 100) if self.total_wagered else 0,
+            'mean_net': self.net_mean,
+            'net_variance': net_variance,
+            'net_stddev': math.sqrt(net_variance),
+            'peak_balance': self.peak_balance,
+            'max_drawdown': self.max_drawdown,
+            'current_drawdown': max(0, self.peak_balance - self.balance),
+            'profit_by_type': dict(self.profit_by_type)
+        }
 
 class Bet:
     """Represent a single roulette bet."""
@@ -147,26 +214,15 @@ class Bet:
         self.bet_type = bet_type
         self.value = value
         self.amount = amount
+        self.code = bet_code(bet_type, value)
 
 def check_bet_win(bet, winning_number):
-    """Return whether a bet wins against a wheel result."""
-    if bet.bet_type == "number":
-        return winning_number == bet.value
-    if bet.bet_type == "color":
-        return check_color_bet(winning_number, bet.value)
-    if bet.bet_type in ["odd", "even"]:
-        return check_odd_even_bet(winning_number, bet.bet_type)
-    if bet.bet_type in ["high", "low"]:
-        return check_high_low_bet(winning_number, bet.bet_type)
-    return False
+    """Return whether a bet wins against a wheel result with one mask bit test."""
+    return BET_MASKS[bet.code] >> winning_number & 1 == 1
 
 def calculate_payout(bet, winning_number):
-    """Calculate the payout for a bet and result."""
-    if not check_bet_win(bet, winning_number):
-        return 0
-    
-    multiplier = PAYOUT_MULTIPLIERS.get(bet.bet_type, 2)
-    return bet.amount * multiplier
+    """Calculate the payout for a bet and result with one table lookup."""
+    return bet.amount * PAYOUT_TABLE[bet.code][winning_number]
 
 def display_menu(player=None):
     print("\nbetting options:")
@@ -174,6 +230,7 @@ def display_menu(player=None):
     print("2. color (red/black) - payout: 2x")
     print("3. odd/even - payout: 2x")
     print("4. high/low - payout: 2x")
+    print("g. split, street, corner, six line, dozen, column or basket")
     print("5. multiple bets (bet on multiple options)")
     if player and player.last_bet:
         print("r. repeat last bet")
@@ -189,8 +246,57 @@ def display_menu(player=None):
     print("f. view hot/cold numbers")
     print("0. quit")
 
-def get_multiple_bets():
-    """Collect multiple bets from the player before one spin."""
+TABLE_BET_CHOICES = {
+    '1': ("split", "enter two adjacent numbers (e.g. 17 20): "),
+    '2': ("street", "enter the first number of the street (1, 4, ... 34): "),
+    '3': ("corner", "enter the four numbers of the corner (e.g. 1 2 4 5): "),
+    '4': ("sixline", "enter the first number of the six line (1, 4, ... 31): "),
+    '5': ("dozen", "enter dozen (1-3): "),
+    '6': ("column", "enter column (1-3): "),
+}
+
+def _table_bet_value(bet_type, numbers):
+    """Turn the numbers typed for a table bet into its bet value."""
+    if bet_type in ("split", "corner"):
+        return tuple(sorted(numbers))
+    if len(numbers) != 1:
+        return None
+    first = numbers[0]
+    if bet_type == "street":
+        return (first, first + 2)
+    if bet_type == "sixline":
+        return (first, first + 5)
+    if bet_type == "dozen":
+        return (first * 12 - 11, first * 12)
+    return first
+
+def get_table_bet(ask=input):
+    """Ask for a bet on a group of numbers; return ``(bet_type, value)`` or ``None``."""
+    print("1. split (18x)  2. street (12x)  3. corner (9x)  4. six line (6x)")
+    print("5. dozen (3x)  6. column (3x)  7. basket 0-1-2-3 (9x)")
+    choice = ask("select table bet (1-7): ").strip()
+    if choice == "7":
+        return "basket", None
+    if choice not in TABLE_BET_CHOICES:
+        print("invalid choice")
+        return None
+    
+    bet_type, prompt = TABLE_BET_CHOICES[choice]
+    try:
+        numbers = [int(token) for token in ask(prompt).replace(",", " ").split()]
+    except ValueError:
+        print("invalid number")
+        return None
+    value = _table_bet_value(bet_type, numbers)
+    if value is None or bet_code(bet_type, value) == UNRESOLVED_CODE:
+        print(f"not a {bet_type} on the table layout")
+        return None
+    return bet_type, value
+
+def get_multiple_bets(ask=input):
+    """Collect multiple bets from the player into one ``BetSlip``."""
+    from betslip import BetSlip
+    
     bets = []
     total_amount = 0
     
@@ -198,7 +304,8 @@ def get_multiple_bets():
     while True:
         print(f"\ncurrent bets: {len(bets)} | total amount: ${total_amount}")
         print("1. number  2. color  3. odd/even  4. high/low")
-        bet_choice = input("select bet type (or 'done'): ").strip().lower()
+        print("5. split, street, corner, six line, dozen, column or basket")
+        bet_choice = ask("select bet type (or 'done'): ").strip().lower()
         
         if bet_choice == "done":
             if len(bets) == 0:
@@ -206,11 +313,11 @@ def get_multiple_bets():
                 return None
             break
         
-        if bet_choice not in ["1", "2", "3", "4"]:
+        if bet_choice not in ["1", "2", "3", "4", "5"]:
             print("invalid choice")
             continue
         
-        amount_input = input(f"enter bet amount (minimum ${MINIMUM_BET}): ").strip().lower()
+        amount_input = ask(f"enter bet amount (minimum ${MINIMUM_BET}): ").strip().lower()
         if amount_input in QUICK_BET_AMOUNTS:
             amount = QUICK_BET_AMOUNTS[amount_input]
         else:
@@ -227,7 +334,7 @@ def get_multiple_bets():
                 continue
         
         if bet_choice == "1":
-            number = input("enter number (0-36): ").strip()
+            number = ask("enter number (0-36): ").strip()
             try:
                 number = int(number)
                 if number < 0 or number > 36:
@@ -239,31 +346,37 @@ def get_multiple_bets():
                 print("invalid number")
                 continue
         elif bet_choice == "2":
-            color = input("enter color (red/black): ").strip().lower()
+            color = ask("enter color (red/black): ").strip().lower()
             if color not in ["red", "black"]:
                 print("color must be red or black")
                 continue
             bets.append(Bet("color", color, amount))
             total_amount += amount
         elif bet_choice == "3":
-            oe = input("enter odd or even: ").strip().lower()
+            oe = ask("enter odd or even: ").strip().lower()
             if oe not in ["odd", "even"]:
                 print("must be odd or even")
                 continue
             bets.append(Bet(oe, None, amount))
             total_amount += amount
         elif bet_choice == "4":
-            hl = input("enter high or low: ").strip().lower()
+            hl = ask("enter high or low: ").strip().lower()
             if hl not in ["high", "low"]:
                 print("must be high or low")
                 continue
             bets.append(Bet(hl, None, amount))
             total_amount += amount
+        elif bet_choice == "5":
+            table_bet = get_table_bet(ask)
+            if table_bet is None:
+                continue
+            bets.append(Bet(*table_bet, amount))
+            total_amount += amount
     
-    return bets
+    return BetSlip(bets)
 
-def get_bet_from_user(strategy=None, last_bet=None):
-    choice = input("select bet type (0-9, a-f, r): ").strip().lower()
+def get_bet_from_user(strategy=None, last_bet=None, ask=input):
+    choice = ask("select bet type (0-9, a-g, r): ").strip().lower()
     
     if choice == "0":
         return None
@@ -274,14 +387,14 @@ def get_bet_from_user(strategy=None, last_bet=None):
     if choice in ["5", "6", "7", "8", "9", "a", "b", "c", "d", "e", "f", "r"]:
         return choice
     
-    if choice not in ["1", "2", "3", "4"]:
+    if choice not in ["1", "2", "3", "4", "g"]:
         print("invalid choice")
         return None
     
     if strategy:
         amount = strategy.get_bet_amount()
         print(f"strategy '{strategy.name}' suggests: ${amount}")
-        use_strategy = input("use strategy amount? (yes/no): ").strip().lower()
+        use_strategy = ask("use strategy amount? (yes/no): ").strip().lower()
         if use_strategy not in ["yes", "y"]:
             amount = None
     else:
@@ -290,7 +403,7 @@ def get_bet_from_user(strategy=None, last_bet=None):
     if amount is None:
         print("\nquick bet amounts:")
         print("a. $10  b. $50  c. $100  d. $500")
-        amount_input = input(f"enter bet amount or quick option (minimum ${MINIMUM_BET}): ").strip().lower()
+        amount_input = ask(f"enter bet amount or quick option (minimum ${MINIMUM_BET}): ").strip().lower()
         
         if amount_input in QUICK_BET_AMOUNTS:
             amount = QUICK_BET_AMOUNTS[amount_input]
@@ -311,7 +424,7 @@ def get_bet_from_user(strategy=None, last_bet=None):
                 return None
     
     if choice == "1":
-        number = input("enter number (0-36): ").strip()
+        number = ask("enter number (0-36): ").strip()
         try:
             number = int(number)
             if number < 0 or number > 36:
@@ -322,23 +435,28 @@ def get_bet_from_user(strategy=None, last_bet=None):
             print("invalid number")
             return None
     elif choice == "2":
-        color = input("enter color (red/black): ").strip().lower()
+        color = ask("enter color (red/black): ").strip().lower()
         if color not in ["red", "black"]:
             print("color must be red or black")
             return None
         return Bet("color", color, amount)
     elif choice == "3":
-        oe = input("enter odd or even: ").strip().lower()
+        oe = ask("enter odd or even: ").strip().lower()
         if oe not in ["odd", "even"]:
             print("must be odd or even")
             return None
         return Bet(oe, None, amount)
     elif choice == "4":
-        hl = input("enter high or low: ").strip().lower()
+        hl = ask("enter high or low: ").strip().lower()
         if hl not in ["high", "low"]:
             print("must be high or low")
             return None
         return Bet(hl, None, amount)
+    elif choice == "g":
+        table_bet = get_table_bet(ask)
+        if table_bet is None:
+            return None
+        return Bet(*table_bet, amount)
     
     return None
 
@@ -349,48 +467,67 @@ def check_balance_warnings(balance):
     elif balance < LOW_BALANCE_WARNING:
         print("caution: balance is getting low")
 
+def _print_number_counts(numbers):
+    for i, (num, count) in enumerate(numbers, 1):
+        color = get_number_color(num)
+        print(f"  {i}. {num} ({color}) - appeared {count} time(s)")
+
 def display_hot_cold_numbers(player):
-    """Display the most and least frequent wheel results in session history."""
-    history = player.get_bet_history()
-    if not history:
+    """Display the most and least frequent wheel results all-time and recently."""
+    from utils import display_separator
+    
+    tracker = player.number_tracker
+    if tracker.total == 0:
         display_separator()
         print("no bet history yet - need at least one spin to show hot/cold numbers")
         display_separator()
         return
     
-    number_frequency = {}
-    for h in history:
-        num = h['winning_number']
-        number_frequency[num] = number_frequency.get(num, 0) + 1
-    
-    sorted_numbers = sorted(number_frequency.items(), key=lambda x: x[1], reverse=True)
-    
     display_separator()
-    print("hot/cold numbers (based on last spins):")
+    print(f"hot/cold numbers ({tracker.total} spins):")
     display_separator()
     
-    if sorted_numbers:
-        hot_numbers = sorted_numbers[:5]
-        cold_numbers = sorted(sorted_numbers[-5:], key=lambda x: x[1])
-        
-        print("🔥 hot numbers (most frequent):")
-        for i, (num, count) in enumerate(hot_numbers, 1):
-            color = get_number_color(num)
-            print(f"  {i}. {num} ({color}) - appeared {count} time(s)")
-        
-        print("\n❄️  cold numbers (least frequent):")
-        for i, (num, count) in enumerate(cold_numbers, 1):
-            color = get_number_color(num)
-            print(f"  {i}. {num} ({color}) - appeared {count} time(s)")
-    else:
-        print("no data available")
+    print("🔥 hot numbers (most frequent):")
+    _print_number_counts(tracker.hot())
+    print("\n❄️  cold numbers (least frequent):")
+    _print_number_counts(tracker.cold())
+    
+    never_seen = tracker.never_seen()
+    if never_seen:
+        print(f"\nnever appeared: {', '.join(str(n) for n in never_seen)}")
+    
+    if tracker.total > tracker.window:
+        print(f"\nlast {tracker.window} spins:")
+        print("🔥 hot: " + ", ".join(f"{num} ({count})" for num, count in tracker.hot(recent=True)))
+        print("❄️  cold: " + ", ".join(f"{num} ({count})" for num, count in tracker.cold(recent=True)))
+        print("not seen: " + ", ".join(str(n) for n in tracker.never_seen(recent=True)))
     
     display_separator()
 
-def play_game():
-    """Run one roulette session until the player quits or loses balance."""
-    player = Player()
+def play_game(wheel=None, ask=input, player=None, bet_log=None):
+    """Run one roulette session until the player quits or loses balance.
+
+    ``ask`` replaces ``input`` for every prompt of the session, so scripted
+    sources can drive the real menu logic. A ``replay.BetLog`` given as
+    ``bet_log`` records every spin's bets and strategy change.
+    """
+    from achievements import check_achievements
+    from utils import (
+        display_bet_summary,
+        display_separator,
+        format_bet_description,
+        format_currency,
+        format_percentage,
+        format_profit_loss,
+    )
+    
+    if wheel is None:
+        from rng import create_wheel
+        wheel = create_wheel("secure")
+    if player is None:
+        player = Player()
     strategy = None
+    exporters = {}
     
     try:
         while True:
@@ -405,14 +542,19 @@ def play_game():
             check_balance_warnings(balance)
             display_menu(player)
             
+            recorder = metrics.recorder
+            if recorder is not None:
+                start = perf_counter()
             try:
-                bet = get_bet_from_user(strategy, player.last_bet)
+                bet = get_bet_from_user(strategy, player.last_bet, ask)
             except KeyboardInterrupt:
                 print("\n\ngame interrupted. thanks for playing!")
                 return False
             except Exception as e:
                 print(f"error: {str(e)}")
                 continue
+            if recorder is not None:
+                recorder.observe("input", perf_counter() - start)
             
             if bet is None:
                 stats = player.get_statistics()
@@ -427,8 +569,10 @@ def play_game():
                 print(f"profit/loss: {format_profit_loss(stats['profit'])}")
                 display_separator()
                 
+                from storage import delete_save_file, save_to_leaderboard
+                
                 if stats['total_bets'] > 0:
-                    player_name = input("enter your name for leaderboard (or press enter to skip): ").strip()
+                    player_name = ask("enter your name for leaderboard (or press enter to skip): ").strip()
                     if player_name:
                         save_to_leaderboard(
                             player_name,
@@ -444,40 +588,54 @@ def play_game():
                 return True
             
             if bet == "5":
-                multiple_bets = get_multiple_bets()
-                if multiple_bets is None:
+                if recorder is not None:
+                    start = perf_counter()
+                slip = get_multiple_bets(ask)
+                if recorder is not None:
+                    recorder.observe("input", perf_counter() - start)
+                if slip is None:
                     continue
                 
-                total_bet_amount = sum(b.amount for b in multiple_bets)
+                total_bet_amount = slip.total_amount
                 if total_bet_amount > player.get_balance():
                     print("insufficient balance for all bets")
                     continue
                 
                 display_separator()
                 print("multiple bets summary:")
-                for i, b in enumerate(multiple_bets, 1):
+                for i, b in enumerate(slip, 1):
                     print(f"{i}. {format_bet_description(b)}")
                 print(f"total bet amount: ${total_bet_amount}")
+                print(f"wins on {slip.coverage.bit_count()} of {len(NUMBER_COLORS)} numbers "
+                      f"({format_percentage(float(slip.hit_probability()) * 100)})")
+                print(f"expected result: {float(slip.expected_value()):+.2f} per spin "
+                      f"(std dev {math.sqrt(slip.variance()):.2f})")
+                print(f"worst case: {format_profit_loss(slip.worst_case())} | "
+                      f"best case: {format_profit_loss(slip.best_case())}")
                 display_separator()
                 
-                confirm = input("confirm all bets? (yes/no): ").strip().lower()
+                confirm = ask("confirm all bets? (yes/no): ").strip().lower()
                 if confirm not in ["yes", "y"]:
                     print("bets cancelled")
                     continue
                 
                 player.subtract_balance(total_bet_amount)
-                winning_number = spin_wheel()
+                winning_number = spin_wheel(wheel)
+                player.record_spin(winning_number)
                 color = get_number_color(winning_number)
                 
                 display_separator()
                 print(f"spinning... the ball lands on {winning_number} ({color})")
                 display_separator()
                 
-                total_payout = 0
-                for b in multiple_bets:
-                    payout = calculate_payout(b, winning_number)
+                if recorder is not None:
+                    start = perf_counter()
+                total_payout, payouts = slip.resolve(winning_number)
+                if recorder is not None:
+                    recorder.observe("resolve", perf_counter() - start)
+                
+                for b, payout in zip(slip, payouts):
                     if payout > 0:
-                        total_payout += payout
                         print(f"won on {format_bet_description(b)}: ${payout}")
                 
                 if total_payout > 0:
@@ -487,10 +645,10 @@ def play_game():
                     print("all bets lost!")
                 display_separator()
                 
-                for b in multiple_bets:
-                    payout = calculate_payout(b, winning_number)
-                    won = payout > 0
-                    player.add_bet_to_history(b, winning_number, won, payout)
+                for b, payout in zip(slip, payouts):
+                    player.add_bet_to_history(b, winning_number, payout > 0, payout)
+                if bet_log is not None:
+                    bet_log.spin("multi", slip)
                 continue
             
             if bet == "6":
@@ -507,6 +665,15 @@ def play_game():
                 print(f"current loss streak: {stats['current_loss_streak']}")
                 print(f"max win streak: {stats['max_win_streak']}")
                 print(f"max loss streak: {stats['max_loss_streak']}")
+                risk = player.get_risk_statistics()
+                print(f"\ntotal wagered: {format_currency(risk['total_wagered'])}")
+                print(f"return to player: {format_percentage(risk['rtp'])}")
+                print(f"net per bet: {risk['mean_net']:+.2f} (std dev {risk['net_stddev']:.2f})")
+                print(f"peak balance: {format_currency(risk['peak_balance'])}")
+                print(f"max drawdown: {format_currency(risk['max_drawdown'])}")
+                print(f"current drawdown: {format_currency(risk['current_drawdown'])}")
+                for bet_type, type_profit in sorted(risk['profit_by_type'].items()):
+                    print(f"{bet_type} profit: {format_profit_loss(type_profit)}")
                 display_separator()
                 continue
             
@@ -527,6 +694,7 @@ def play_game():
                 continue
             
             if bet == "8":
+                from storage import save_game_state
                 if save_game_state(player):
                     print("game saved successfully!")
                 else:
@@ -534,6 +702,7 @@ def play_game():
                 continue
             
             if bet == "9":
+                from storage import load_game_state
                 if load_game_state(player):
                     print("game loaded successfully!")
                 else:
@@ -541,21 +710,30 @@ def play_game():
                 continue
             
             if bet == "a":
+                from storage import display_leaderboard
                 display_leaderboard()
                 continue
             
             if bet == "b":
-                filename = input("enter filename (default: statistics.txt): ").strip()
+                filename = ask("enter filename (.txt, .csv or .jsonl; default: statistics.txt): ").strip()
                 if not filename:
                     filename = "statistics.txt"
-                if export_statistics(player, filename):
+                from storage import export_history, export_statistics
+                if filename.endswith((".csv", ".jsonl")):
+                    exported = export_history(player, filename, exporters=exporters)
+                else:
+                    exported = export_statistics(player, filename)
+                if exported:
                     print(f"statistics exported to {filename}!")
                 else:
                     print("failed to export statistics")
                 continue
             
             if bet == "c":
-                strategy = get_strategy_from_user()
+                from strategies import get_strategy_from_user
+                strategy = get_strategy_from_user(ask)
+                if bet_log is not None:
+                    bet_log.strategy(strategy)
                 if strategy:
                     print(f"strategy '{strategy.name}' activated!")
                 else:
@@ -563,11 +741,13 @@ def play_game():
                 continue
             
             if bet == "d":
+                from achievements import display_achievements
                 display_achievements()
                 continue
             
             if bet == "e":
-                display_calculator()
+                from calculator import display_calculator
+                display_calculator(ask)
                 continue
             
             if bet == "f":
@@ -594,20 +774,25 @@ def play_game():
                 continue
             
             display_bet_summary(bet)
-            confirm = input("confirm bet? (yes/no): ").strip().lower()
+            confirm = ask("confirm bet? (yes/no): ").strip().lower()
             if confirm not in ["yes", "y"]:
                 print("bet cancelled")
                 continue
             
             player.subtract_balance(bet.amount)
-            winning_number = spin_wheel()
+            winning_number = spin_wheel(wheel)
+            player.record_spin(winning_number)
             color = get_number_color(winning_number)
             
             display_separator()
             print(f"spinning... the ball lands on {winning_number} ({color})")
             display_separator()
             
+            if recorder is not None:
+                start = perf_counter()
             payout = calculate_payout(bet, winning_number)
+            if recorder is not None:
+                recorder.observe("resolve", perf_counter() - start)
             won = payout > 0
             if won:
                 print(f"you win ${payout}!")
@@ -622,9 +807,15 @@ def play_game():
             
             player.add_bet_to_history(bet, winning_number, won, payout)
             player.last_bet = bet
+            if bet_log is not None:
+                bet_log.spin("single", [bet])
             
+            if recorder is not None:
+                start = perf_counter()
             stats = player.get_statistics()
             unlocked = check_achievements(player, stats, won)
+            if recorder is not None:
+                recorder.observe("achievements", perf_counter() - start)
             if unlocked:
                 display_separator()
                 print("achievement unlocked!")
@@ -639,12 +830,396 @@ def play_game():
         print(f"\nunexpected error: {str(e)}")
         return False
 
-def main():
-    """Start the CLI roulette game loop."""
+def _positive_int(text):
+    """Parse a command line count that must be at least 1."""
+    import argparse
+
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {value}")
+    return value
+
+def _optional_int(text):
+    """Parse an integer command line value where ``none`` means no limit."""
+    return None if text.lower() == "none" else int(text)
+
+def build_parser():
+    """Build the command line parser for interactive and headless modes."""
+    import argparse
+
+    from strategies import STRATEGIES
+    
+    parser = argparse.ArgumentParser(description="terminal roulette")
+    parser.add_argument("--metrics", default=None,
+                        help="record timings and counters; write them to this .json or Prometheus text file")
+    parser.add_argument("--bet-log", default=None,
+                        help="play on a seeded wheel and log every bet to this file for replay")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    simulate = subparsers.add_parser("simulate", help="play strategy sessions headlessly and emit JSONL")
+    simulate.add_argument("--strategy", choices=sorted(STRATEGIES), default="flat")
+    simulate.add_argument("--bankroll", type=int, default=INITIAL_BALANCE)
+    simulate.add_argument("--base-amount", type=int, default=MINIMUM_BET)
+    simulate.add_argument("--spins", type=int, default=1000, help="maximum spins per session")
+    simulate.add_argument("--sessions", type=int, default=1)
+    simulate.add_argument("--seed", type=int, default=None)
+    simulate.add_argument("--target", type=int, default=None, help="stop a session once the balance reaches this")
+    simulate.add_argument("--stop-loss", type=int, default=None, help="stop a session once the balance falls to this")
+    simulate.add_argument("--bet-type", choices=list(dict.fromkeys(bet_type for bet_type, _ in BET_KEYS)),
+                          default="color")
+    simulate.add_argument("--bet-value", default=None,
+                          help="number or color; split/corner numbers (17-20), first number of a street "
+                               "or six line, dozen or column 1-3 (default: red)")
+    simulate.add_argument("--output", default="-", help="output file (default: stdout)")
+    
+    tournament = subparsers.add_parser("tournament", help="rank strategies across bankroll/stake combinations")
+    tournament.add_argument("--strategies", nargs="+", choices=sorted(STRATEGIES), default=None)
+    tournament.add_argument("--bankrolls", nargs="+", type=int, default=[INITIAL_BALANCE])
+    tournament.add_argument("--base-amounts", nargs="+", type=int, default=[MINIMUM_BET])
+    tournament.add_argument("--sessions", type=_positive_int, default=1000, help="sessions per combination")
+    tournament.add_argument("--spins", type=int, default=1000, help="maximum spins per session")
+    tournament.add_argument("--seed", type=int, default=0)
+    tournament.add_argument("--workers", type=_positive_int, default=None, help="worker processes (default: all cores)")
+    
+    optimize = subparsers.add_parser("optimize", help="search strategy parameters for the best configuration")
+    optimize.add_argument("--strategies", nargs="+", choices=sorted(STRATEGIES), default=None)
+    optimize.add_argument("--bankrolls", nargs="+", type=int, default=[INITIAL_BALANCE])
+    optimize.add_argument("--base-amounts", nargs="+", type=int, default=[MINIMUM_BET])
+    optimize.add_argument("--stop-losses", nargs="+", type=_optional_int, default=[None],
+                          help="amounts a session may lose before stopping ('none' for no limit)")
+    optimize.add_argument("--take-profits", nargs="+", type=_optional_int, default=[None],
+                          help="amounts a session may win before stopping ('none' for no limit)")
+    optimize.add_argument("--loss-thresholds", nargs="+", type=int, default=[3],
+                          help="consecutive losses before conservative halves its bet")
+    optimize.add_argument("--fib-lengths", nargs="+", type=int, default=[12], help="fibonacci sequence lengths")
+    optimize.add_argument("--objective", choices=["survival", "median_profit", "target_hit"], default="survival")
+    optimize.add_argument("--batch", type=_positive_int, default=200, help="sessions per configuration per round")
+    optimize.add_argument("--max-sessions", type=_positive_int, default=2000, help="most sessions per configuration")
+    optimize.add_argument("--spins", type=int, default=1000, help="maximum spins per session")
+    optimize.add_argument("--seed", type=int, default=0)
+    optimize.add_argument("--confidence", type=float, default=0.95, help="confidence level of the intervals")
+    optimize.add_argument("--cache", default="optimizer_cache.jsonl", help="session cache file ('none' to disable)")
+    optimize.add_argument("--workers", type=_positive_int, default=None, help="worker processes (default: all cores)")
+    optimize.add_argument("--top", type=int, default=10, help="configurations to show")
+    
+    analyze = subparsers.add_parser("analyze", help="solve a strategy's risk of ruin exactly")
+    analyze.add_argument("--strategy", choices=sorted(STRATEGIES), default="flat")
+    analyze.add_argument("--bankroll", type=int, default=INITIAL_BALANCE)
+    analyze.add_argument("--base-amount", type=int, default=MINIMUM_BET)
+    analyze.add_argument("--target", type=int, default=None, help="stop balance (default: twice the bankroll)")
+    
+    serve = subparsers.add_parser("serve", help="host multi-table games over a JSON line protocol")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--unix", default=None, help="listen on this Unix socket path instead of TCP")
+    serve.add_argument("--round-delay", type=float, default=1.0, help="seconds a round waits for missing bets")
+    serve.add_argument("--seed", default=None, help="seed per-table wheels (default: secure RNG)")
+    serve.add_argument("--backlog", type=int, default=1024, help="pending connections the listener queues")
+    
+    script = subparsers.add_parser("script", help="replay a file of menu answers without prompts")
+    script.add_argument("commands", help="file with one answer per line, as typed at each prompt")
+    script.add_argument("--spins", default=None, help="file of wheel numbers to land on, in order")
+    script.add_argument("--seed", type=int, default=None, help="seed the wheel when no spin file is given")
+    script.add_argument("--balance", type=int, default=INITIAL_BALANCE)
+    script.add_argument("--transcript", default=None, help="write the console output to this file")
+    script.add_argument("--workdir", default=None, help="directory for saves and exports (default: a scratch dir)")
+    script.add_argument("--bet-log", dest="script_bet_log", default=None,
+                        help="log every bet to this file for replay (needs --seed)")
+    
+    replay = subparsers.add_parser("replay", help="rebuild a logged session at any spin")
+    replay.add_argument("log", help="bet log written with --bet-log")
+    replay.add_argument("--spin", type=int, default=None, help="spin to rebuild (default: the last)")
+    replay.add_argument("--checkpoints", default=None, help="checkpoint directory (default: <log>.checkpoints)")
+    replay.add_argument("--interval", type=int, default=1000, help="spins between checkpoints")
+    replay.add_argument("--rebuild", action="store_true", help="rewrite the checkpoints")
+    replay.add_argument("--verify", default=None, metavar="SAVE_DIR",
+                        help="check the rebuilt state against the game saved in this directory")
+    
+    leaderboard = subparsers.add_parser("leaderboard", help="print the leaderboard without starting a game")
+    leaderboard.add_argument("--limit", type=int, default=10, help="entries to show (0 for all)")
+    leaderboard.add_argument("--json", action="store_true", help="print one JSON object per entry")
+    
+    export = subparsers.add_parser("export", help="export the saved game's statistics and bet history")
+    export.add_argument("output", help="output file: .csv or .jsonl for the full history, anything else for text")
+    export.add_argument("--save-dir", default=".", help="directory holding the saved game")
+    return parser
+
+def _simulate_bet_value(bet_type, text):
+    """Return the bet value ``simulate`` plays, raising ``ValueError`` if invalid.
+
+    Table bets take the numbers the interactive game asks for, separated
+    by spaces, commas or dashes.
+    """
+    if bet_type in VALUELESS_BETS:
+        return None
+    if bet_type == "color":
+        value = "red" if text is None else text.lower()
+    elif text is None:
+        raise ValueError(f"{bet_type} bets need --bet-value")
+    elif bet_type == "number":
+        try:
+            value = int(text)
+        except ValueError:
+            raise ValueError(f"number bets need a number from 0 to 36, not {text!r}") from None
+    else:
+        try:
+            numbers = [int(token) for token in text.replace("-", " ").replace(",", " ").split()]
+        except ValueError:
+            raise ValueError(f"invalid {bet_type} bet value: {text!r}") from None
+        value = _table_bet_value(bet_type, numbers)
+    if bet_code(bet_type, value) == UNRESOLVED_CODE:
+        raise ValueError(f"invalid {bet_type} bet value: {text!r}")
+    return value
+
+def run_simulate_command(args):
+    """Run the headless ``simulate`` subcommand."""
+    from sessions import run_simulation
+    
+    run_simulation(
+        args.strategy,
+        sessions=args.sessions,
+        seed=args.seed,
+        output=args.output,
+        bankroll=args.bankroll,
+        spins=args.spins,
+        base_amount=args.base_amount,
+        bet_type=args.bet_type,
+        bet_value=args.bet_value,
+        target=args.target,
+        stop_loss=args.stop_loss
+    )
+
+def run_tournament_command(args):
+    """Run the ``tournament`` subcommand and print the ranked table."""
+    from tournament import display_tournament, run_tournament
+    
+    rows = run_tournament(
+        strategies=args.strategies,
+        bankrolls=args.bankrolls,
+        base_amounts=args.base_amounts,
+        sessions=args.sessions,
+        spins=args.spins,
+        seed=args.seed,
+        workers=args.workers
+    )
+    display_tournament(rows)
+
+def run_optimize_command(args):
+    """Run the ``optimize`` subcommand and print the ranked configurations."""
+    from optimizer import build_configs, display_optimization, optimize
+    
+    configs = build_configs(
+        strategies=args.strategies,
+        base_amounts=args.base_amounts,
+        bankrolls=args.bankrolls,
+        stop_losses=args.stop_losses,
+        take_profits=args.take_profits,
+        loss_thresholds=args.loss_thresholds,
+        fib_lengths=args.fib_lengths
+    )
+    try:
+        rows = optimize(
+            configs,
+            objective=args.objective,
+            spins=args.spins,
+            seed=args.seed,
+            batch=args.batch,
+            max_sessions=args.max_sessions,
+            confidence=args.confidence,
+            cache_file=None if args.cache.lower() == "none" else args.cache,
+            workers=args.workers
+        )
+    except ValueError as e:
+        print(f"error optimizing strategies: {str(e)}")
+        return
+    display_optimization(rows, args.top)
+
+def run_analyze_command(args):
+    """Run the ``analyze`` subcommand and print the exact session outcome."""
+    from ruin import analyze_strategy
+    from utils import display_separator, format_currency, format_percentage
+    
+    result = analyze_strategy(args.strategy, args.bankroll, args.base_amount, args.target)
+    display_separator()
+    print(f"{args.strategy} from {format_currency(args.bankroll)} to {format_currency(result['target'])}:")
+    display_separator()
+    print(f"risk of ruin: {format_percentage(result['ruin_probability'] * 100)}")
+    print(f"reach target: {format_percentage(result['target_probability'] * 100)}")
+    print(f"expected spins: {result['expected_spins']:.1f}")
+    display_separator()
+
+def run_serve_command(args):
+    """Run the asyncio game server until interrupted."""
+    import asyncio
+
+    from server import serve
+    
+    wheel_kind = "secure" if args.seed is None else "buffered"
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.backlog, seed=args.seed,
+                          wheel_kind=wheel_kind, round_delay=args.round_delay))
+    except KeyboardInterrupt:
+        print("\nserver stopped")
+
+def run_script_command(args):
+    """Run the ``script`` subcommand and print the session outcome."""
+    from scripted import read_script, read_spins, run_script
+    from utils import display_separator, format_currency, format_profit_loss
+    
+    try:
+        commands = read_script(args.commands)
+        spins = read_spins(args.spins) if args.spins else None
+    except (OSError, ValueError) as e:
+        print(f"error reading script: {str(e)}")
+        return
+    bet_log = None
+    if args.script_bet_log:
+        if args.seed is None or spins is not None:
+            print("error: --bet-log needs --seed and no --spins file")
+            return
+        from replay import BetLog
+        bet_log = BetLog(args.script_bet_log, args.seed, args.balance)
+    try:
+        result = run_script(commands, spins, args.seed, args.balance, args.transcript, args.workdir, bet_log)
+    except OSError as e:
+        print(f"error running script: {str(e)}")
+        return
+    finally:
+        if bet_log is not None:
+            bet_log.close()
+    display_separator()
+    print(f"inputs: {result['inputs']} | spins: {result['spins']} | bets: {result['total_bets']}")
+    print(f"ending balance: {format_currency(result['balance'])} ({format_profit_loss(result['profit'])})")
+    print(f"session {'finished' if result['finished'] else 'ended with the script'}")
+    rate = result['inputs'] / result['elapsed'] if result['elapsed'] else 0
+    print(f"elapsed: {result['elapsed']:.3f} s ({rate:,.0f} inputs/sec)")
+    display_separator()
+
+def run_replay_command(args):
+    """Run the ``replay`` subcommand and print the rebuilt state."""
+    from replay import SessionReplay, verify_save
+    from utils import display_separator, format_currency, format_profit_loss
+    
+    session = SessionReplay(args.log, args.checkpoints or args.log + ".checkpoints", args.interval)
+    if args.rebuild or not session.open():
+        print(f"wrote {session.build()} checkpoints to {session.directory}")
+    
+    if args.verify:
+        try:
+            spin, mismatched = verify_save(session, args.verify)
+        except ValueError as e:
+            print(f"error verifying replay: {str(e)}")
+            return
+        if mismatched:
+            print(f"spin {spin}: rebuilt state differs from the save in {', '.join(mismatched)}")
+        else:
+            print(f"spin {spin}: rebuilt state matches the save exactly")
+        return
+    
+    spin = session.spins if args.spin is None else args.spin
+    try:
+        player, strategy = session.state_at(spin)
+    except ValueError as e:
+        print(f"error replaying session: {str(e)}")
+        return
+    player.bet_history.close()
+    stats = player.get_statistics()
+    display_separator()
+    print(f"state after spin {spin} of {session.spins}:")
+    display_separator()
+    print(f"balance: {format_currency(player.get_balance())} ({format_profit_loss(stats['profit'])})")
+    print(f"wins: {stats['wins']} | losses: {stats['losses']}")
+    print(f"win streak: {stats['current_win_streak']} (max {stats['max_win_streak']})")
+    print(f"loss streak: {stats['current_loss_streak']} (max {stats['max_loss_streak']})")
+    print(f"best payout: {format_currency(player.best_payout)} | worst loss: {format_currency(player.worst_loss)}")
+    if strategy:
+        print(f"strategy: {strategy.name} (next bet: ${strategy.get_bet_amount()})")
+    display_separator()
+
+def run_leaderboard_command(args):
+    """Run the ``leaderboard`` subcommand."""
+    from storage import display_leaderboard, load_leaderboard
+    
+    limit = args.limit or None
+    if not args.json:
+        display_leaderboard(limit)
+        return
+    import json
+    for entry in load_leaderboard(limit):
+        print(json.dumps(entry))
+
+def run_export_command(args):
+    """Run the ``export`` subcommand on the game saved in ``--save-dir``."""
+    import os
+
+    from storage import export_history, export_statistics, load_game_state
+    
+    output = os.path.abspath(args.output)
+    player = Player()
+    cwd = os.getcwd()
+    os.chdir(args.save_dir)
+    try:
+        if not load_game_state(player):
+            print(f"no saved game found in {args.save_dir}")
+            return
+        if output.endswith((".csv", ".jsonl")):
+            exported = export_history(player, output)
+        else:
+            exported = export_statistics(player, output)
+    finally:
+        player.bet_history.close()
+        os.chdir(cwd)
+    if exported:
+        print(f"statistics exported to {args.output}!")
+
+def run_command(args):
+    """Start the CLI roulette game loop or a headless subcommand."""
+    if args.command == "simulate":
+        run_simulate_command(args)
+        return
+    if args.command == "tournament":
+        run_tournament_command(args)
+        return
+    if args.command == "optimize":
+        run_optimize_command(args)
+        return
+    if args.command == "analyze":
+        run_analyze_command(args)
+        return
+    if args.command == "serve":
+        run_serve_command(args)
+        return
+    if args.command == "script":
+        run_script_command(args)
+        return
+    if args.command == "replay":
+        run_replay_command(args)
+        return
+    if args.command == "leaderboard":
+        run_leaderboard_command(args)
+        return
+    if args.command == "export":
+        run_export_command(args)
+        return
+    
     print("welcome to roulette!")
     
     while True:
-        play_again = play_game()
+        if args.bet_log:
+            import secrets
+
+            from replay import BetLog
+            from rng import create_wheel
+            
+            seed = secrets.randbits(64)
+            bet_log = BetLog(args.bet_log, seed)
+            play_again = play_game(create_wheel("buffered", seed), bet_log=bet_log)
+            bet_log.close()
+        else:
+            play_again = play_game()
         
         if not play_again:
             break
@@ -658,5 +1233,25 @@ def main():
             print("\n\nthanks for playing!")
             break
 
+def main(argv=None):
+    """Parse the command line and run it, writing metrics when requested."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "simulate":
+        try:
+            args.bet_value = _simulate_bet_value(args.bet_type, args.bet_value)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.metrics is None:
+        run_command(args)
+        return
+    
+    metrics.enable()
+    try:
+        run_command(args)
+    finally:
+        metrics.write_metrics(args.metrics)
+        print(f"metrics written to {args.metrics}")
+
 if __name__ == "__main__":
     main()
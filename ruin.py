@@ -0,0 +1,214 @@
+"""Exact Markov-chain ruin analysis for the betting strategies.
+
+A session is modelled as an absorbing chain over ``(balance, strategy
+state)``. The strategy state is the ``(current_amount, consecutive_losses,
+fib_index)`` of the real strategy object, advanced with its own
+``on_win``/``on_loss`` methods and clamped only where further growth can no
+longer change a stake (everything above ``MAXIMUM_BET`` plays the same).
+A session is absorbed once the stake would drop below ``MINIMUM_BET`` or
+the balance reaches ``target``. Needs NumPy and SciPy.
+"""
+import math
+
+import numpy as np
+from scipy.sparse import csr_matrix, identity
+from scipy.sparse.csgraph import breadth_first_order
+from scipy.sparse.linalg import spsolve
+
+from config import MAXIMUM_BET, MINIMUM_BET
+from payouts import PAYOUT_TABLE, WHEEL_SIZE, bet_code
+from strategies import create_strategy
+
+DENSE_ROW_ENTRIES = 8
+# Loss-run steps built per array pass; bounds memory for long runs.
+BUILD_CHUNK_ENTRIES = 1 << 18
+
+def _state_key(strategy):
+    """Return the canonical strategy state, clamping irrelevant growth."""
+    if strategy.name == "martingale":
+        losses = strategy.consecutive_losses
+        while losses > 0 and strategy.base_amount * 2 ** (losses - 1) >= MAXIMUM_BET:
+            losses -= 1
+        return (strategy.base_amount * 2 ** losses if losses else strategy.current_amount, losses, 0)
+    if strategy.name == "conservative":
+        return (strategy.current_amount, min(strategy.consecutive_losses, strategy.loss_threshold), 0)
+    if strategy.name == "fibonacci":
+        return (strategy.base_amount, 0, strategy.fib_index)
+    return (min(strategy.current_amount, MAXIMUM_BET), 0, 0)
+
+def _load_state(strategy, key):
+    strategy.current_amount, strategy.consecutive_losses, fib_index = key
+    if hasattr(strategy, 'fib_index'):
+        strategy.fib_index = fib_index
+
+def strategy_graph(strategy_name, base_amount=MINIMUM_BET):
+    """Enumerate strategy states and their win/loss successors.
+
+    Returns ``(keys, amounts, win_next, loss_next)`` where ``amounts`` is
+    the recommended stake in each state and the successor lists hold
+    state indices.
+    """
+    strategy = create_strategy(strategy_name, base_amount)
+    keys = [_state_key(strategy)]
+    index = {keys[0]: 0}
+    amounts, win_next, loss_next = [], [], []
+    i = 0
+    while i < len(keys):
+        _load_state(strategy, keys[i])
+        amounts.append(strategy.get_bet_amount())
+        for handler, successors in ((strategy.on_win, win_next), (strategy.on_loss, loss_next)):
+            _load_state(strategy, keys[i])
+            handler()
+            key = _state_key(strategy)
+            if key not in index:
+                index[key] = len(keys)
+                keys.append(key)
+            successors.append(index[key])
+        i += 1
+    return keys, amounts, win_next, loss_next
+
+def _loss_run(anchor, stakes, loss_next, is_anchor, limit):
+    """Return the states of the loss run from ``anchor``, ending where it stops.
+
+    A run stops at the next anchor or at a stake below ``MINIMUM_BET``; it
+    is cut once the stakes before its last state reach ``limit``, which no
+    balance below it can cover.
+    """
+    chain = [anchor]
+    spent = 0
+    while True:
+        previous = spent
+        spent += stakes[chain[-1]]
+        state = loss_next[chain[-1]]
+        chain.append(state)
+        if is_anchor[state] or stakes[state] < MINIMUM_BET or previous >= limit:
+            return chain
+
+def _balance_grid(bankroll, target, stakes, multiplier):
+    """Return every balance a session can hold while still playing, sorted.
+
+    Balances move by multiples of the stakes' common divisor, except that
+    an all-in win multiplies the balance, so the residues reachable from
+    the bankroll are closed under multiplication by ``multiplier``.
+    """
+    unit = math.gcd(*stakes)
+    residues = set()
+    residue = bankroll % unit
+    while residue not in residues:
+        residues.add(residue)
+        residue = residue * multiplier % unit
+    grid = np.concatenate([np.arange(residue, target, unit, dtype=np.int64) for residue in residues])
+    grid.sort()
+    return grid[grid >= MINIMUM_BET]
+
+def analyze_strategy(strategy_name, bankroll, base_amount=MINIMUM_BET, target=None,
+                     bet_type="color", bet_value="red"):
+    """Solve a strategy session exactly.
+
+    ``target`` defaults to twice the bankroll. Returns the ruin and target
+    probabilities, the expected number of spins and the distribution of
+    final balances as ``{balance: probability}``.
+
+    Deterministic loss runs are folded into single transitions: the chain
+    is only built over "anchor" strategy states (the start, every state a
+    win leads to, and states that loop on a loss), which keeps the sparse
+    system small for progressions such as Martingale and D'Alembert. The
+    transitions of every anchor are built for all balances at once from
+    its loss run, then cut down to the states reachable from the start.
+    """
+    if target is None:
+        target = 2 * bankroll
+    row = PAYOUT_TABLE[bet_code(bet_type, bet_value)]
+    multiplier = max(row)
+    win_probability = sum(1 for m in row if m) / WHEEL_SIZE
+    loss_probability = 1 - win_probability
+    _, amounts, win_next, loss_next = strategy_graph(strategy_name, base_amount)
+    stakes = [min(amount, MAXIMUM_BET) for amount in amounts]
+    if bankroll >= target or min(stakes[0], bankroll) < MINIMUM_BET:
+        return _result(bankroll, target, 0.0, {bankroll: 1.0}, 0)
+
+    is_anchor = [False] * len(amounts)
+    for state in [0, *win_next, *(s for s in range(len(amounts)) if loss_next[s] == s)]:
+        is_anchor[state] = True
+    anchors = [state for state in range(len(amounts)) if is_anchor[state]]
+    anchor_index = np.full(len(amounts), -1)
+    anchor_index[anchors] = np.arange(len(anchors))
+    stake_array = np.array(stakes, dtype=np.int64)
+    win_array = np.array(win_next)
+    balances = _balance_grid(bankroll, target, stakes, multiplier)
+
+    def node(balance, state):
+        # Nodes are numbered in balance order, which keeps the fill-in of
+        # the factorization low.
+        return np.searchsorted(balances, balance) * len(anchors) + anchor_index[state]
+
+    size = len(balances) * len(anchors)
+    spins_per_visit = np.zeros(size)
+    q_parts, r_parts = [], []
+
+    def link(sources, balance, state, probability):
+        absorbed = (balance >= target) | (np.minimum(stake_array[state], balance) < MINIMUM_BET)
+        live = ~absorbed
+        q_parts.append((sources[live], node(balance[live], state[live]), probability[live]))
+        r_parts.append((sources[absorbed], balance[absorbed], probability[absorbed]))
+
+    for anchor in anchors:
+        if stakes[anchor] < MINIMUM_BET:
+            continue
+        chain = np.array(_loss_run(anchor, stakes, loss_next, is_anchor, target))
+        run = len(chain) - 1
+        run_stakes = stake_array[chain[:-1]]
+        spent = np.concatenate(([0], np.cumsum(run_stakes)))
+        weights = loss_probability ** np.arange(run)
+        visit_spins = np.concatenate(([0.0], np.cumsum(weights)))
+        # Every spin of a run is played while the balance before it covers
+        # ``MINIMUM_BET``; a short balance stakes what is left.
+        rows_per_chunk = max(1, BUILD_CHUNK_ENTRIES // run)
+        for low in range(0, len(balances), rows_per_chunk):
+            chunk = balances[low:low + rows_per_chunk]
+            played = np.minimum(run, np.searchsorted(spent[1:], chunk - MINIMUM_BET, side='right') + 1)
+            sources = node(chunk, np.full(len(chunk), anchor))
+            spins_per_visit[sources] = visit_spins[played]
+            steps = np.arange(run) < played[:, None]
+            before = chunk[:, None] - spent[:-1]
+            wagers = np.minimum(run_stakes, before)
+            link(np.broadcast_to(sources[:, None], steps.shape)[steps],
+                 (before + (multiplier - 1) * wagers)[steps],
+                 np.broadcast_to(win_array[chain[:-1]], steps.shape)[steps],
+                 np.broadcast_to(weights * win_probability, steps.shape)[steps])
+            link(sources, np.maximum(chunk - spent[played], 0), chain[played], loss_probability ** played)
+
+    rows, cols, values = (np.concatenate(part) for part in zip(*q_parts))
+    q = csr_matrix((values, (rows, cols)), shape=(size, size))
+    start_node = int(node(bankroll, 0))
+    reachable = np.sort(breadth_first_order(q, start_node, return_predecessors=False))
+    position = np.full(size, -1)
+    position[reachable] = np.arange(len(reachable))
+    size = len(reachable)
+    q = q[reachable][:, reachable]
+
+    sources, final_balances, values = (np.concatenate(part) for part in zip(*r_parts))
+    live = position[sources] >= 0
+    absorbing, columns = np.unique(final_balances[live], return_inverse=True)
+    r = csr_matrix((values[live], (position[sources[live]], columns)), shape=(size, len(absorbing)))
+    start = np.zeros(size)
+    start[position[start_node]] = 1.0
+    system = (identity(size, format='csc') - q).T.tocsc()
+    # Long folded loss runs make rows dense; the balance order then
+    # factors with far less fill-in than a COLAMD reordering.
+    permc_spec = "NATURAL" if q.nnz > DENSE_ROW_ENTRIES * size else "COLAMD"
+    visits = spsolve(system, start, permc_spec=permc_spec)
+    absorbed = r.T @ visits
+    distribution = {int(balance): float(p) for balance, p in zip(absorbing, absorbed)}
+    return _result(bankroll, target, float(visits @ spins_per_visit[reachable]), distribution, size)
+
+def _result(bankroll, target, expected_spins, distribution, states):
+    return {
+        'bankroll': bankroll,
+        'target': target,
+        'states': states,
+        'ruin_probability': sum(p for balance, p in distribution.items() if balance < MINIMUM_BET),
+        'target_probability': sum(p for balance, p in distribution.items() if balance >= target),
+        'expected_spins': expected_spins,
+        'final_balance_distribution': distribution
+    }
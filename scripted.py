@@ -0,0 +1,122 @@
+"""Drive the interactive game from a command script and a fixed spin list.
+
+A script holds one answer per line, exactly as a player would type it at
+each prompt (blank lines are answers too); lines starting with ``#`` are
+comments. Spins come from a fixed list of wheel numbers or a seeded wheel.
+"""
+import contextlib
+import os
+import tempfile
+import time
+
+from achievements import reset_achievements
+from payouts import WHEEL_SIZE
+from rng import WheelRNG, create_wheel
+from roulette import Player, play_game
+
+class ScriptExhausted(BaseException):
+    """Raised when a script runs out of input.
+
+    Derives from ``BaseException`` so the game loop's generic error
+    handlers let it through and the session ends where the script does.
+    """
+
+class ScriptedInput:
+    """Answer prompts from a list of lines instead of the keyboard."""
+
+    def __init__(self, lines, echo=False):
+        self.lines = lines
+        self.position = 0
+        self.echo = echo
+
+    def __call__(self, prompt=""):
+        if self.position >= len(self.lines):
+            raise ScriptExhausted("bet script exhausted")
+        line = self.lines[self.position]
+        self.position += 1
+        if self.echo:
+            print(f"{prompt}{line}")
+        return line
+
+class ScriptedWheel(WheelRNG):
+    """Replay a fixed sequence of wheel numbers."""
+
+    def __init__(self, numbers):
+        self.numbers = list(numbers)
+        for number in self.numbers:
+            if not 0 <= number < WHEEL_SIZE:
+                raise ValueError(f"invalid wheel number: {number}")
+        self.position = 0
+
+    def spin(self):
+        if self.position >= len(self.numbers):
+            raise ScriptExhausted("spin sequence exhausted")
+        number = self.numbers[self.position]
+        self.position += 1
+        return number
+
+    def spin_block(self, count):
+        return [self.spin() for _ in range(count)]
+
+class _NullWriter:
+    """Discard console output without formatting it anywhere."""
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+def read_script(filename):
+    """Return the answer lines of a command script."""
+    with open(filename, 'r') as f:
+        return [line.rstrip("\r\n") for line in f if not line.startswith("#")]
+
+def read_spins(filename):
+    """Return the wheel numbers listed in a file, separated by spaces, commas or lines."""
+    with open(filename, 'r') as f:
+        return [int(token) for token in f.read().replace(",", " ").split()]
+
+def run_script(commands, spins=None, seed=None, balance=None, transcript=None, workdir=None, bet_log=None):
+    """Play one session from ``commands`` and return a summary dict.
+
+    ``spins`` is a fixed list of wheel numbers; without it a buffered wheel
+    seeded with ``seed`` is used. Console output is discarded unless
+    ``transcript`` names a file to write it to. Saves, exports and the
+    leaderboard go to ``workdir``, created if missing, or a scratch
+    directory by default.
+    ``bet_log`` is passed through to ``play_game``.
+    """
+    ask = ScriptedInput(commands, echo=transcript is not None)
+    wheel = ScriptedWheel(spins) if spins is not None else create_wheel("buffered", seed)
+    player = Player(balance)
+    reset_achievements()
+    finished = False
+
+    cwd = os.getcwd()
+    with contextlib.ExitStack() as stack:
+        if workdir is None:
+            workdir = stack.enter_context(tempfile.TemporaryDirectory())
+        else:
+            os.makedirs(workdir, exist_ok=True)
+        output = stack.enter_context(open(transcript, 'w')) if transcript else _NullWriter()
+        os.chdir(workdir)
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(output):
+                play_game(wheel, ask, player, bet_log)
+            finished = True
+        except ScriptExhausted:
+            pass
+        finally:
+            elapsed = time.perf_counter() - start
+            os.chdir(cwd)
+
+    return {
+        'inputs': ask.position,
+        'spins': player.number_tracker.total,
+        'finished': finished,
+        'balance': player.get_balance(),
+        **player.get_statistics(),
+        'elapsed': elapsed
+    }
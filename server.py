@@ -0,0 +1,242 @@
+"""Asyncio multi-table roulette server speaking newline-delimited JSON.
+
+Every connection seats one player at a table. Requests and responses are
+single JSON objects per line::
+
+    {"op": "join", "table": "main", "name": "alice", "balance": 1000}
+    {"op": "bet", "bets": [{"type": "color", "value": "red", "amount": 10}]}
+    {"op": "stats"}
+    {"op": "metrics"}
+    {"op": "leave"}
+
+A ``bet`` reply is sent once the table's round resolves. A round spins
+when every seated player has bet, or ``round_delay`` seconds after the
+first bet of the round, and all bets are settled against that one spin.
+"""
+import asyncio
+import json
+from time import perf_counter
+
+import metrics
+
+from config import INITIAL_BALANCE, MAXIMUM_BET, MINIMUM_BET
+from payouts import NUMBER_COLORS, PAYOUT_TABLE, UNRESOLVED_CODE
+from rng import table_wheel
+from roulette import Bet, Player
+
+DEFAULT_ROUND_DELAY = 1.0
+DEFAULT_BACKLOG = 1024
+
+def parse_bets(items):
+    """Build ``Bet`` objects from request dicts, raising ``ValueError``."""
+    if not isinstance(items, list) or not items:
+        raise ValueError("bets must be a non-empty list")
+    bets = []
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError("each bet must be an object")
+        amount = item.get('amount')
+        if not isinstance(amount, int) or isinstance(amount, bool):
+            raise ValueError("bet amount must be an integer")
+        if amount < MINIMUM_BET:
+            raise ValueError(f"bet amount must be at least ${MINIMUM_BET}")
+        if amount > MAXIMUM_BET:
+            raise ValueError(f"bet amount cannot exceed ${MAXIMUM_BET}")
+        bet = Bet(item.get('type'), item.get('value'), amount)
+        if bet.code == UNRESOLVED_CODE:
+            raise ValueError(f"unsupported bet: {item.get('type')} {item.get('value')}")
+        bets.append(bet)
+    return bets
+
+class Table:
+    """One wheel shared by the players seated at it."""
+
+    def __init__(self, table_id, wheel, round_delay=DEFAULT_ROUND_DELAY):
+        self.table_id = table_id
+        self.wheel = wheel
+        self.round_delay = round_delay
+        self.seats = {}
+        self.pending = {}
+        self.round = 0
+        self._timer = None
+
+    def seat(self, name, balance=INITIAL_BALANCE):
+        """Seat a new player with up to ``INITIAL_BALANCE`` and return it."""
+        if name in self.seats:
+            raise ValueError(f"{name} is already seated at {self.table_id}")
+        if not isinstance(balance, int) or isinstance(balance, bool):
+            raise ValueError("balance must be an integer")
+        if not 0 < balance <= INITIAL_BALANCE:
+            raise ValueError(f"balance must be between $1 and ${INITIAL_BALANCE}")
+        player = Player(balance)
+        self.seats[name] = player
+        return player
+
+    def leave(self, name):
+        """Unseat a player, refunding any stake still waiting for a spin."""
+        player = self.seats.pop(name, None)
+        pending = self.pending.pop(name, None)
+        if pending is not None:
+            bets, future = pending
+            player.add_balance(sum(bet.amount for bet in bets))
+            future.cancel()
+        if self.pending and len(self.pending) == len(self.seats):
+            self._resolve()
+
+    def place(self, name, bets):
+        """Stake ``bets`` for the next spin; return a future for the result."""
+        player = self.seats[name]
+        if name in self.pending:
+            raise ValueError("bets already placed for this round")
+        total = sum(bet.amount for bet in bets)
+        if total > player.get_balance():
+            raise ValueError("insufficient balance")
+        player.subtract_balance(total)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[name] = (bets, future)
+        if len(self.pending) == len(self.seats):
+            self._resolve()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.round_delay, self._resolve)
+        return future
+
+    def _resolve(self):
+        """Spin once and settle every pending bet at the table."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self.pending:
+            return
+        recorder = metrics.recorder
+        if recorder is not None:
+            start = perf_counter()
+        winning_number = self.wheel.spin()
+        if recorder is not None:
+            recorder.observe("spin", perf_counter() - start)
+            recorder.count("spins")
+        self.round += 1
+        for player in self.seats.values():
+            player.record_spin(winning_number)
+
+        for name, (bets, future) in self.pending.items():
+            player = self.seats[name]
+            if recorder is not None:
+                start = perf_counter()
+            payouts = [bet.amount * PAYOUT_TABLE[bet.code][winning_number] for bet in bets]
+            if recorder is not None:
+                recorder.observe("resolve", perf_counter() - start)
+            for bet, payout in zip(bets, payouts):
+                player.add_balance(payout)
+                player.add_bet_to_history(bet, winning_number, payout > 0, payout)
+            if not future.done():
+                future.set_result({
+                    'ok': True,
+                    'table': self.table_id,
+                    'round': self.round,
+                    'number': winning_number,
+                    'color': NUMBER_COLORS[winning_number],
+                    'payouts': payouts,
+                    'balance': player.get_balance()
+                })
+        self.pending = {}
+
+class GameServer:
+    """Route client connections to tables, creating tables on first use."""
+
+    def __init__(self, seed=None, wheel_kind="secure", round_delay=DEFAULT_ROUND_DELAY):
+        self.seed = seed
+        self.wheel_kind = wheel_kind
+        self.round_delay = round_delay
+        self.tables = {}
+
+    def table(self, table_id):
+        """Return the table with ``table_id``, opening it if needed."""
+        table = self.tables.get(table_id)
+        if table is None:
+            wheel = table_wheel(self.seed, table_id, self.wheel_kind)
+            table = Table(table_id, wheel, self.round_delay)
+            self.tables[table_id] = table
+        return table
+
+    def join(self, table_id, name, balance=INITIAL_BALANCE):
+        """Seat ``name`` at ``table_id`` and return ``(table, player)``."""
+        table = self.table(table_id)
+        try:
+            player = table.seat(name, balance)
+        except ValueError:
+            if not table.seats:
+                del self.tables[table_id]
+            raise
+        return table, player
+
+    def leave(self, table, name):
+        """Unseat ``name`` from ``table``, closing the table once it is empty."""
+        table.leave(name)
+        if not table.seats and self.tables.get(table.table_id) is table:
+            del self.tables[table.table_id]
+
+    async def handle(self, reader, writer):
+        """Serve one client connection until it leaves or disconnects."""
+        table = None
+        name = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    op = request.get('op')
+                    if op == "join":
+                        if table is not None:
+                            raise ValueError("already seated")
+                        name = str(request.get('name', f"player{id(writer)}"))
+                        table, player = self.join(str(request.get('table', "main")), name,
+                                                  request.get('balance', INITIAL_BALANCE))
+                        response = {'ok': True, 'table': table.table_id, 'balance': player.get_balance()}
+                    elif table is None:
+                        raise ValueError("join a table first")
+                    elif op == "bet":
+                        response = await table.place(name, parse_bets(request.get('bets')))
+                    elif op == "stats":
+                        player = table.seats[name]
+                        response = {'ok': True, 'balance': player.get_balance(), **player.get_statistics(),
+                                    **player.get_risk_statistics()}
+                    elif op == "metrics":
+                        if metrics.recorder is None:
+                            raise ValueError("metrics are disabled")
+                        response = {'ok': True, **metrics.recorder.to_dict()}
+                    elif op == "leave":
+                        self.leave(table, name)
+                        table = None
+                        response = {'ok': True}
+                    else:
+                        raise ValueError(f"unknown op: {op}")
+                except (ValueError, TypeError, AttributeError) as e:
+                    response = {'ok': False, 'error': str(e)}
+                writer.write(json.dumps(response, separators=(',', ':')).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if table is not None:
+                self.leave(table, name)
+            writer.close()
+
+async def start_server(server, host="127.0.0.1", port=8765, unix_path=None, backlog=DEFAULT_BACKLOG):
+    """Start listening on TCP, or on a Unix socket when ``unix_path`` is set.
+
+    ``backlog`` bounds the connections waiting to be accepted; asyncio's
+    default of 100 resets clients when hundreds of players connect at once.
+    """
+    if unix_path:
+        return await asyncio.start_unix_server(server.handle, path=unix_path, backlog=backlog)
+    return await asyncio.start_server(server.handle, host, port, backlog=backlog)
+
+async def serve(host="127.0.0.1", port=8765, unix_path=None, backlog=DEFAULT_BACKLOG, **server_options):
+    """Run a ``GameServer`` until cancelled."""
+    listener = await start_server(GameServer(**server_options), host, port, unix_path, backlog)
+    where = unix_path or f"{host}:{port}"
+    print(f"roulette server listening on {where}")
+    async with listener:
+        await listener.serve_forever()
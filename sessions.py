@@ -0,0 +1,104 @@
+"""Headless strategy sessions for batch simulation."""
+import json
+import random
+import sys
+from time import perf_counter
+
+import metrics
+
+from config import INITIAL_BALANCE, MAXIMUM_BET, MINIMUM_BET
+from payouts import PAYOUT_TABLE, bet_code
+from rng import DEFAULT_BLOCK_SIZE, BufferedWheel
+from strategies import create_strategy
+
+def session_seed(seed, index):
+    """Return the RNG seed of one session in a seeded batch."""
+    return f"{seed}:{index}"
+
+def run_session(strategy_name, bankroll=INITIAL_BALANCE, spins=1000, seed=None,
+                base_amount=MINIMUM_BET, bet_type="color", bet_value="red", target=None,
+                stop_loss=None, strategy_options=None):
+    """Play one strategy session without any console output.
+
+    Stakes are capped at ``MAXIMUM_BET`` and the remaining balance; the
+    session ends early once the balance cannot cover ``MINIMUM_BET``,
+    when ``target`` is given once the balance reaches it, and when
+    ``stop_loss`` is given once the balance falls to it.
+    ``strategy_options`` are passed on to ``create_strategy``.
+    Only running aggregates are kept, never the per-spin history.
+    """
+    start = perf_counter()
+    spin = BufferedWheel(seed, block_size=max(1, min(spins, DEFAULT_BLOCK_SIZE))).spin
+    strategy = create_strategy(strategy_name, base_amount, **(strategy_options or {}))
+    payouts = PAYOUT_TABLE[bet_code(bet_type, bet_value)]
+    balance = bankroll
+    peak_balance = bankroll
+    max_drawdown = 0
+    spins_survived = 0
+    wagered = 0
+
+    for _ in range(spins):
+        if target is not None and balance >= target:
+            break
+        if stop_loss is not None and balance <= stop_loss:
+            break
+        amount = min(strategy.get_bet_amount(), balance, MAXIMUM_BET)
+        if amount < MINIMUM_BET:
+            break
+        payout = amount * payouts[spin()]
+        balance += payout - amount
+        wagered += amount
+        spins_survived += 1
+        if payout:
+            strategy.on_win()
+            if balance > peak_balance:
+                peak_balance = balance
+        else:
+            strategy.on_loss()
+            if peak_balance - balance > max_drawdown:
+                max_drawdown = peak_balance - balance
+
+    recorder = metrics.recorder
+    if recorder is not None:
+        recorder.observe("session", perf_counter() - start)
+        recorder.count("sessions")
+        recorder.count("spins", spins_survived)
+        recorder.count_bets(bet_type, wagered, balance - bankroll + wagered, spins_survived)
+    
+    return {
+        'strategy': strategy_name,
+        'seed': seed,
+        'bankroll': bankroll,
+        'base_amount': base_amount,
+        'final_balance': balance,
+        'peak_balance': peak_balance,
+        'max_drawdown': max_drawdown,
+        'spins_survived': spins_survived,
+        'ruined': balance < MINIMUM_BET,
+        'reached_target': target is not None and balance >= target
+    }
+
+def iter_sessions(strategy_name, sessions, seed, **session_options):
+    """Yield results for ``sessions`` independently seeded sessions."""
+    for index in range(sessions):
+        result = run_session(strategy_name, seed=session_seed(seed, index), **session_options)
+        result['session'] = index
+        yield result
+
+def write_jsonl(results, stream):
+    """Write each result as one compact JSON line as soon as it is ready."""
+    count = 0
+    for result in results:
+        stream.write(json.dumps(result, separators=(',', ':')) + "\n")
+        count += 1
+    return count
+
+def run_simulation(strategy_name, sessions=1, seed=None, output="-", **session_options):
+    """Stream session results as JSONL to stdout or a file."""
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    results = iter_sessions(strategy_name, sessions, seed, **session_options)
+    if output == "-":
+        return write_jsonl(results, sys.stdout)
+    with open(output, 'w') as f:
+        return write_jsonl(results, f)
@@ -0,0 +1,269 @@
+"""Vectorized Monte Carlo spin resolution and strategy sessions built on NumPy."""
+import numpy as np
+
+from config import INITIAL_BALANCE, MAXIMUM_BET, MINIMUM_BET
+from payouts import WHEEL_SIZE, payout_multipliers
+from rng import WheelRNG
+from strategies import CONSERVATIVE_LOSS_THRESHOLD, FIBONACCI_LENGTH, FibonacciStrategy
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+def payout_vector(bet_type, value=None):
+    """Return the payout multiplier of a bet for every wheel number."""
+    return np.asarray(payout_multipliers(bet_type, value), dtype=np.int64)
+
+def spin_batch(count, rng=None):
+    """Draw ``count`` wheel results as a NumPy array.
+
+    ``rng`` is a NumPy ``Generator`` or any ``rng.WheelRNG`` source.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    if isinstance(rng, WheelRNG):
+        return np.array(rng.spin_block(count), dtype=np.uint8)
+    return rng.integers(0, WHEEL_SIZE, size=count, dtype=np.uint8)
+
+def resolve_bets(bet_type, value, amounts, spins):
+    """Return the payouts of same-kind bets against an array of spins.
+
+    ``amounts`` may be a scalar stake or an array matching ``spins``; the
+    results equal ``calculate_payout`` applied element by element.
+    """
+    return payout_vector(bet_type, value)[spins] * np.asarray(amounts, dtype=np.int64)
+
+def resolve_bet_slip(bets, spins):
+    """Return the total payout of several ``Bet`` objects for each spin."""
+    table = np.zeros(WHEEL_SIZE, dtype=np.int64)
+    for bet in bets:
+        table += payout_vector(bet.bet_type, bet.value) * bet.amount
+    return table[spins]
+
+def stress_test_limits(bet_type, value=None, spins=DEFAULT_CHUNK_SIZE, seed=None,
+                       amounts=(MINIMUM_BET, MAXIMUM_BET), chunk_size=DEFAULT_CHUNK_SIZE):
+    """Simulate flat betting at each stake and summarize the table's exposure.
+
+    Stakes default to the table limits from ``config``. Spins are drawn in
+    chunks so memory stays bounded for very long runs.
+    """
+    for amount in amounts:
+        if amount < MINIMUM_BET or amount > MAXIMUM_BET:
+            raise ValueError(f"bet amount ${amount} is outside the table limits")
+
+    rng = np.random.default_rng(seed)
+    table = payout_vector(bet_type, value)
+    stakes = np.asarray(amounts, dtype=np.int64)
+    paid = np.zeros(len(stakes), dtype=np.int64)
+    max_payout = np.zeros(len(stakes), dtype=np.int64)
+    wins = 0
+
+    remaining = spins
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        multipliers = table[spin_batch(size, rng)]
+        total = int(multipliers.sum())
+        wins += int(np.count_nonzero(multipliers))
+        paid += stakes * total
+        max_payout = np.maximum(max_payout, stakes * int(multipliers.max()))
+        remaining -= size
+
+    results = []
+    for i, amount in enumerate(amounts):
+        wagered = int(amount) * spins
+        results.append({
+            'amount': int(amount),
+            'spins': spins,
+            'wins': wins,
+            'wagered': wagered,
+            'paid': int(paid[i]),
+            'house_profit': wagered - int(paid[i]),
+            'max_payout': int(max_payout[i])
+        })
+    return results
+
+# Martingale stakes saturate here instead of overflowing int64; any stake
+# this large is capped by MAXIMUM_BET and the balance long before.
+AMOUNT_LIMIT = 1 << 62
+
+def _masked_set(array, values, mask):
+    """Set ``array`` to ``values`` where ``mask`` holds, in place.
+
+    Adding the masked difference is branch free, so it beats ``np.where``
+    and ``where=`` writes on the scattered masks of independent sessions.
+    """
+    difference = values - array
+    difference *= mask
+    array += difference
+
+class StrategyArray:
+    """Strategy state of ``count`` independent sessions held in arrays.
+
+    Mirrors ``strategies.BettingStrategy``: element ``i`` of every array
+    matches the attribute of the scalar strategy of session ``i`` after the
+    same wins and losses. ``on_win`` and ``on_loss`` take a boolean mask
+    of the sessions to update and leave the others untouched; updates are
+    computed for every session and blended in through the mask.
+    ``base_amount`` is a stake shared by every session or one per session.
+    """
+
+    def __init__(self, name, count, base_amount=MINIMUM_BET):
+        self.name = name
+        self.count = count
+        self.base_amount = np.broadcast_to(np.asarray(base_amount, dtype=np.int64), count).copy()
+        self.current_amount = self.base_amount.copy()
+        self.consecutive_losses = np.zeros(count, dtype=np.int64)
+
+    def get_bet_amounts(self):
+        """Return the next recommended bet amount of every session."""
+        return self.current_amount
+
+    def on_win(self, mask):
+        _masked_set(self.current_amount, self.base_amount, mask)
+        self.consecutive_losses *= ~mask
+
+    def on_loss(self, mask):
+        self.consecutive_losses += mask
+
+class MartingaleArray(StrategyArray):
+    """Double the bet amount after each loss."""
+
+    def __init__(self, count, base_amount=MINIMUM_BET):
+        super().__init__("martingale", count, base_amount)
+
+    def on_loss(self, mask):
+        super().on_loss(mask)
+        # base * 2 ** losses is the previous stake doubled, as every win
+        # resets the stake to base and the loss count to zero.
+        _masked_set(self.current_amount, np.minimum(self.current_amount, AMOUNT_LIMIT >> 1) * 2, mask)
+
+class FibonacciArray(StrategyArray):
+    """Advance through the first ``length`` Fibonacci numbers after losses."""
+
+    def __init__(self, count, base_amount=MINIMUM_BET, length=FIBONACCI_LENGTH):
+        super().__init__("fibonacci", count, base_amount)
+        self.fib_sequence = np.array(FibonacciStrategy(MINIMUM_BET, length).fib_sequence, dtype=np.int64)
+        self.fib_index = np.zeros(count, dtype=np.int64)
+
+    def get_bet_amounts(self):
+        return self.fib_sequence[self.fib_index] * self.base_amount
+
+    def on_win(self, mask):
+        super().on_win(mask)
+        _masked_set(self.fib_index, np.maximum(0, self.fib_index - 2), mask)
+
+    def on_loss(self, mask):
+        super().on_loss(mask)
+        _masked_set(self.fib_index, np.minimum(len(self.fib_sequence) - 1, self.fib_index + 1), mask)
+
+class ConservativeArray(StrategyArray):
+    """Halve the bet once ``loss_threshold`` consecutive losses are reached."""
+
+    def __init__(self, count, base_amount=MINIMUM_BET, loss_threshold=CONSERVATIVE_LOSS_THRESHOLD):
+        super().__init__("conservative", count, base_amount)
+        if loss_threshold < 1:
+            raise ValueError("loss threshold must be at least 1")
+        self.loss_threshold = loss_threshold
+
+    def on_loss(self, mask):
+        super().on_loss(mask)
+        halved = self.consecutive_losses >= self.loss_threshold
+        amount = np.where(halved, np.maximum(MINIMUM_BET, self.current_amount // 2), self.base_amount)
+        _masked_set(self.current_amount, amount, mask)
+
+class DAlembertArray(StrategyArray):
+    """Increase after losses and decrease after wins by one base unit."""
+
+    def __init__(self, count, base_amount=MINIMUM_BET):
+        super().__init__("d'alembert", count, base_amount)
+
+    def on_win(self, mask):
+        super().on_win(mask)
+        amount = np.maximum(MINIMUM_BET, self.current_amount - self.base_amount)
+        _masked_set(self.current_amount, amount, mask)
+
+    def on_loss(self, mask):
+        super().on_loss(mask)
+        self.current_amount += self.base_amount * mask
+
+class FlatArray(StrategyArray):
+    """Bet the same base amount on every spin."""
+
+    def __init__(self, count, base_amount=MINIMUM_BET):
+        super().__init__("flat", count, base_amount)
+
+STRATEGY_ARRAYS = {
+    'flat': FlatArray,
+    'martingale': MartingaleArray,
+    'fibonacci': FibonacciArray,
+    'conservative': ConservativeArray,
+    'dalembert': DAlembertArray
+}
+
+def create_strategy_array(name, count, base_amount=MINIMUM_BET, **options):
+    """Build the array counterpart of a ``strategies.STRATEGIES`` entry."""
+    try:
+        strategy_class = STRATEGY_ARRAYS[name]
+    except KeyError:
+        raise ValueError(f"unknown strategy: {name}") from None
+    try:
+        return strategy_class(count, base_amount, **options)
+    except TypeError:
+        raise ValueError(f"{name} does not take {', '.join(options)}") from None
+
+def simulate_sessions(strategy_name, sessions, bankroll=INITIAL_BALANCE, spins=1000, rng=None,
+                      base_amount=MINIMUM_BET, bet_type="color", bet_value="red", target=None,
+                      stop_loss=None, strategy_options=None):
+    """Play ``sessions`` strategy sessions side by side, one spin at a time.
+
+    Follows ``sessions.run_session`` rule for rule: stakes are capped at
+    ``MAXIMUM_BET`` and the remaining balance, and a session stops for
+    good once it cannot cover ``MINIMUM_BET``, reaches ``target`` or falls
+    to ``stop_loss``. Every spin draws one wheel result per session from
+    ``rng`` (see ``spin_batch``); stopped sessions are masked out of the
+    update. Returns a dict of per-session arrays plus the strategy state.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    strategy = create_strategy_array(strategy_name, sessions, base_amount, **(strategy_options or {}))
+    table = payout_vector(bet_type, bet_value)
+    balance = np.broadcast_to(np.asarray(bankroll, dtype=np.int64), sessions).copy()
+    start_balance = balance.copy()
+    peak_balance = balance.copy()
+    max_drawdown = np.zeros(sessions, dtype=np.int64)
+    spins_survived = np.zeros(sessions, dtype=np.int64)
+    wagered = np.zeros(sessions, dtype=np.int64)
+    running = np.ones(sessions, dtype=bool)
+
+    for _ in range(spins):
+        if target is not None:
+            running &= balance < target
+        if stop_loss is not None:
+            running &= balance > stop_loss
+        amount = np.minimum(np.minimum(strategy.get_bet_amounts(), balance), MAXIMUM_BET)
+        running &= amount >= MINIMUM_BET
+        if not running.any():
+            break
+        amount *= running
+        payout = amount * table[spin_batch(sessions, rng)]
+        balance += payout - amount
+        wagered += amount
+        spins_survived += running
+        won = running & (payout > 0)
+        lost = running & (payout == 0)
+        strategy.on_win(won)
+        strategy.on_loss(lost)
+        # Only wins raise the balance and only losses deepen the drawdown,
+        # so updating every session gives the same peaks and drawdowns.
+        np.maximum(peak_balance, balance, out=peak_balance)
+        np.maximum(max_drawdown, peak_balance - balance, out=max_drawdown)
+
+    return {
+        'strategy': strategy,
+        'bankroll': start_balance,
+        'final_balance': balance,
+        'peak_balance': peak_balance,
+        'max_drawdown': max_drawdown,
+        'spins_survived': spins_survived,
+        'wagered': wagered,
+        'ruined': balance < MINIMUM_BET,
+        'reached_target': balance >= target if target is not None else np.zeros(sessions, dtype=bool)
+    }
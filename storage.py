@@ -1,12 +1,99 @@
 import json
 import os
+from contextlib import closing
+from time import perf_counter
+
+import metrics
+
+from history import HISTORY_RECORD, BetHistory, PagedBetHistory, RecordedBet
+from hotcold import NumberTracker
 
 SAVE_FILE = "game_save.json"
+JOURNAL_FILE = "game_save.journal"
+HISTORY_FILE = "game_save.history"
 LEADERBOARD_FILE = "leaderboard.json"
+LEADERBOARD_DB = "leaderboard.db"
+SNAPSHOT_INTERVAL = 500
+EXPORT_BUFFER_SIZE = 1 << 20
+EXPORT_CHUNK_ROWS = 10000
+EXPORT_FIELDS = ('index', 'bet_type', 'value', 'amount', 'winning_number', 'won', 'payout')
 
-def save_game_state(player):
-    """Persist the current player state to disk."""
-    save_data = {
+class GameJournal:
+    """Append each resolved bet to the save journal and compact periodically.
+
+    Records are compact JSON arrays of ``[sequence, bet_type, value, amount,
+    winning_number, won, payout, balance]`` for bets and ``["spin", sequence,
+    number]`` for wheel results. Every ``snapshot_interval`` records the
+    journal is folded into a fresh snapshot of ``SAVE_FILE``.
+    """
+
+    def __init__(self, snapshot_interval=SNAPSHOT_INTERVAL, pending=0):
+        self.snapshot_interval = snapshot_interval
+        self.pending = pending
+    
+    def record(self, player, bet, winning_number, won, payout):
+        """Append one resolved bet; called from ``Player.add_bet_to_history``."""
+        entry = [
+            len(player.bet_history) - 1,
+            bet.bet_type,
+            bet.value,
+            bet.amount,
+            winning_number,
+            won,
+            payout,
+            player.balance
+        ]
+        self._append(player, entry)
+    
+    def record_spin(self, player, number):
+        """Append one wheel result; called from ``Player.record_spin``."""
+        self._append(player, ["spin", player.number_tracker.total - 1, number])
+    
+    def _append(self, player, entry):
+        recorder = metrics.recorder
+        if recorder is not None:
+            start = perf_counter()
+        line = json.dumps(entry, separators=(',', ':')) + "\n"
+        with open(JOURNAL_FILE, 'a') as f:
+            f.write(line)
+        if recorder is not None:
+            recorder.observe("journal", perf_counter() - start)
+            recorder.count("journal_records")
+            recorder.count("journal_bytes", len(line))
+        self.pending += 1
+        if self.pending >= self.snapshot_interval:
+            _write_snapshot(player)
+            self.pending = 0
+
+def write_history(history, filename=HISTORY_FILE):
+    """Append the bets not yet in ``filename`` and return the bytes written.
+
+    A history that has never been saved replaces the file atomically;
+    otherwise any rows past ``saved_count`` (left by an interrupted save)
+    are truncated before the new ones are appended.
+    """
+    start = history.saved_count if os.path.exists(filename) else 0
+    end = len(history)
+    target = filename
+    if not start:
+        filename += ".tmp"
+    with open(filename, 'r+b' if start else 'wb') as f:
+        f.seek(start * HISTORY_RECORD.size)
+        f.truncate()
+        for chunk_start in range(start, end, EXPORT_CHUNK_ROWS):
+            columns = history.columns(chunk_start, min(chunk_start + EXPORT_CHUNK_ROWS, end))
+            f.write(b"".join(HISTORY_RECORD.pack(*row) for row in zip(*columns)))
+        f.flush()
+        os.fsync(f.fileno())
+    if not start:
+        os.replace(filename, target)
+    history.saved_count = end
+    return (end - start) * HISTORY_RECORD.size
+
+def snapshot_data(player):
+    """Return the JSON snapshot of a player; bet rows live in the history file."""
+    history = player.get_bet_history()
+    return {
         'balance': player.get_balance(),
         'initial_balance': player.initial_balance,
         'wins': player.wins,
@@ -18,30 +105,170 @@ def save_game_state(player):
         'number_frequency': player.number_frequency,
         'best_payout': player.best_payout,
         'worst_loss': player.worst_loss,
-        'bet_history': []
+        'number_tracker': player.number_tracker.to_dict(),
+        'history_count': len(history),
+        'history_keys': history.keys(),
+        'max_bet_amount': history.max_amount,
+        'trailing_wins': history.trailing_wins,
+        'peak_balance': player.peak_balance,
+        'max_drawdown': player.max_drawdown
     }
+
+def _write_snapshot(player):
+    """Atomically replace the snapshot file and clear the journal tail.
+
+    Bet history lives in ``HISTORY_FILE`` and only new bets are written, so
+    the JSON snapshot holds counters and stays small as the session grows.
+    """
+    recorder = metrics.recorder
+    if recorder is not None:
+        start = perf_counter()
+    written = write_history(player.get_bet_history())
+    save_data = snapshot_data(player)
     
-    for h in player.get_bet_history():
-        bet_info = h['bet']
-        save_data['bet_history'].append({
-            'bet_type': bet_info.bet_type,
-            'value': bet_info.value,
-            'amount': bet_info.amount,
-            'winning_number': h['winning_number'],
-            'won': h['won'],
-            'payout': h['payout']
-        })
+    temp_file = SAVE_FILE + ".tmp"
+    with open(temp_file, 'w') as f:
+        json.dump(save_data, f, separators=(',', ':'))
+        f.flush()
+        os.fsync(f.fileno())
+        written += f.tell()
+    os.replace(temp_file, SAVE_FILE)
+    open(JOURNAL_FILE, 'w').close()
+    if recorder is not None:
+        recorder.observe("save", perf_counter() - start)
+        recorder.count("saves")
+        recorder.count("save_bytes", written)
+
+def _replay_journal(player):
+    """Apply journal records newer than the loaded snapshot.
+
+    Returns the number of replayed records and whether the journal ended
+    cleanly; a torn final record from a crash mid-append is dropped.
+    """
+    if not os.path.exists(JOURNAL_FILE):
+        return 0, True
     
+    replayed = 0
+    with open(JOURNAL_FILE, 'r') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                if entry[0] == "spin":
+                    _, sequence, number = entry
+                    if sequence > player.number_tracker.total:
+                        return replayed, False
+                    if sequence == player.number_tracker.total:
+                        player.record_spin(number)
+                        replayed += 1
+                    continue
+                sequence, bet_type, value, amount, winning_number, won, payout, balance = entry
+            except (ValueError, TypeError, IndexError):
+                return replayed, False
+            if sequence < len(player.bet_history):
+                continue
+            if sequence > len(player.bet_history):
+                return replayed, False
+            player.balance = balance
+            player.add_bet_to_history(RecordedBet(bet_type, value, amount), winning_number, won, payout)
+            replayed += 1
+    return replayed, True
+
+def restore_snapshot(player, save_data, history_file=HISTORY_FILE):
+    """Set a player's counters and history from a snapshot dict."""
+    player.balance = save_data.get('balance', player.initial_balance)
+    player.initial_balance = save_data.get('initial_balance', player.initial_balance)
+    player.wins = save_data.get('wins', 0)
+    player.losses = save_data.get('losses', 0)
+    player.current_win_streak = save_data.get('current_win_streak', 0)
+    player.current_loss_streak = save_data.get('current_loss_streak', 0)
+    player.max_win_streak = save_data.get('max_win_streak', 0)
+    player.max_loss_streak = save_data.get('max_loss_streak', 0)
+    player.number_frequency = {
+        int(number): count for number, count in save_data.get('number_frequency', {}).items()
+    }
+    player.best_payout = save_data.get('best_payout', 0)
+    player.worst_loss = save_data.get('worst_loss', 0)
+    player.bet_history.close()
+    if 'bet_history' in save_data:
+        player.bet_history = BetHistory()
+        for h in save_data['bet_history']:
+            bet = RecordedBet(h['bet_type'], h['value'], h['amount'])
+            player.bet_history.append(bet, h['winning_number'], h['won'], h['payout'])
+    else:
+        player.bet_history = PagedBetHistory(
+            history_file,
+            save_data.get('history_count', 0),
+            save_data.get('history_keys', []),
+            save_data.get('max_bet_amount', 0),
+            save_data.get('trailing_wins', 0)
+        )
+    if 'number_tracker' in save_data:
+        player.number_tracker = NumberTracker.from_dict(save_data['number_tracker'])
+    else:
+        _rebuild_number_tracker(player)
+    if 'peak_balance' in save_data:
+        player.peak_balance = save_data['peak_balance']
+        player.max_drawdown = save_data['max_drawdown']
+    else:
+        _rebuild_drawdown(player)
+
+def _rebuild_number_tracker(player):
+    """Count wheel results from the history of saves written before spins were tracked.
+
+    Old saves do not group rows by spin, so every row counts as one spin,
+    as ``number_frequency`` always has.
+    """
+    history = player.get_bet_history()
+    player.number_tracker = NumberTracker()
+    for chunk_start in range(0, len(history), EXPORT_CHUNK_ROWS):
+        _, _, winning_numbers, _, _ = history.columns(chunk_start, min(chunk_start + EXPORT_CHUNK_ROWS, len(history)))
+        for number in winning_numbers:
+            player.number_tracker.record(number)
+
+def _rebuild_drawdown(player):
+    """Recompute peak balance and max drawdown for saves written before they were tracked.
+
+    The balance path is rebuilt from the net result of every row, ending
+    at the loaded balance. The other risk figures are always folded from
+    the history on demand by ``Player.get_risk_statistics``.
+    """
+    history = player.get_bet_history()
+    path = peak = max_drawdown = 0
+    for chunk_start in range(0, len(history), EXPORT_CHUNK_ROWS):
+        _, amounts, _, _, payouts = history.columns(chunk_start, min(chunk_start + EXPORT_CHUNK_ROWS, len(history)))
+        for amount, payout in zip(amounts, payouts):
+            path += payout - amount
+            if path > peak:
+                peak = path
+            elif peak - path > max_drawdown:
+                max_drawdown = peak - path
+    start = player.balance - path
+    player.peak_balance = start + peak
+    player.max_drawdown = max_drawdown
+
+def save_game_state(player):
+    """Persist the current player state and keep journaling later bets.
+
+    The first save writes a full snapshot; from then on every resolved bet
+    is appended to the journal so the save stays current at O(1) per bet.
+    """
     try:
-        with open(SAVE_FILE, 'w') as f:
-            json.dump(save_data, f, indent=2)
+        _write_snapshot(player)
+        if player.journal is None:
+            player.journal = GameJournal()
+        else:
+            player.journal.pending = 0
         return True
     except Exception as e:
         print(f"error saving game: {str(e)}")
         return False
 
 def load_game_state(player):
-    """Load saved player state from disk into an existing player object."""
+    """Load the latest snapshot plus journal tail into an existing player.
+
+    Counters are restored straight from the snapshot while the saved bet
+    history is memory-mapped and read only when it is accessed.
+    """
     if not os.path.exists(SAVE_FILE):
         return False
     
@@ -49,43 +276,28 @@ def load_game_state(player):
         with open(SAVE_FILE, 'r') as f:
             save_data = json.load(f)
         
-        player.balance = save_data.get('balance', player.initial_balance)
-        player.initial_balance = save_data.get('initial_balance', player.initial_balance)
-        player.wins = save_data.get('wins', 0)
-        player.losses = save_data.get('losses', 0)
-        player.current_win_streak = save_data.get('current_win_streak', 0)
-        player.current_loss_streak = save_data.get('current_loss_streak', 0)
-        player.max_win_streak = save_data.get('max_win_streak', 0)
-        player.max_loss_streak = save_data.get('max_loss_streak', 0)
-        player.number_frequency = save_data.get('number_frequency', {})
-        player.best_payout = save_data.get('best_payout', 0)
-        player.worst_loss = save_data.get('worst_loss', 0)
-        player.bet_history = []
-        
-        class Bet:
-            """Minimal bet record used to restore serialized history."""
-
-            def __init__(self, bet_type, value, amount):
-                self.bet_type = bet_type
-                self.value = value
-                self.amount = amount
-        
-        for h in save_data.get('bet_history', []):
-            bet = Bet(h['bet_type'], h['value'], h['amount'])
-            player.bet_history.append({
-                'bet': bet,
-                'winning_number': h['winning_number'],
-                'won': h['won'],
-                'payout': h['payout']
-            })
+        player.journal = None
+        restore_snapshot(player, save_data)
         
+        replayed, clean = _replay_journal(player)
+        if not clean:
+            _write_snapshot(player)
+            replayed = 0
+        player.journal = GameJournal(pending=replayed)
         return True
     except Exception as e:
         print(f"error loading game: {str(e)}")
         return False
 
 def delete_save_file():
-    """Delete the local save file when it exists."""
+    """Delete the local save snapshot, journal and history when they exist."""
+    for filename in (JOURNAL_FILE, HISTORY_FILE):
+        if os.path.exists(filename):
+            try:
+                os.remove(filename)
+            except Exception as e:
+                print(f"error deleting save: {str(e)}")
+                return False
     if os.path.exists(SAVE_FILE):
         try:
             os.remove(SAVE_FILE)
@@ -99,52 +311,94 @@ def save_exists():
     """Return whether a save file exists."""
     return os.path.exists(SAVE_FILE)
 
-def save_to_leaderboard(player_name, final_balance, profit, total_bets, win_rate):
-    """Add one leaderboard entry and keep the top ten by final balance."""
-    leaderboard = load_leaderboard()
-    
-    entry = {
-        'name': player_name,
-        'final_balance': final_balance,
-        'profit': profit,
-        'total_bets': total_bets,
-        'win_rate': win_rate
-    }
-    
-    leaderboard.append(entry)
-    leaderboard.sort(key=lambda x: x['final_balance'], reverse=True)
-    leaderboard = leaderboard[:10]
+def _connect_leaderboard():
+    """Open the leaderboard database, creating and migrating it on first use.
+
+    The database runs in WAL mode so concurrent sessions can append entries
+    without dropping each other's writes. Entries from the legacy JSON
+    leaderboard are imported once, guarded by ``PRAGMA user_version``.
+    """
+    import sqlite3
     
+    conn = sqlite3.connect(LEADERBOARD_DB, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS leaderboard ("
+        "id INTEGER PRIMARY KEY, name TEXT NOT NULL, final_balance INTEGER NOT NULL, "
+        "profit INTEGER NOT NULL, total_bets INTEGER NOT NULL, win_rate REAL NOT NULL)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS leaderboard_final_balance "
+        "ON leaderboard (final_balance DESC, id)"
+    )
+    if conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+                _migrate_json_leaderboard(conn)
+                conn.execute("PRAGMA user_version = 1")
+    return conn
+
+def _migrate_json_leaderboard(conn):
+    """Copy entries from the legacy JSON leaderboard file into the database."""
+    if not os.path.exists(LEADERBOARD_FILE):
+        return
+    with open(LEADERBOARD_FILE, 'r') as f:
+        entries = json.load(f)
+    conn.executemany(
+        "INSERT INTO leaderboard (name, final_balance, profit, total_bets, win_rate) VALUES (?, ?, ?, ?, ?)",
+        [(e['name'], e['final_balance'], e['profit'], e['total_bets'], e['win_rate']) for e in entries]
+    )
+
+def save_to_leaderboard(player_name, final_balance, profit, total_bets, win_rate):
+    """Add one leaderboard entry; the full entry history is kept."""
     try:
-        with open(LEADERBOARD_FILE, 'w') as f:
-            json.dump(leaderboard, f, indent=2)
+        with closing(_connect_leaderboard()) as conn, conn:
+            conn.execute(
+                "INSERT INTO leaderboard (name, final_balance, profit, total_bets, win_rate) VALUES (?, ?, ?, ?, ?)",
+                (player_name, final_balance, profit, total_bets, win_rate)
+            )
         return True
     except Exception as e:
         print(f"error saving to leaderboard: {str(e)}")
         return False
 
-def load_leaderboard():
-    """Load leaderboard entries from disk."""
-    if not os.path.exists(LEADERBOARD_FILE):
-        return []
+def load_leaderboard(limit=10):
+    """Load the top ``limit`` entries by final balance (all when ``None``)."""
+    query = "SELECT name, final_balance, profit, total_bets, win_rate FROM leaderboard ORDER BY final_balance DESC, id"
+    params = ()
+    if limit is not None:
+        query += " LIMIT ?"
+        params = (limit,)
     
     try:
-        with open(LEADERBOARD_FILE, 'r') as f:
-            return json.load(f)
+        with closing(_connect_leaderboard()) as conn:
+            rows = conn.execute(query, params).fetchall()
     except Exception as e:
         print(f"error loading leaderboard: {str(e)}")
         return []
+    
+    return [
+        {
+            'name': name,
+            'final_balance': final_balance,
+            'profit': profit,
+            'total_bets': total_bets,
+            'win_rate': win_rate
+        }
+        for name, final_balance, profit, total_bets, win_rate in rows
+    ]
 
-def display_leaderboard():
-    """Print leaderboard entries in ranked order."""
-    leaderboard = load_leaderboard()
+def display_leaderboard(limit=10):
+    """Print the top ``limit`` leaderboard entries in ranked order."""
+    leaderboard = load_leaderboard(limit)
     if not leaderboard:
         print("no leaderboard entries yet")
         return
     
     from utils import display_separator
     display_separator()
-    print("top 10 leaderboard:")
+    print(f"top {limit} leaderboard:" if limit is not None else "leaderboard:")
     display_separator()
     for i, entry in enumerate(leaderboard, 1):
         print(f"{i}. {entry['name']} - balance: ${entry['final_balance']} | profit: ${entry['profit']} | bets: {entry['total_bets']} | win rate: {entry['win_rate']:.1f}%")
@@ -153,6 +407,7 @@ def display_leaderboard():
 def export_statistics(player, filename="statistics.txt"):
     """Export the current session statistics and history to a text file."""
     stats = player.get_statistics()
+    risk = player.get_risk_statistics()
     history = player.get_bet_history()
     
     try:
@@ -167,16 +422,23 @@ def export_statistics(player, filename="statistics.txt"):
             f.write(f"wins: {stats['wins']}\n")
             f.write(f"losses: {stats['losses']}\n")
             f.write(f"win rate: {stats['win_rate']:.1f}%\n\n")
+            f.write("risk statistics:\n")
+            f.write(f"total wagered: ${risk['total_wagered']}\n")
+            f.write(f"return to player: {risk['rtp']:.2f}%\n")
+            f.write(f"net per bet: mean {risk['mean_net']:.4f}, variance {risk['net_variance']:.4f}\n")
+            f.write(f"peak balance: ${risk['peak_balance']}\n")
+            f.write(f"max drawdown: ${risk['max_drawdown']}\n")
+            f.write(f"current drawdown: ${risk['current_drawdown']}\n")
+            for bet_type, type_profit in sorted(risk['profit_by_type'].items()):
+                f.write(f"{bet_type} profit: ${type_profit}\n")
+            f.write("\n")
             
             if history:
                 f.write("bet history:\n")
                 f.write("-" * 50 + "\n")
+                from utils import format_bet_description
                 for i, h in enumerate(history, 1):
-                    bet_info = h['bet']
-                    bet_desc = f"{bet_info.bet_type}"
-                    if bet_info.value is not None:
-                        bet_desc += f" ({bet_info.value})"
-                    bet_desc += f" - ${bet_info.amount}"
+                    bet_desc = format_bet_description(h['bet'])
                     result = "won" if h['won'] else "lost"
                     f.write(f"{i}. {bet_desc} -> {result} (landed on {h['winning_number']}, payout: ${h['payout']})\n")
         
@@ -184,3 +446,130 @@ def export_statistics(player, filename="statistics.txt"):
     except Exception as e:
         print(f"error exporting statistics: {str(e)}")
         return False
+
+def _csv_field(value):
+    """Format one CSV field, quoting it only when needed."""
+    if value is None:
+        return ""
+    if isinstance(value, (tuple, list)):
+        value = "-".join(str(v) for v in value)
+    text = str(value)
+    if any(c in text for c in ',"\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+class StatisticsExporter:
+    """Stream bet history to CSV or JSONL in buffered chunks.
+
+    The first ``write`` creates the file: a header line and the rows for
+    CSV, or a ``summary`` line built from ``Player.get_statistics()`` and
+    the rows for JSONL. Later calls append only the bets recorded since
+    the previous call, followed in JSONL by an updated summary line, so a
+    session can export incrementally and the last summary in the file is
+    current. Rows are formatted straight from the history columns
+    ``EXPORT_CHUNK_ROWS`` at a time, keeping memory constant.
+    """
+
+    def __init__(self, filename, fmt="csv", buffer_size=EXPORT_BUFFER_SIZE):
+        if fmt not in ("csv", "jsonl"):
+            raise ValueError(f"unsupported export format: {fmt}")
+        self.filename = filename
+        self.fmt = fmt
+        self.buffer_size = buffer_size
+        self.exported = None
+        self._history = None
+        self._encoded_keys = {}
+    
+    def _summary(self, player):
+        stats = player.get_statistics()
+        summary = {
+            'starting_balance': player.initial_balance,
+            'ending_balance': player.get_balance(),
+            'profit': stats['profit'],
+            'total_bets': stats['total_bets'],
+            'wins': stats['wins'],
+            'losses': stats['losses'],
+            'win_rate': round(stats['win_rate'], 1)
+        }
+        return json.dumps({'type': 'summary', **summary}, separators=(',', ':')) + "\n"
+    
+    def _header(self, player):
+        if self.fmt == "jsonl":
+            return self._summary(player)
+        return ",".join(EXPORT_FIELDS) + "\n"
+    
+    def _encoded_key(self, history, code):
+        encoded = self._encoded_keys.get(code)
+        if encoded is None:
+            bet_type, value = history.bet_key(code)
+            if self.fmt == "jsonl":
+                encoded_value = json.dumps(value, separators=(',', ':'))
+                encoded = f'"bet_type":{json.dumps(bet_type)},"value":{encoded_value}'
+            else:
+                encoded = f"{_csv_field(bet_type)},{_csv_field(value)}"
+            self._encoded_keys[code] = encoded
+        return encoded
+    
+    def _format_chunk(self, history, start, end):
+        rows = zip(range(start + 1, end + 1), *history.columns(start, end))
+        if self.fmt == "jsonl":
+            return "".join(
+                f'{{"type":"bet","index":{i},{self._encoded_key(history, code)},"amount":{amount},'
+                f'"winning_number":{number},"won":{"true" if won else "false"},"payout":{payout}}}\n'
+                for i, code, amount, number, won, payout in rows
+            )
+        return "".join(
+            f"{i},{self._encoded_key(history, code)},{amount},{number},{won},{payout}\n"
+            for i, code, amount, number, won, payout in rows
+        )
+    
+    def write(self, player):
+        """Write the bets recorded since the last call; return rows written.
+
+        The file is rewritten from scratch instead when it was removed or
+        the player's history was replaced, e.g. by loading a saved game.
+        """
+        history = player.get_bet_history()
+        if history is not self._history or not os.path.exists(self.filename):
+            self.exported = None
+            self._history = history
+        if self.exported is None:
+            mode = 'w'
+            start = 0
+        else:
+            mode = 'a'
+            start = self.exported
+        
+        with open(self.filename, mode, buffering=self.buffer_size) as f:
+            if mode == 'w':
+                f.write(self._header(player))
+            end = len(history)
+            for chunk_start in range(start, end, EXPORT_CHUNK_ROWS):
+                chunk_end = min(chunk_start + EXPORT_CHUNK_ROWS, end)
+                f.write(self._format_chunk(history, chunk_start, chunk_end))
+            if mode == 'a' and self.fmt == "jsonl":
+                f.write(self._summary(player))
+        
+        self.exported = end
+        return end - start
+
+def export_history(player, filename, fmt=None, exporters=None):
+    """Export statistics and history as CSV or JSONL, inferring the format.
+
+    ``exporters`` maps filenames to the ``StatisticsExporter`` a session
+    already used for them, so exporting to the same file again appends
+    only the bets recorded since the previous export.
+    """
+    if fmt is None:
+        fmt = "jsonl" if filename.endswith(".jsonl") else "csv"
+    try:
+        exporter = exporters.get(filename) if exporters is not None else None
+        if exporter is None or exporter.fmt != fmt:
+            exporter = StatisticsExporter(filename, fmt)
+            if exporters is not None:
+                exporters[filename] = exporter
+        exporter.write(player)
+        return True
+    except Exception as e:
+        print(f"error exporting statistics: {str(e)}")
+        return False
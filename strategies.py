@@ -1,8 +1,11 @@
 from config import MINIMUM_BET
 
-def _read_base_amount():
+FIBONACCI_LENGTH = 12
+CONSERVATIVE_LOSS_THRESHOLD = 3
+
+def _read_base_amount(ask=input):
     """Read a strategy base amount and clamp it to the table minimum."""
-    base = input(f"enter base amount (default ${MINIMUM_BET}): ").strip()
+    base = ask(f"enter base amount (default ${MINIMUM_BET}): ").strip()
     try:
         base_amount = int(base) if base else MINIMUM_BET
     except ValueError:
@@ -42,11 +45,16 @@ class MartingaleStrategy(BettingStrategy):
         self.current_amount = self.base_amount * (2 ** self.consecutive_losses)
 
 class FibonacciStrategy(BettingStrategy):
-    """Advance through the Fibonacci sequence after losses."""
+    """Advance through the first ``length`` Fibonacci numbers after losses."""
 
-    def __init__(self, base_amount=MINIMUM_BET):
+    def __init__(self, base_amount=MINIMUM_BET, length=FIBONACCI_LENGTH):
         super().__init__("fibonacci", base_amount)
-        self.fib_sequence = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144]
+        if length < 1:
+            raise ValueError("fibonacci length must be at least 1")
+        self.fib_sequence = [1, 1]
+        while len(self.fib_sequence) < length:
+            self.fib_sequence.append(self.fib_sequence[-1] + self.fib_sequence[-2])
+        del self.fib_sequence[length:]
         self.fib_index = 0
     
     def get_bet_amount(self):
@@ -63,14 +71,17 @@ class FibonacciStrategy(BettingStrategy):
         self.fib_index = min(len(self.fib_sequence) - 1, self.fib_index + 1)
 
 class ConservativeStrategy(BettingStrategy):
-    """Reduce risk after several consecutive losses."""
+    """Halve the bet once ``loss_threshold`` consecutive losses are reached."""
 
-    def __init__(self, base_amount=MINIMUM_BET):
+    def __init__(self, base_amount=MINIMUM_BET, loss_threshold=CONSERVATIVE_LOSS_THRESHOLD):
         super().__init__("conservative", base_amount)
+        if loss_threshold < 1:
+            raise ValueError("loss threshold must be at least 1")
+        self.loss_threshold = loss_threshold
     
     def on_loss(self):
         super().on_loss()
-        if self.consecutive_losses >= 3:
+        if self.consecutive_losses >= self.loss_threshold:
             self.current_amount = max(MINIMUM_BET, self.current_amount // 2)
         else:
             self.current_amount = self.base_amount
@@ -89,7 +100,36 @@ class DAlembertStrategy(BettingStrategy):
         super().on_loss()
         self.current_amount = self.current_amount + self.base_amount
 
-def get_strategy_from_user():
+class FlatStrategy(BettingStrategy):
+    """Bet the same base amount on every spin."""
+
+    def __init__(self, base_amount=MINIMUM_BET):
+        super().__init__("flat", base_amount)
+
+STRATEGIES = {
+    'flat': FlatStrategy,
+    'martingale': MartingaleStrategy,
+    'fibonacci': FibonacciStrategy,
+    'conservative': ConservativeStrategy,
+    'dalembert': DAlembertStrategy
+}
+
+def create_strategy(name, base_amount=MINIMUM_BET, **options):
+    """Build a strategy from its registry name.
+
+    ``options`` are passed to strategies that take extra parameters, such
+    as ``length`` for fibonacci and ``loss_threshold`` for conservative.
+    """
+    try:
+        strategy_class = STRATEGIES[name]
+    except KeyError:
+        raise ValueError(f"unknown strategy: {name}") from None
+    try:
+        return strategy_class(base_amount, **options)
+    except TypeError:
+        raise ValueError(f"{name} does not take {', '.join(options)}") from None
+
+def get_strategy_from_user(ask=input):
     """Prompt the player for a betting strategy and base amount."""
     print("\nbetting strategies:")
     print("1. martingale (double bet after loss)")
@@ -98,14 +138,14 @@ def get_strategy_from_user():
     print("4. d'alembert (increase by base on loss, decrease on win)")
     print("5. none (manual betting)")
     
-    choice = input("select strategy (1-5): ").strip()
+    choice = ask("select strategy (1-5): ").strip()
     
     if choice == "1":
-        return MartingaleStrategy(_read_base_amount())
+        return MartingaleStrategy(_read_base_amount(ask))
     if choice == "2":
-        return FibonacciStrategy(_read_base_amount())
+        return FibonacciStrategy(_read_base_amount(ask))
     if choice == "3":
-        return ConservativeStrategy(_read_base_amount())
+        return ConservativeStrategy(_read_base_amount(ask))
     if choice == "4":
-        return DAlembertStrategy(_read_base_amount())
+        return DAlembertStrategy(_read_base_amount(ask))
     return None
@@ -0,0 +1,101 @@
+"""Process-pool strategy tournament over bankroll and stake combinations."""
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+from config import MINIMUM_BET
+from sessions import run_session, session_seed
+from strategies import STRATEGIES
+
+DEFAULT_CHUNK_SIZE = 200
+
+def _play_chunk(task):
+    """Play one chunk of sessions and return their compact outcomes.
+
+    Every session is seeded from the tournament seed, its configuration and
+    its index, so results never depend on which worker plays the chunk.
+    """
+    strategy_name, bankroll, base_amount, spins, seed, start, stop = task
+    config_seed = f"{seed}:{strategy_name}:{bankroll}:{base_amount}"
+    outcomes = []
+    for index in range(start, stop):
+        result = run_session(
+            strategy_name,
+            bankroll=bankroll,
+            spins=spins,
+            seed=session_seed(config_seed, index),
+            base_amount=base_amount
+        )
+        outcomes.append((result['final_balance'], result['spins_survived'], result['ruined']))
+    return outcomes
+
+def _build_tasks(configs, sessions, spins, seed, chunk_size):
+    tasks = []
+    for strategy_name, bankroll, base_amount in configs:
+        for start in range(0, sessions, chunk_size):
+            stop = min(start + chunk_size, sessions)
+            tasks.append((strategy_name, bankroll, base_amount, spins, seed, start, stop))
+    return tasks
+
+def _summarize(strategy_name, bankroll, base_amount, outcomes):
+    finals = [final for final, _, _ in outcomes]
+    ruin_spins = [spins for _, spins, ruined in outcomes if ruined]
+    return {
+        'strategy': strategy_name,
+        'bankroll': bankroll,
+        'base_amount': base_amount,
+        'sessions': len(outcomes),
+        'ruin_probability': len(ruin_spins) / len(outcomes),
+        'median_final_balance': statistics.median(finals),
+        'expected_spins_to_ruin': statistics.fmean(ruin_spins) if ruin_spins else None
+    }
+
+def run_tournament(strategies=None, bankrolls=(1000,), base_amounts=(MINIMUM_BET,),
+                   sessions=1000, spins=1000, seed=0, workers=None,
+                   chunk_size=DEFAULT_CHUNK_SIZE):
+    """Play every strategy configuration and return rows ranked best first.
+
+    Rows are ranked by ruin probability, then by median final balance.
+    ``workers=1`` plays everything in-process.
+    """
+    if sessions < 1:
+        raise ValueError("sessions must be positive")
+    if strategies is None:
+        strategies = list(STRATEGIES)
+    configs = list(product(strategies, bankrolls, base_amounts))
+    tasks = _build_tasks(configs, sessions, spins, seed, chunk_size)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1:
+        chunk_results = map(_play_chunk, tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunk_results = list(executor.map(_play_chunk, tasks))
+
+    outcomes = {config: [] for config in configs}
+    for task, chunk in zip(tasks, chunk_results):
+        outcomes[task[:3]].extend(chunk)
+
+    rows = [_summarize(*config, outcomes[config]) for config in configs]
+    rows.sort(key=lambda row: (row['ruin_probability'], -row['median_final_balance']))
+    return rows
+
+def display_tournament(rows):
+    """Print a ranked tournament comparison table."""
+    from utils import display_separator, format_percentage
+
+    display_separator()
+    print("strategy tournament:")
+    display_separator()
+    print(f"{'#':<4}{'strategy':<14}{'bankroll':>10}{'base':>8}{'ruin':>9}{'median':>10}{'spins to ruin':>15}")
+    for i, row in enumerate(rows, 1):
+        spins_to_ruin = row['expected_spins_to_ruin']
+        spins_text = f"{spins_to_ruin:.1f}" if spins_to_ruin is not None else "-"
+        print(
+            f"{i:<4}{row['strategy']:<14}{row['bankroll']:>10}{row['base_amount']:>8}"
+            f"{format_percentage(row['ruin_probability'] * 100):>9}"
+            f"{row['median_final_balance']:>10}{spins_text:>15}"
+        )
+    display_separator()
@@ -5,8 +5,8 @@ def display_separator():
 def format_bet_description(bet):
     """Return a compact display string for a bet."""
     bet_desc = f"{bet.bet_type}"
-    if bet.bet_type == "dozen" and isinstance(bet.value, tuple):
-        bet_desc += f" ({bet.value[0]}-{bet.value[1]})"
+    if isinstance(bet.value, (tuple, list)):
+        bet_desc += f" ({'-'.join(str(n) for n in bet.value)})"
     elif bet.value is not None:
         bet_desc += f" ({bet.value})"
     bet_desc += f" - ${bet.amount}"